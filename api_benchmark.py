@@ -0,0 +1,193 @@
+# api_benchmark.py
+"""
+Load test for the local JSON API (api_server.py).
+
+Starts an ApiServer on a free local port with synthetic profiles in a temporary
+directory, then runs concurrent keep-alive clients against it over real sockets,
+standing in for dashboards and companion scripts. Each client picks a random profile
+and sends a mix of snapshot reads (status, quests, pets, shop) and actions (daily
+task toggles, punishments). Reports requests/sec, latency percentiles for reads and
+actions, the status codes seen and how many saves the actions cost. The clients share
+the server's event loop, so the numbers are a floor for what separate processes see.
+
+Usage:
+    python api_benchmark.py --clients 50 --requests 5000 --profiles 4 --write-fraction 0.2 --output api_bench.json
+"""
+import argparse
+import asyncio
+import collections
+import contextlib
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from api_server import ApiServer
+from game_manager import GameManager
+from profile_generator import build_profile
+
+READ_PATHS = ['status', 'quests', 'pets', 'shop']
+
+
+class SaveCounter:
+    """io_observer that counts save writes."""
+
+    def __init__(self):
+        self.saves = 0
+
+    def record(self, operation, path, **kwargs):
+        if operation == 'save_game':
+            self.saves += 1
+
+
+class Client:
+    """Minimal HTTP/1.1 keep-alive client."""
+
+    def __init__(self, port):
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, path, body=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection('127.0.0.1', self.port)
+        payload = json.dumps(body).encode('utf-8') if body is not None else b''
+        self.writer.write((f"{method} {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n"
+                           f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n").encode('latin-1')
+                          + payload)
+        await self.writer.drain()
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        status_line, *header_lines = head.decode('latin-1').split('\r\n')
+        headers = {key.strip().lower(): value.strip()
+                   for key, _, value in (line.partition(':') for line in header_lines if line)}
+        data = await self.reader.readexactly(int(headers.get('content-length', 0)))
+        if headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return int(status_line.split(' ')[1]), data
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            with contextlib.suppress(ConnectionError):
+                await self.writer.wait_closed()
+            self.writer = None
+
+
+def _percentiles(samples):
+    if not samples:
+        return {'count': 0}
+    ordered = sorted(samples)
+
+    def pick(fraction):
+        return round(ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))] * 1000, 3)
+
+    return {'count': len(ordered), 'p50_ms': round(statistics.median(ordered) * 1000, 3),
+            'p90_ms': pick(0.90), 'p99_ms': pick(0.99), 'max_ms': round(ordered[-1] * 1000, 3)}
+
+
+async def _client_loop(port, profiles, requests, write_fraction, rng, latencies, statuses, daily_tasks, punishment):
+    client = Client(port)
+    try:
+        for _ in range(requests):
+            prefix = f"/profiles/{rng.choice(profiles)}"
+            if rng.random() < write_fraction:
+                kind = 'action'
+                if rng.random() < 0.5:
+                    method, path, body = 'POST', f"{prefix}/daily-tasks/complete", \
+                        {'name': rng.choice(daily_tasks), 'complete': rng.random() < 0.5}
+                else:
+                    method, path, body = 'POST', f"{prefix}/punishments/apply", {'name': punishment}
+            else:
+                kind = 'read'
+                method, path, body = 'GET', f"{prefix}/{rng.choice(READ_PATHS)}", None
+            started = time.perf_counter()
+            status, _ = await client.request(method, path, body)
+            latencies[kind].append(time.perf_counter() - started)
+            statuses[status] += 1
+    finally:
+        await client.close()
+
+
+async def run_load(profiles_dir, profile_names, clients, requests, write_fraction, seed):
+    api = ApiServer(profiles_dir=profiles_dir, default_save_file=os.path.join(profiles_dir, 'default.json'))
+    await api.start('127.0.0.1', 0)
+    first = api.session(profile_names[0])
+    await first.read('status') # Load one profile up front for the daily task and punishment names
+    status = json.loads(first.views['status'])
+    daily_tasks = list(status['daily_tasks'])
+    punishment = json.loads(first.views['punishments'])[0]['name']
+    for name in profile_names[1:]:
+        await api.session(name).read('status')
+
+    latencies = {'read': [], 'action': []}
+    statuses = collections.Counter()
+    per_client = [requests // clients + (i < requests % clients) for i in range(clients)]
+    started = time.perf_counter()
+    await asyncio.gather(*(_client_loop(api.port, profile_names, count, write_fraction, random.Random(f"{seed}:{i}"),
+                                        latencies, statuses, daily_tasks, punishment)
+                           for i, count in enumerate(per_client)))
+    elapsed = time.perf_counter() - started
+    await api.close()
+    return latencies, statuses, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the local JSON API.")
+    parser.add_argument('--clients', type=int, default=50, help="Concurrent keep-alive connections.")
+    parser.add_argument('--requests', type=int, default=5000, help="Total requests across all clients.")
+    parser.add_argument('--profiles', type=int, default=4)
+    parser.add_argument('--write-fraction', type=float, default=0.2, help="Share of requests that are actions.")
+    parser.add_argument('--quests', type=int, default=200, help="Quests in each synthetic profile.")
+    parser.add_argument('--inventory', type=int, default=500, help="Inventory items in each synthetic profile.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='api_bench.json')
+    args = parser.parse_args(argv)
+
+    counter = SaveCounter()
+    profile_names = [f"bench{i}" for i in range(args.profiles)]
+    with tempfile.TemporaryDirectory() as temp_dir, open(os.devnull, 'w') as devnull, \
+            contextlib.redirect_stdout(devnull):
+        for i, name in enumerate(profile_names):
+            document = build_profile(quests=args.quests, inventory=args.inventory, seed=args.seed + i)
+            with open(os.path.join(temp_dir, f"{name}.json"), 'w') as f:
+                json.dump(document, f)
+        GameManager.io_observer = counter
+        try:
+            latencies, statuses, elapsed = asyncio.run(run_load(temp_dir, profile_names, args.clients, args.requests,
+                                                                args.write_fraction, args.seed))
+        finally:
+            GameManager.io_observer = None
+
+    completed = sum(statuses.values())
+    results = {
+        'settings': {'clients': args.clients, 'requests': args.requests, 'profiles': args.profiles,
+                     'write_fraction': args.write_fraction, 'quests': args.quests, 'inventory': args.inventory,
+                     'seed': args.seed},
+        'elapsed_seconds': round(elapsed, 3),
+        'requests_per_second': round(completed / elapsed, 1),
+        'latency': {'all': _percentiles(latencies['read'] + latencies['action']),
+                    'read': _percentiles(latencies['read']),
+                    'action': _percentiles(latencies['action'])},
+        'status_codes': {str(code): count for code, count in sorted(statuses.items())},
+        'saves': counter.saves,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=4)
+
+    print(f"{completed} requests from {args.clients} clients in {elapsed:.2f} s: "
+          f"{results['requests_per_second']:.0f} req/s")
+    print(f"  {'kind':<8}{'count':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for kind, row in results['latency'].items():
+        if row['count']:
+            print(f"  {kind:<8}{row['count']:>8}{row['p50_ms']:>10.2f}{row['p90_ms']:>10.2f}"
+                  f"{row['p99_ms']:>10.2f}{row['max_ms']:>10.2f}")
+    print(f"  Status codes: {results['status_codes']}; {len(latencies['action'])} actions cost {counter.saves} saves")
+    print(f"Results written to '{args.output}'.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,368 @@
+# api_server.py
+"""
+Local asyncio HTTP/JSON API for the game.
+
+Lets dashboards and companion scripts share one running game state instead of each
+loading and saving save_game.json on their own. Every profile gets a ProfileSession:
+its GameManager lives on the session's own worker thread, and actions are queued and
+applied there one at a time, so GameManager never sees two calls at once and the
+event loop never waits on it or on the disk. Actions already waiting when the worker
+frees up are applied together under GameManager.batched_saves(), so a burst of
+requests costs one save; each request is answered once the save holding its change
+is written.
+
+Reads never enter the queue. After each batch the worker re-encodes the views its
+changes touched (found through GameManager's change topics) and the loop serves those
+bytes as they are, streamed in chunks so a big quest list doesn't hold up other
+clients. A read older than API_SNAPSHOT_MAX_AGE first queues a refresh, so time-based
+state (arc, cooldowns) catches up.
+
+Routes (prefix with /profiles/<name> for a named profile, stored like cli.py --profile;
+without the prefix the default save file is used):
+    GET  /status  /quests  /shop  /pets  /punishments
+    POST /quests/complete       {"name": ..., "duration": minutes (optional)}
+    POST /daily-tasks/complete  {"name": ..., "complete": true}
+    POST /punishments/apply     {"name": ...}
+    POST /shop/purchase         {"cart": {"Coin Pouch": 2}}
+    POST /forge/<enchant|transcend|roll|sell>  {"item": ...}
+    POST /pets/<feed|play|pet>  {"name": ...}
+    POST /transcend
+Actions answer {"ok": true, "message": ..., "version": ...}, or 409 with "ok": false
+when the game refused them (not enough coins, a cooldown, ...).
+
+Usage:
+    python api_server.py --port 8765
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+import os
+import re
+import sys
+import time
+import traceback
+from urllib.parse import urlsplit
+
+import cli
+from cli import CommandError
+from config import API_HOST, API_PORT, API_SNAPSHOT_MAX_AGE, API_MAX_BATCH, PROFILES_DIR, SAVE_FILE
+from game_manager import GameManager
+
+DEFAULT_PROFILE = 'default' # Served without the /profiles/<name> prefix; uses SAVE_FILE
+PROFILE_NAME = re.compile(r'[A-Za-z0-9_-]{1,64}') # Keeps profile names inside the profiles directory
+MAX_BODY_BYTES = 1024 * 1024
+STREAM_CHUNK = 64 * 1024
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           409: 'Conflict', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+# Read views -> change topics that make them stale (None: any change). 'shop' is the fixed catalog.
+VIEW_TOPICS = {
+    'status': None,
+    'quests': {'quests'},
+    'pets': {'pets'},
+    'punishments': {'punishments'},
+    'shop': set(),
+}
+
+# Action route -> (cli action, fixed leading arguments, required body fields, optional body fields)
+ACTION_ROUTES = {
+    'quests/complete': (cli.complete_quest, (), ('name',), ('duration',)),
+    'daily-tasks/complete': (cli.daily_task, (), ('name',), ('complete',)),
+    'punishments/apply': (cli.punish, (), ('name',), ()),
+    'shop/purchase': (cli.buy, (), ('cart',), ()),
+    'transcend': (cli.transcend, (), (), ()),
+}
+ACTION_ROUTES.update({f'forge/{operation}': (cli.forge, (operation,), ('item',), ()) for operation in cli.FORGE_OPERATIONS})
+ACTION_ROUTES.update({f'pets/{action}': (cli.care_for_pet, (action,), ('name',), ()) for action in cli.PET_ACTIONS})
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _encode(data):
+    return json.dumps(data).encode('utf-8')
+
+
+def _pets_view(game_manager):
+    player = game_manager.player
+    owned = []
+    for name in player.pets:
+        data = game_manager.get_pet_data(name) or {}
+        owned.append({'name': name, 'level': data.get('Level'), 'xp': data.get('XP'),
+                      'xp_to_evolve': data.get('XP_to_Evolve'), 'benefit': data.get('BenefitDesc'),
+                      'pet_cooldown_until': player.pet_cooldowns.get(name),
+                      'play_cooldown_until': player.play_cooldowns.get(name)})
+    return {'pets': owned, 'pet_food': player.pet_food}
+
+
+VIEW_BUILDERS = {
+    'status': cli.status,
+    'quests': lambda game_manager: game_manager.player.quests,
+    'pets': _pets_view,
+    'punishments': lambda game_manager: game_manager.get_punishments(),
+    'shop': lambda game_manager: game_manager.get_shop_items(),
+}
+
+
+class ProfileSession:
+    """One profile's GameManager, the actions queued for it and the encoded read views."""
+
+    def __init__(self, name, save_file):
+        self.name = name
+        self.save_file = save_file
+        self.views = {} # View name -> encoded JSON; replaced on the loop after each batch
+        self.version = 0 # Batches applied so far
+        self.snapshot_time = None # time.monotonic() of the last full view refresh
+        self._queue = asyncio.Queue()
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'profile-{name}')
+        # Worker thread only
+        self._game_manager = None
+        self._changed = set()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, action=None, *args, **kwargs):
+        """Queues action(game_manager, *args, **kwargs); None just refreshes the views. Returns (outcome, message)."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((action, args, kwargs, future))
+        return await future
+
+    async def read(self, view):
+        if view not in self.views or time.monotonic() - self.snapshot_time > API_SNAPSHOT_MAX_AGE:
+            await self.submit()
+        if view not in self.views:
+            raise RequestError(500, f"Profile '{self.name}' could not be loaded.")
+        return self.views[view]
+
+    async def close(self):
+        await self._queue.put(None)
+        await self._task
+        self._executor.shutdown(wait=True)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            if job is None:
+                return
+            jobs = [job]
+            while len(jobs) < API_MAX_BATCH and not self._queue.empty():
+                job = self._queue.get_nowait()
+                if job is None: # Finish this batch, then stop
+                    self._queue.put_nowait(None)
+                    break
+                jobs.append(job)
+            calls = [(action, args, kwargs) for action, args, kwargs, _ in jobs]
+            try:
+                results, views, full = await loop.run_in_executor(self._executor, self._apply, calls)
+            except Exception as e:
+                print(f"ERROR: Profile '{self.name}' could not be loaded:\n{traceback.format_exc()}", file=sys.stderr)
+                results, views, full = [('error', str(e))] * len(jobs), {}, False
+            self.views.update(views)
+            if views:
+                self.version += 1
+            if full:
+                self.snapshot_time = time.monotonic()
+            for (_, _, _, future), result in zip(jobs, results):
+                if not future.done(): # The client may have gone away
+                    future.set_result(result)
+
+    def _apply(self, calls):
+        """Worker thread: runs the calls under one save and re-encodes the views they touched."""
+        full = self._game_manager is None or time.monotonic() - (self.snapshot_time or 0) > API_SNAPSHOT_MAX_AGE
+        if self._game_manager is None:
+            os.makedirs(os.path.dirname(self.save_file) or '.', exist_ok=True)
+            self._game_manager = GameManager(save_file=self.save_file)
+            self._game_manager.add_change_listener(self._changed.update)
+        game_manager = self._game_manager
+        results = []
+        try:
+            with game_manager.batched_saves():
+                for action, args, kwargs in calls:
+                    if action is None:
+                        results.append(('ok', None))
+                        continue
+                    try:
+                        results.append(('ok', action(game_manager, *args, **kwargs)))
+                    except CommandError as e:
+                        results.append(('rejected', str(e)))
+                    except Exception as e:
+                        print(f"ERROR: {action.__name__} failed for profile '{self.name}':\n{traceback.format_exc()}",
+                              file=sys.stderr)
+                        results.append(('error', f"{action.__name__} failed: {e}"))
+        except Exception as e: # The save at the end of the batch
+            print(f"ERROR: Saving profile '{self.name}' failed: {e}", file=sys.stderr)
+            results = [('error', f"Saving failed: {e}")] * len(calls)
+
+        changed = set(self._changed)
+        self._changed.clear()
+        views = {}
+        for view, topics in VIEW_TOPICS.items():
+            if full or (changed and (topics is None or topics & changed)):
+                views[view] = _encode(VIEW_BUILDERS[view](game_manager))
+        return results, views, full
+
+
+class ApiServer:
+    def __init__(self, profiles_dir=PROFILES_DIR, default_save_file=SAVE_FILE):
+        self.profiles_dir = profiles_dir
+        self.default_save_file = default_save_file
+        self.sessions = {}
+        self.server = None
+
+    async def start(self, host=API_HOST, port=API_PORT):
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server
+
+    @property
+    def port(self):
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for session in self.sessions.values():
+            await session.close()
+        self.sessions.clear()
+
+    def session(self, name):
+        if name not in self.sessions:
+            if name == DEFAULT_PROFILE:
+                save_file = self.default_save_file
+            else:
+                save_file = os.path.join(self.profiles_dir, f"{name}.json")
+            self.sessions[name] = ProfileSession(name, save_file)
+        return self.sessions[name]
+
+    async def dispatch(self, method, target, body):
+        """Returns (status, encoded JSON body) for one request."""
+        parts = [part for part in urlsplit(target).path.split('/') if part]
+        profile = DEFAULT_PROFILE
+        if parts[:1] == ['profiles']:
+            if len(parts) < 2 or not PROFILE_NAME.fullmatch(parts[1]):
+                raise RequestError(404, "Unknown profile; names may use letters, digits, '-' and '_'.")
+            profile, parts = parts[1], parts[2:]
+        route = '/'.join(parts)
+
+        if route in VIEW_TOPICS:
+            if method != 'GET':
+                raise RequestError(405, f"/{route} only supports GET.")
+            return 200, await self.session(profile).read(route)
+        if route not in ACTION_ROUTES:
+            raise RequestError(404, f"No route /{route}.")
+        if method != 'POST':
+            raise RequestError(405, f"/{route} only supports POST.")
+
+        action, fixed, required, optional = ACTION_ROUTES[route]
+        try:
+            fields = json.loads(body) if body.strip() else {}
+        except ValueError as e:
+            raise RequestError(400, f"Body is not valid JSON: {e}")
+        if not isinstance(fields, dict):
+            raise RequestError(400, "Body must be a JSON object.")
+        missing = [name for name in required if name not in fields]
+        if missing:
+            raise RequestError(400, f"Missing field(s): {', '.join(missing)}")
+        args = fixed + tuple(fields[name] for name in required)
+        kwargs = {name: fields[name] for name in optional if name in fields}
+
+        session = self.session(profile)
+        outcome, message = await session.submit(action, *args, **kwargs)
+        if outcome == 'error':
+            raise RequestError(500, message)
+        status = 200 if outcome == 'ok' else 409
+        return status, _encode({'ok': outcome == 'ok', 'message': message, 'version': session.version})
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                keep_alive = False
+                try:
+                    request_line, *header_lines = head.decode('latin-1').split('\r\n')
+                    method, target, version = request_line.split(' ', 2)
+                    headers = {}
+                    for line in header_lines:
+                        if line:
+                            key, _, value = line.partition(':')
+                            headers[key.strip().lower()] = value.strip()
+                    connection = headers.get('connection', '').lower()
+                    keep_alive = connection == 'keep-alive' or (version == 'HTTP/1.1' and connection != 'close')
+                    length = int(headers.get('content-length') or 0)
+                    if length > MAX_BODY_BYTES:
+                        keep_alive = False # The unread body would be taken for the next request
+                        raise RequestError(413, f"Bodies are limited to {MAX_BODY_BYTES} bytes.")
+                    body = await reader.readexactly(length) if length else b''
+                    status, payload = await self.dispatch(method, target, body)
+                except RequestError as e:
+                    status, payload = e.status, _encode({'ok': False, 'error': str(e)})
+                except asyncio.IncompleteReadError:
+                    return
+                except ValueError:
+                    keep_alive = False
+                    status, payload = 400, _encode({'ok': False, 'error': "Malformed request."})
+                except Exception as e:
+                    print(f"ERROR: Request failed:\n{traceback.format_exc()}", file=sys.stderr)
+                    status, payload = 500, _encode({'ok': False, 'error': str(e)})
+                await self._send(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _send(self, writer, status, payload, keep_alive):
+        """Writes the response, draining between chunks so large views don't pile up in the buffer."""
+        writer.write((f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                      "Content-Type: application/json\r\n"
+                      f"Content-Length: {len(payload)}\r\n"
+                      f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode('latin-1'))
+        view = memoryview(payload)
+        for start in range(0, len(view), STREAM_CHUNK):
+            writer.write(view[start:start + STREAM_CHUNK])
+            await writer.drain()
+        if not view:
+            await writer.drain()
+
+
+async def serve(host, port, profiles_dir, default_save_file):
+    api = ApiServer(profiles_dir, default_save_file)
+    await api.start(host, port)
+    print(f"INFO: Serving the game API on http://{host}:{api.port}", file=sys.stderr)
+    try:
+        await asyncio.Event().wait() # Until interrupted
+    finally:
+        await api.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the game as a local JSON API.")
+    parser.add_argument('--host', default=API_HOST)
+    parser.add_argument('--port', type=int, default=API_PORT)
+    parser.add_argument('--profiles-dir', default=PROFILES_DIR, help="Where /profiles/<name> saves are kept.")
+    parser.add_argument('--save-file', default=SAVE_FILE, help="Save file of the default profile.")
+    parser.add_argument('--verbose', action='store_true', help="Show the game's own log output on stderr.")
+    args = parser.parse_args(argv)
+    # GameManager prints from several worker threads, so stdout is redirected once for the whole run
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(sys.stderr if args.verbose else devnull):
+        try:
+            asyncio.run(serve(args.host, args.port, args.profiles_dir, args.save_file))
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,212 @@
+# benchmarks.py
+"""
+Standalone benchmark suite for the GameManager hot paths.
+
+Every benchmark runs against a set of player profiles, from today's sample
+save_game.json up to 10k quests and 50k inventory items, and the results are
+written as machine-readable JSON. A previous result file can be passed as a
+baseline; any benchmark whose median grows past the regression threshold is
+reported and makes the run exit with a non-zero status.
+
+Usage:
+    python benchmarks.py --output bench_results.json
+    python benchmarks.py --profiles current medium --baseline bench_baseline.json --threshold 1.25
+    python benchmarks.py --save-baseline bench_baseline.json
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from game_manager import GameManager
+from profile_generator import build_profile
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_SAVE = os.path.join(BASE_DIR, 'save_game.json')
+
+# name -> (quest count, inventory count, default iterations). 'current' uses the sample save as-is.
+PROFILES = {
+    'current': (None, None, 50),
+    'medium': (1000, 5000, 10),
+    'extreme': (10000, 50000, 3),
+}
+
+DEFAULT_THRESHOLD = 1.25 # A benchmark regresses when its median is 25% slower than the baseline
+
+# Large quantities of cheap items, plus a few of the items that trigger a save per unit
+LARGE_CART = {
+    'Coin Pouch': 1000,
+    'Pet Food': 1000,
+    'Small XP Boost': 500,
+    'Skill Tome (Strength)': 250,
+    'Gear Fragment Pouch': 5,
+    'Master Key': 3,
+}
+
+
+def _load_profile_document(profile_name):
+    quest_count, inventory_count, _ = PROFILES[profile_name]
+    if quest_count is None:
+        with open(SAMPLE_SAVE, 'r') as f:
+            document = json.load(f)
+        # Keep the daily reset and overdue checks from rewriting the profile during setup
+        document['last_daily_reset_date'] = datetime.date.today().isoformat()
+        document['corruption'] = 0
+        return document
+    return build_profile(quests=quest_count, inventory=inventory_count)
+
+
+# --- Benchmarks ---
+# Each benchmark is (setup, run). setup(game_manager) prepares state before every
+# iteration and is not timed; its return value is passed to run(game_manager, arg).
+
+def _rich(game_manager):
+    game_manager.player.coins = 10 ** 9
+    game_manager.player.corruption = 0
+
+
+def _setup_complete_quest(game_manager):
+    _rich(game_manager)
+    if not game_manager.player.quests:
+        game_manager.generate_side_quest()
+    return game_manager.player.quests[-1]['name']
+
+
+def _setup_gear_item(game_manager):
+    _rich(game_manager)
+    if not game_manager.player.inventory:
+        game_manager._add_random_gear_to_inventory()
+    return game_manager.player.inventory[-1]['name']
+
+
+def _setup_daily_reset(game_manager):
+    yesterday = datetime.date.today() - datetime.timedelta(days=1)
+    game_manager.player.last_daily_reset_date = yesterday.isoformat()
+
+
+BENCHMARKS = {
+    'add_xp': (_rich, lambda gm, _: gm.add_xp(10)),
+    'add_coins': (_rich, lambda gm, _: gm.add_coins(10)),
+    'complete_quest': (_setup_complete_quest, lambda gm, name: gm.complete_quest(name)),
+    'purchase_cart_large': (_rich, lambda gm, _: gm.purchase_cart(dict(LARGE_CART))),
+    'check_achievements': (_rich, lambda gm, _: gm.check_achievements()),
+    'enchant_gear': (_setup_gear_item, lambda gm, name: gm.enchant_gear(name)),
+    'sell_gear': (_setup_gear_item, lambda gm, name: gm.sell_gear(name)),
+    'check_overdue_quests': (None, lambda gm, _: gm.check_overdue_quests()),
+    'check_and_reset_daily_tasks': (_setup_daily_reset, lambda gm, _: gm._check_and_reset_daily_tasks()),
+    'save_game': (None, lambda gm, _: gm.save_game()),
+    'load_game': (None, lambda gm, _: gm._load_game()),
+}
+
+
+def _summarize(samples):
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        'iterations': len(ordered),
+        'min_ms': round(ordered[0] * 1000, 4),
+        'median_ms': round(statistics.median(ordered) * 1000, 4),
+        'mean_ms': round(statistics.fmean(ordered) * 1000, 4),
+        'p95_ms': round(ordered[p95_index] * 1000, 4),
+        'max_ms': round(ordered[-1] * 1000, 4),
+    }
+
+
+def run_benchmark(profile_document, name, iterations, seed=0):
+    """Runs one benchmark on a fresh GameManager loaded from the profile document."""
+    setup, run = BENCHMARKS[name]
+    with tempfile.TemporaryDirectory() as temp_dir, open(os.devnull, 'w') as devnull, \
+            contextlib.redirect_stdout(devnull):
+        save_path = os.path.join(temp_dir, 'save_game.json')
+        with open(save_path, 'w') as f:
+            json.dump(profile_document, f)
+        game_manager = GameManager(save_file=save_path)
+        random.seed(seed)
+        samples = []
+        for _ in range(iterations):
+            arg = setup(game_manager) if setup else None
+            started = time.perf_counter()
+            run(game_manager, arg)
+            samples.append(time.perf_counter() - started)
+    return _summarize(samples)
+
+
+def run_suite(profile_names, benchmark_names, iterations=None):
+    results = {}
+    for profile_name in profile_names:
+        document = _load_profile_document(profile_name)
+        profile_iterations = iterations or PROFILES[profile_name][2]
+        for name in benchmark_names:
+            key = f"{profile_name}/{name}"
+            results[key] = run_benchmark(document, name, profile_iterations)
+            print(f"{key:<45} median {results[key]['median_ms']:>12.3f} ms   p95 {results[key]['p95_ms']:>12.3f} ms")
+    return results
+
+
+def compare_to_baseline(results, baseline, threshold=None):
+    """
+    Returns a list of (key, baseline median, current median, ratio, threshold) for every regression.
+    Each entry's own threshold wins, then the explicit threshold, then the baseline file's, then DEFAULT_THRESHOLD.
+    """
+    fallback = threshold if threshold is not None else baseline.get('threshold', DEFAULT_THRESHOLD)
+    regressions = []
+    for key, current in results.items():
+        reference = baseline.get('results', {}).get(key)
+        if not reference or not reference.get('median_ms'):
+            continue
+        limit = reference.get('threshold', fallback)
+        ratio = current['median_ms'] / reference['median_ms']
+        if ratio > limit:
+            regressions.append((key, reference['median_ms'], current['median_ms'], ratio, limit))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the GameManager hot paths.")
+    parser.add_argument('--profiles', nargs='+', choices=list(PROFILES), default=list(PROFILES))
+    parser.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument('--iterations', type=int, default=None, help="Override the per-profile iteration count.")
+    parser.add_argument('--output', default='bench_results.json', help="Where to write the results JSON.")
+    parser.add_argument('--baseline', help="Results file to compare against.")
+    parser.add_argument('--threshold', type=float, default=None,
+                        help="Allowed median slowdown ratio before a benchmark counts as a regression "
+                             f"(default: the baseline file's, else {DEFAULT_THRESHOLD}).")
+    parser.add_argument('--save-baseline', help="Also write the results to this file for future comparisons.")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.profiles, args.benchmarks, args.iterations)
+    document = {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'threshold': args.threshold if args.threshold is not None else DEFAULT_THRESHOLD,
+        'results': results,
+    }
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, 'w') as f:
+            json.dump(document, f, indent=4)
+    print(f"Results written to '{args.output}'.")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        for key, before, after, ratio, threshold in regressions:
+            print(f"REGRESSION: {key} {before:.3f} ms -> {after:.3f} ms ({ratio:.2f}x, threshold {threshold:.2f}x)")
+        if regressions:
+            return 1
+        print("No regressions against the baseline.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
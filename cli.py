@@ -0,0 +1,298 @@
+# cli.py
+"""
+Headless command-line interface to the game.
+
+Drives GameManager directly, without Qt or matplotlib, so the game can be scripted
+from cron, a shell or a habit tracker. Each subcommand runs one action, prints its
+result and saves; `status` prints the player's state as JSON. GameManager's own
+prints (load dumps, "Game saved.") are hidden unless --verbose is given.
+
+Usage:
+    python cli.py status
+    python cli.py --profile work complete-quest "Morning Run" --duration 25
+    python cli.py daily-task "Make your bed"
+    python cli.py buy "Coin Pouch" --quantity 2
+    python cli.py forge enchant "Helmet of Wisdom"
+    python cli.py pet feed Dragonling
+    python cli.py batch actions.txt    # One command per line, '#' comments; '-' reads stdin
+
+A batch runs every line against one loaded game and writes the save once at the end.
+Exits with 1 if any action failed and 2 on usage errors.
+"""
+import argparse
+import contextlib
+import json
+import os
+import shlex
+import sys
+
+from config import PROFILES_DIR, SAVE_FILE
+from game_manager import GameManager
+
+FORGE_OPERATIONS = {
+    'enchant': 'enchant_gear',
+    'transcend': 'transcend_gear',
+    'roll': 'roll_extra_effect',
+    'sell': 'sell_gear',
+}
+PET_ACTIONS = {
+    'feed': 'feed_pet',
+    'play': 'play_with_pet',
+    'pet': 'pet_a_pet',
+}
+
+
+class CommandError(Exception):
+    """A command that could not be carried out; its message is printed instead of a result."""
+
+
+def resolve_save_file(profile=None, save_file=None):
+    if save_file:
+        return save_file
+    if profile:
+        return os.path.join(PROFILES_DIR, f"{profile}.json")
+    return SAVE_FILE
+
+
+def status(game_manager):
+    """The player's state as a JSON-friendly dict."""
+    player = game_manager.player
+    arc = game_manager.get_current_arc_info()
+    return {
+        'level': game_manager.get_current_level_name(),
+        'xp': player.xp,
+        'xp_to_next_level': game_manager.get_xp_for_next_level(),
+        'coins': player.coins,
+        'title': game_manager.get_full_player_title(),
+        'punishment_sum': player.punishment_sum,
+        'corruption': game_manager.get_effective_corruption(),
+        'sanity': player.sanity,
+        'daily_streak': player.daily_streak,
+        'daily_tasks_completed': player.daily_tasks_completed,
+        'daily_tasks': {task: bool(player.daily_tasks.get(task)) for task in game_manager.daily_task_templates},
+        'quests': [{'name': q['name'], 'type': q.get('quest_type', 'main'), 'due_date': q.get('due_date'),
+                    'xp_reward': q.get('xp_reward'), 'coin_reward': q.get('coin_reward')}
+                   for q in player.quests],
+        'skills': {name: data.get('xp', 0) for name, data in player.skills.items()},
+        'pets': list(player.pets),
+        'pet_food': player.pet_food,
+        'gear': {slot: item['name'] if item else None for slot, item in player.gear.items()},
+        'inventory': [item['name'] for item in player.inventory],
+        'achievements': list(player.achievements),
+        'transcendence_count': player.transcendence_count,
+        'transcend_requirement': game_manager.get_transcend_requirement(),
+        'arc': {'name': arc['name'], 'ends': arc.get('end_date')},
+    }
+
+
+# Game actions. Each checks its input, runs one GameManager action and returns its message,
+# or raises CommandError when the action could not be carried out. api_server.py uses them too.
+
+def complete_quest(game_manager, name, duration=None):
+    if duration is not None and (not isinstance(duration, (int, float)) or duration < 0):
+        raise CommandError("Duration must be a non-negative number of minutes.")
+    if not any(q['name'] == name for q in game_manager.player.quests):
+        raise CommandError(f"Quest '{name}' not found or already completed.")
+    return game_manager.complete_quest(name, completed_duration=duration)
+
+
+def daily_task(game_manager, name, complete=True):
+    if name not in game_manager.daily_task_templates:
+        raise CommandError(f"Unknown daily task '{name}'. Daily tasks: {', '.join(game_manager.daily_task_templates)}")
+    return game_manager.complete_daily_task(name, complete) or f"'{name}' was already in that state."
+
+
+def punish(game_manager, name):
+    if not any(p['name'] == name for p in game_manager.punishments_data):
+        raise CommandError(f"Unknown punishment '{name}'.")
+    return game_manager.apply_punishment(name)
+
+
+def buy(game_manager, cart):
+    """cart maps shop item names to quantities."""
+    for item_name, quantity in cart.items():
+        if not isinstance(quantity, int) or quantity < 1:
+            raise CommandError(f"Quantity for '{item_name}' must be a whole number of at least 1.")
+        if not any(item['name'] == item_name for item in game_manager.get_shop_items()):
+            raise CommandError(f"The shop has no item called '{item_name}'.")
+    success, message = game_manager.purchase_cart(cart)
+    if not success:
+        raise CommandError(message)
+    return message
+
+
+def forge(game_manager, operation, item):
+    if operation not in FORGE_OPERATIONS:
+        raise CommandError(f"Unknown forge operation '{operation}'. Operations: {', '.join(FORGE_OPERATIONS)}")
+    message = getattr(game_manager, FORGE_OPERATIONS[operation])(item)
+    if not message.startswith("Successfully"): # The forge methods report every failure as a plain message
+        raise CommandError(message)
+    return message
+
+
+def care_for_pet(game_manager, action, name):
+    if action not in PET_ACTIONS:
+        raise CommandError(f"Unknown pet action '{action}'. Actions: {', '.join(PET_ACTIONS)}")
+    if name not in game_manager.player.pets:
+        raise CommandError(f"You don't have a pet called '{name}'.")
+    changed = set()
+    game_manager.add_change_listener(changed.update)
+    try:
+        message = getattr(game_manager, PET_ACTIONS[action])(name)
+    finally:
+        game_manager.remove_change_listener(changed.update)
+    if 'pets' not in changed: # Cooldowns and missing pet food leave the pet untouched
+        raise CommandError(message)
+    return message
+
+
+def transcend(game_manager):
+    required = game_manager.get_transcend_requirement()
+    if game_manager.player.xp < required:
+        raise CommandError(f"Transcending needs {required} XP; you have {game_manager.player.xp}.")
+    return game_manager.transcend()
+
+
+def _status(game_manager, args, out):
+    return json.dumps(status(game_manager), indent=None if args.compact else 2)
+
+
+def _complete_quest(game_manager, args, out):
+    return complete_quest(game_manager, args.name, args.duration)
+
+
+def _daily_task(game_manager, args, out):
+    return daily_task(game_manager, args.name, not args.undo)
+
+
+def _punish(game_manager, args, out):
+    return punish(game_manager, args.name)
+
+
+def _buy(game_manager, args, out):
+    return buy(game_manager, {args.item: args.quantity})
+
+
+def _forge(game_manager, args, out):
+    return forge(game_manager, args.operation, args.item)
+
+
+def _pet(game_manager, args, out):
+    return care_for_pet(game_manager, args.action, args.name)
+
+
+def _transcend(game_manager, args, out):
+    if not args.yes:
+        raise CommandError("Transcending resets XP, coins and non-transcended gear. Pass --yes to confirm.")
+    return transcend(game_manager)
+
+
+def _batch(game_manager, args, out):
+    """Runs every command in the file against this game; the save is written once, after the last one."""
+    try:
+        stream = sys.stdin if args.file == '-' else open(args.file)
+    except OSError as e:
+        raise CommandError(f"Could not read batch file: {e}")
+    parser = build_parser(batch=True)
+    failures = 0
+    with stream, game_manager.batched_saves():
+        for line_number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                command = parser.parse_args(shlex.split(line))
+            except (ValueError, SystemExit):
+                print(f"ERROR: line {line_number}: could not parse '{line}'", file=sys.stderr)
+                failures += 1
+                continue
+            if not run_command(game_manager, command, out, prefix=f"line {line_number}: "):
+                failures += 1
+    if failures:
+        raise CommandError(f"{failures} batch command(s) failed.")
+    return None
+
+
+def _add_commands(subparsers, batch=False):
+    p = subparsers.add_parser('status', help="Print the player's state as JSON.")
+    p.add_argument('--compact', action='store_true', help="One-line JSON.")
+    p.set_defaults(handler=_status)
+
+    p = subparsers.add_parser('complete-quest', help="Complete an active quest.")
+    p.add_argument('name')
+    p.add_argument('--duration', type=int, help="Minutes done, for Endurance quests with a duration target.")
+    p.set_defaults(handler=_complete_quest)
+
+    p = subparsers.add_parser('daily-task', help="Check off one of today's daily tasks.")
+    p.add_argument('name')
+    p.add_argument('--undo', action='store_true', help="Uncheck the task instead.")
+    p.set_defaults(handler=_daily_task)
+
+    p = subparsers.add_parser('punish', help="Apply a punishment by habit name.")
+    p.add_argument('name')
+    p.set_defaults(handler=_punish)
+
+    p = subparsers.add_parser('buy', help="Buy a shop item.")
+    p.add_argument('item')
+    p.add_argument('--quantity', type=int, default=1)
+    p.set_defaults(handler=_buy)
+
+    p = subparsers.add_parser('forge', help="Enchant, transcend, roll an effect on or sell a gear item.")
+    p.add_argument('operation', choices=list(FORGE_OPERATIONS))
+    p.add_argument('item')
+    p.set_defaults(handler=_forge)
+
+    p = subparsers.add_parser('pet', help="Feed, play with or pet one of your pets.")
+    p.add_argument('action', choices=list(PET_ACTIONS))
+    p.add_argument('name')
+    p.set_defaults(handler=_pet)
+
+    p = subparsers.add_parser('transcend', help="Transcend, resetting progress for a permanent bonus.")
+    p.add_argument('--yes', action='store_true', help="Confirm the reset.")
+    p.set_defaults(handler=_transcend)
+
+    if not batch: # Batches don't nest
+        p = subparsers.add_parser('batch', help="Run one command per line from a file ('-' for stdin).")
+        p.add_argument('file')
+        p.set_defaults(handler=_batch)
+
+
+def build_parser(batch=False):
+    parser = argparse.ArgumentParser(prog='cli.py' if not batch else 'batch line',
+                                     description="Play the game from the command line.")
+    if not batch:
+        parser.add_argument('--profile', help=f"Use the save '{PROFILES_DIR}/<PROFILE>.json'.")
+        parser.add_argument('--save-file', help=f"Use this save file (default: '{SAVE_FILE}').")
+        parser.add_argument('--verbose', action='store_true', help="Show the game's own log output on stderr.")
+    _add_commands(parser.add_subparsers(dest='command', required=True), batch=batch)
+    return parser
+
+
+def run_command(game_manager, args, out, prefix=""):
+    """Runs one parsed command and prints its result to out. Returns False if it failed."""
+    try:
+        result = args.handler(game_manager, args, out)
+    except CommandError as e:
+        print(f"ERROR: {prefix}{e}", file=sys.stderr)
+        return False
+    if result:
+        print(f"{prefix}{result}", file=out)
+        out.flush()
+    return True
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    save_file = resolve_save_file(args.profile, args.save_file)
+    if args.profile and not args.save_file:
+        os.makedirs(PROFILES_DIR, exist_ok=True)
+    # Results go to the real stdout; GameManager's own prints go to stderr or nowhere
+    out = sys.stdout
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(sys.stderr if args.verbose else devnull):
+        game_manager = GameManager(save_file=save_file)
+        ok = run_command(game_manager, args, out)
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,6 +2,37 @@
 
 # Save file configuration
 SAVE_FILE = 'save_game.json'
+PROFILES_DIR = 'profiles' # Named profiles (cli.py --profile NAME, api_server.py /profiles/NAME) are PROFILES_DIR/NAME.json
+
+# Local JSON API (see api_server.py)
+API_HOST = '127.0.0.1'
+API_PORT = 8765
+API_SNAPSHOT_MAX_AGE = 5 # Seconds before a read refreshes its snapshot, so time-based state (arc, cooldowns) catches up
+API_MAX_BATCH = 100 # Queued actions applied together under one save
+
+# Metrics (see metrics.py; enabled with RPG_METRICS=1)
+METRICS_FILE = 'metrics.json'
+METRICS_DUMP_INTERVAL = 60 # Seconds between periodic dumps
+
+# Span tracing (see tracing.py; enabled with RPG_TRACE=1, dumped with Ctrl+Shift+T)
+TRACE_BUFFER_SIZE = 50000 # Most recent spans kept in memory
+TRACE_DIR = 'traces'
+
+# Event-loop stall watchdog (see stall_watchdog.py; enabled with RPG_WATCHDOG=1)
+WATCHDOG_ENABLED = False # Default when RPG_WATCHDOG is unset; its heartbeat wakes the GUI thread 10 times a second
+WATCHDOG_HEARTBEAT_MS = 100
+WATCHDOG_STALL_MS = 500 # A handler blocking the GUI thread longer than this gets its stack logged
+WATCHDOG_LOG = 'stall_log.txt'
+
+# Save I/O accounting (see io_accounting.py; enabled with RPG_IO_ACCOUNTING=1)
+IO_LOG_FILE = 'io_log.jsonl'
+
+# Memory snapshots (see memory_snapshots.py; Ctrl+Shift+M in game)
+MEMORY_DIR = 'memory'
+
+# cProfile capture (see cprofile_capture.py; Ctrl+Shift+P in game starts/stops it)
+CPROFILE_DIR = 'cprofile'
+CPROFILE_TOP_N = 40
 
 # Initial player stats
 INITIAL_XP = 0
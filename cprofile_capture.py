@@ -0,0 +1,109 @@
+# cprofile_capture.py
+"""
+Start/stop cProfile capture for the running game.
+
+ApplicationController toggles a ProfileCapture with Ctrl+Shift+P. Stopping writes a
+.pstats file (open it with pstats, snakeviz, etc.) and a text summary of the top
+functions by cumulative time to config.CPROFILE_DIR. Before Python 3.12 cProfile
+only sees the thread that enabled it, so with a GameActionExecutor a second profiler
+is enabled on its worker thread, where the GameManager actions run, and the two are
+merged on stop. That profiler is disabled by a job queued behind the pending actions,
+and the files are written when that job reports back, so stopping never blocks the
+GUI thread. From 3.12 cProfile uses sys.monitoring, which records every thread
+and allows only one active profiler per process, so the main one is enough.
+"""
+import cProfile
+import datetime
+import io
+import os
+import pstats
+import sys
+import time
+
+from config import CPROFILE_DIR, CPROFILE_TOP_N
+
+PER_THREAD_PROFILERS = sys.version_info < (3, 12) # 3.12+ profiles all threads and rejects a second profiler
+
+
+class ProfileCapture:
+    def __init__(self, directory=CPROFILE_DIR, top_n=CPROFILE_TOP_N, executor=None):
+        self.directory = directory
+        self.top_n = top_n
+        self.executor = executor
+        self.profiler = None
+        self.executor_profiler = None
+        self.started_at = None
+
+    @property
+    def running(self):
+        return self.profiler is not None
+
+    def start(self):
+        if self.running:
+            return
+        self.profiler = cProfile.Profile()
+        self.started_at = time.perf_counter()
+        self.profiler.enable()
+        if self.executor is not None and PER_THREAD_PROFILERS:
+            self.executor_profiler = cProfile.Profile()
+            self.executor.submit(self.executor_profiler.enable)
+
+    def stop(self, on_done=None, on_error=None):
+        """
+        Stops the capture. Once the files are written, on_done(pstats path, summary path) is called,
+        or on_error(OSError) if they couldn't be. With an executor profiler this happens on the GUI
+        thread after the actions queued before the stop have run; otherwise before stop() returns.
+        """
+        if not self.running:
+            return
+        self.profiler.disable()
+        profiler, self.profiler = self.profiler, None
+        executor_profiler, self.executor_profiler = self.executor_profiler, None
+        duration = time.perf_counter() - self.started_at
+
+        def finish(executor_profile):
+            self._finish(profiler, executor_profile, duration, on_done, on_error)
+
+        if executor_profiler is None:
+            finish(None)
+            return
+        # Disabled from its own thread, after the actions queued before it
+        self.executor.submit(executor_profiler.disable,
+                             on_done=lambda _: finish(executor_profiler),
+                             on_error=lambda _: finish(None))
+
+    def _finish(self, profiler, executor_profiler, duration, on_done, on_error):
+        try:
+            paths = self._write(profiler, executor_profiler, duration)
+        except OSError as e:
+            if on_error is None:
+                raise
+            on_error(e)
+            return
+        if on_done is not None:
+            on_done(*paths)
+
+    def _write(self, profiler, executor_profiler, duration):
+        """Writes the merged stats and their summary. Returns (pstats path, summary path)."""
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        stats_path = os.path.join(self.directory, f"profile_{stamp}.pstats")
+        summary_path = os.path.join(self.directory, f"profile_{stamp}.txt")
+
+        buffer = io.StringIO()
+        buffer.write(f"cProfile capture of {duration:.1f} s, top {self.top_n} by cumulative time\n\n")
+        stats = pstats.Stats(profiler, stream=buffer)
+        if executor_profiler is not None and executor_profiler.getstats():
+            stats.add(executor_profiler)
+        stats.dump_stats(stats_path)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+        with open(summary_path, 'w') as f:
+            f.write(buffer.getvalue())
+        return stats_path, summary_path
+
+    def toggle(self, on_done=None, on_error=None):
+        """Starts a capture, or stops the running one, passing the callbacks to stop()."""
+        if self.running:
+            self.stop(on_done, on_error)
+        else:
+            self.start()
@@ -0,0 +1,70 @@
+# deadline_scheduler.py
+"""
+One-timer scheduler for the GUI's time-driven updates.
+
+A job is a callable that does its update and returns the seconds until its display
+next changes, or None to sleep until run_now() is called for it (e.g. when a tab
+becomes visible). A single single-shot QTimer is armed to the earliest deadline,
+so the app only wakes when a label actually has to change instead of refreshing
+every time-based panel once a second.
+"""
+import math
+import time
+
+from PyQt5.QtCore import Qt, QObject, QTimer
+
+MAX_SLEEP = 3600 # Far deadlines are re-checked hourly, so a suspend or clock change can't leave them stale
+
+
+class DeadlineScheduler(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs = {} # name -> callable returning the next delay in seconds, or None
+        self._deadlines = {} # name -> time.monotonic() deadline
+        self.wakeups = 0 # Timer firings, for benchmarks
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer) # The clock should not visibly skip seconds
+        self._timer.timeout.connect(self._on_timeout)
+
+    def add(self, name, job):
+        """Registers a job and runs it right away."""
+        self._jobs[name] = job
+        self.run_now(name)
+
+    def run_now(self, *names):
+        """Runs the named jobs (every job if none are named) now and re-arms the timer."""
+        for name in names or list(self._jobs):
+            if name in self._jobs: # Panels may ask before the jobs are registered
+                self._run(name)
+        self._arm()
+
+    def stop(self):
+        self._timer.stop()
+        self._deadlines.clear()
+
+    def _run(self, name):
+        try:
+            delay = self._jobs[name]()
+        except Exception as e:
+            print(f"ERROR: Scheduled update '{name}' failed: {e}")
+            delay = None
+        if delay is None:
+            self._deadlines.pop(name, None)
+        else:
+            self._deadlines[name] = time.monotonic() + min(max(delay, 0.0), MAX_SLEEP)
+
+    def _arm(self):
+        if not self._deadlines:
+            self._timer.stop()
+            return
+        delay = min(self._deadlines.values()) - time.monotonic()
+        self._timer.start(max(0, math.ceil(delay * 1000)))
+
+    def _on_timeout(self):
+        self.wakeups += 1
+        now = time.monotonic()
+        for name, deadline in list(self._deadlines.items()):
+            if deadline <= now:
+                self._run(name)
+        self._arm()
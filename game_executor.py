@@ -0,0 +1,103 @@
+# game_executor.py
+"""
+Single-threaded executor for GameManager calls.
+
+GameGUI hands its GameManager actions to a GameActionExecutor instead of calling
+them directly. One worker thread runs the calls in submission order, so GameManager
+never sees two calls at once and doesn't need to know about threads, while saves and
+achievement sweeps no longer block the event loop. Each result (or exception) comes
+back through a queued signal and is passed to the submitter's callback on the GUI
+thread.
+
+The GUI still reads GameManager state directly, but only while the executor is idle.
+Change notifications raised on the worker arrive as queued signals, and GameGUI holds
+them until `idle` is emitted (nothing running or queued). Click and selection
+handlers that read game state are marked @reads_game_state in gui.py; while the
+executor is busy they are skipped and rerun on `idle`. Only the GUI thread submits
+work, so nothing can start mutating the game while a refresh or handler runs. The
+list models keep per-row snapshots, so painting never reads live state at all.
+"""
+import atexit
+import queue
+import threading
+import traceback
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class GameActionExecutor(QObject):
+    finished = pyqtSignal(int, object) # Call id, result
+    failed = pyqtSignal(int, object) # Call id, exception
+    busy_changed = pyqtSignal(bool)
+    idle = pyqtSignal() # The last queued call has finished and its result has been delivered
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._queue = queue.Queue()
+        self._callbacks = {} # Call id -> (on_done, on_error); GUI thread only
+        self._next_id = 0
+        self.pending = 0 # Calls submitted but not yet delivered; GUI thread only
+        # Results are emitted on the worker; these connections are queued back to this object's thread
+        self.finished.connect(self._on_finished)
+        self.failed.connect(self._on_failed)
+        self._thread = threading.Thread(target=self._worker_loop, name='game-executor', daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown) # Let a queued save finish before the interpreter exits
+
+    @property
+    def busy(self):
+        return self.pending > 0
+
+    def submit(self, func, *args, on_done=None, on_error=None, **kwargs):
+        """Queues func(*args, **kwargs). on_done(result) or on_error(exception) runs on the GUI thread."""
+        call_id = self._next_id
+        self._next_id += 1
+        self._callbacks[call_id] = (on_done, on_error)
+        self.pending += 1
+        if self.pending == 1:
+            self.busy_changed.emit(True)
+        self._queue.put((call_id, func, args, kwargs))
+        return call_id
+
+    def shutdown(self, timeout=10):
+        """Finishes the queued calls and stops the worker."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def _worker_loop(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            call_id, func, args, kwargs = job
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                print(f"ERROR: {getattr(func, '__name__', func)} failed on the game executor:\n{traceback.format_exc()}")
+                signal, value = self.failed, e
+            else:
+                signal, value = self.finished, result
+            try:
+                signal.emit(call_id, value)
+            except RuntimeError:
+                pass # The window was destroyed during shutdown; keep draining the queue so saves still run
+
+    def _on_finished(self, call_id, result):
+        on_done, _ = self._callbacks.pop(call_id)
+        self._call_delivered()
+        if on_done:
+            on_done(result)
+
+    def _on_failed(self, call_id, error):
+        _, on_error = self._callbacks.pop(call_id)
+        self._call_delivered()
+        if on_error:
+            on_error(error)
+
+    def _call_delivered(self):
+        self.pending -= 1
+        if self.pending == 0:
+            # Before the callback, so it sees panels refreshed with the call's changes
+            self.busy_changed.emit(False)
+            self.idle.emit()
@@ -1,18 +1,78 @@
 # game_manager.py
+import contextlib
 import json
 import os
 import re
 import random
 import datetime
+import functools
+import itertools
 import math # Import math for rounding up
+import time
+import startup_profiler
 from player import Player
 from data_loader import load_quests
 from config import SAVE_FILE, INITIAL_XP, INITIAL_COINS, INITIAL_TITLE, INITIAL_LEVEL, INITIAL_PUNISHMENT_SUM, QUESTS_CSV
 
 CUSTOM_ACTIONS_FILE = 'custom_actions.json'
 
+# What change listeners can be told about:
+#   xp: XP, level and level title        coins: coin balance
+#   quests: active quests, last workout  inventory / gear: unequipped items / equipped slots
+#   skills: skill XP                     pets: owned pets, pet food, pet levels and cooldowns
+#   titles: unlocked and active titles   achievements: unlocked achievements
+#   buffs: timed boosts, multipliers, pending potions
+#   stats: punishment sum, corruption, sanity, streak, daily action count, transcendence count
+#   daily_tasks: today's checklist       punishments: the punishment list
+CHANGE_TOPICS = ('xp', 'coins', 'quests', 'inventory', 'gear', 'skills', 'pets', 'titles',
+                 'achievements', 'buffs', 'stats', 'daily_tasks', 'punishments')
+
+# Goal of every achievement that has a measurable one (Corruption Cleanser is partly luck)
+ACHIEVEMENT_TARGETS = {
+    'quest_grandmaster': 20, # Main quests completed
+    'transcendent_one': 3, # Transcendences
+    'first_steps': 1, # Main quests completed
+    'pet_lover': 3, # Pets owned
+    'wealthy_adventurer': 500, # Coins
+    'skill_master': 100, # XP in the best skill
+    'gear_collector': 5, # Unique gear pieces
+    'daily_master': 7, # Daily tasks completed today
+    'forge_apprentice': 3, # Highest enchant level on non-transcended gear
+    'master_crafter': 5, # Highest enchant level on non-transcended gear
+    'transcended_gear_master': 1, # Transcended items with an extra effect
+}
+
+
+def _utf8_length(text):
+    """Size of text in bytes as UTF-8. json.dumps output is usually ASCII, which skips the encode."""
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+def notifies_changes(method):
+    """Marks a public GameManager action. Listeners hear about its changes once, when the outermost action returns."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._change_depth += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._change_depth -= 1
+            if self._change_depth == 0:
+                self._flush_changes()
+    return wrapper
+
+
 class GameManager:
-    def __init__(self, force_new_game=False):
+    # Optional persistence observer (see io_accounting.py). Its record() gets the bytes and timings of every read/write.
+    io_observer = None
+
+    def __init__(self, force_new_game=False, save_file=SAVE_FILE):
+        self.save_file = save_file # Path of the save file this manager reads and writes
+        self._change_listeners = [] # Called with a frozenset of CHANGE_TOPICS after each action
+        self._pending_changes = set()
+        self._change_depth = 0
+        self._save_batch_depth = 0 # Inside batched_saves(), saves are held until the outermost block exits
+        self._save_pending = False
         # Hardcoded level/milestone data
         self.levels_data = [
             {'name': 'Level 1: 0 XP - Novice', 'xp_required': 0, 'description': 'Starting point.'},
@@ -346,26 +406,87 @@ class GameManager:
             {'type': 'daily_streak_chance', 'value': 0.02}, # +2% chance for daily streak to not reset
         ]
 
-
-        self.player = self._load_game() if not force_new_game else Player()
-
-        self.daily_check_message = self._check_and_reset_daily_tasks()
-        self.check_overdue_quests()
-        self.custom_actions = self._load_custom_actions()
-
+        # Skill decay tuning used by _decay_skills
+        self.skill_decay_grace_days = 7 # Days without training before decay turns exponential
+        self.skill_decay_base = 2 # Decay amount on the first day past the grace period
+        self.skill_decay_growth = 1.5 # Growth factor per extra day past the grace period
+        self.skill_decay_max_growth_days = 10 # Caps the exponent so decay can't run away
+
+        # Enchanting cost tuning: cost for the next level is enchant_base_cost * (level + 1)
+        self.enchant_base_cost = 100
+
+        with startup_profiler.phase('load save'):
+            self.player = self._load_game() if not force_new_game else Player()
+
+        with startup_profiler.phase('daily reset'):
+            self.daily_check_message = self._check_and_reset_daily_tasks()
+        with startup_profiler.phase('overdue check'):
+            self.overdue_check_message = self.check_overdue_quests() # Shown by the GUI once it's on screen
+        with startup_profiler.phase('load custom actions'):
+            self.custom_actions = self._load_custom_actions()
+
+
+    def add_change_listener(self, listener):
+        """Registers listener(topics) to be called with the CHANGE_TOPICS each action changed."""
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener):
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def _mark_changed(self, *topics):
+        self._pending_changes.update(topics)
+        if self._change_depth == 0: # Not inside an action, e.g. a timer-driven buff expiry
+            self._flush_changes()
+
+    def _flush_changes(self):
+        if not self._pending_changes:
+            return
+        topics = frozenset(self._pending_changes)
+        self._pending_changes.clear()
+        for listener in list(self._change_listeners):
+            try:
+                listener(topics)
+            except Exception as e:
+                print(f"ERROR: Change listener {listener!r} failed for {sorted(topics)}: {e}")
+
+    def _write_json(self, operation, path, data):
+        """Serializes data and writes it to path, reporting both steps to the io_observer."""
+        started = time.perf_counter()
+        text = json.dumps(data, indent=4)
+        serialized = time.perf_counter()
+        with open(path, 'w') as f:
+            f.write(text)
+            written_bytes = f.tell() # Bytes in the file, after encoding and newline translation
+        if self.io_observer is not None:
+            self.io_observer.record(operation, path, serialized_bytes=_utf8_length(text), io_bytes=written_bytes,
+                                    serialize_seconds=serialized - started,
+                                    io_seconds=time.perf_counter() - serialized)
+
+    def _read_json(self, operation, path):
+        """Reads and parses a JSON file, reporting both steps to the io_observer."""
+        started = time.perf_counter()
+        with open(path, 'r') as f:
+            text = f.read()
+            read_bytes = f.tell()
+        read = time.perf_counter()
+        data = json.loads(text)
+        if self.io_observer is not None:
+            self.io_observer.record(operation, path, serialized_bytes=_utf8_length(text), io_bytes=read_bytes,
+                                    serialize_seconds=time.perf_counter() - read, io_seconds=read - started)
+        return data
 
     def _load_custom_actions(self):
         if not os.path.exists(CUSTOM_ACTIONS_FILE):
             return []
         try:
-            with open(CUSTOM_ACTIONS_FILE, 'r') as f:
-                return json.load(f)
+            return self._read_json('_load_custom_actions', CUSTOM_ACTIONS_FILE)
         except (json.JSONDecodeError, FileNotFoundError):
             return []
 
     def _save_custom_actions(self):
-        with open(CUSTOM_ACTIONS_FILE, 'w') as f:
-            json.dump(self.custom_actions, f, indent=4)
+        self._write_json('_save_custom_actions', CUSTOM_ACTIONS_FILE, self.custom_actions)
 
     def add_custom_action(self, action_name):
         if action_name not in self.custom_actions:
@@ -379,41 +500,56 @@ class GameManager:
         return list(reversed(self.custom_actions)) + base_actions
 
     def _load_game(self):
-        if os.path.exists(SAVE_FILE):
+        if os.path.exists(self.save_file):
             try:
                 # Check if file is empty
-                if os.path.getsize(SAVE_FILE) == 0:
-                    print(f"WARNING: Save file '{SAVE_FILE}' is empty. Starting new game.")
+                if os.path.getsize(self.save_file) == 0:
+                    print(f"WARNING: Save file '{self.save_file}' is empty. Starting new game.")
                     return Player()
-                with open(SAVE_FILE, 'r') as f:
-                    data = json.load(f)
-                    print(f"Loaded game data: {data}")
-                    player = Player.from_dict(data)
-                    # Load custom punishments from player save
-                    # Ensure that player.custom_punishments is a list before extending
-                    if isinstance(player.custom_punishments, list):
-                        self.punishments_data.extend(player.custom_punishments)
-                    else:
-                        print(f"WARNING: 'custom_punishments' in save file is not a list. Skipping.")
-                    return player
+                data = self._read_json('_load_game', self.save_file)
+                print(f"Loaded game data: {data}")
+                player = Player.from_dict(data)
+                # Load custom punishments from player save
+                # Ensure that player.custom_punishments is a list before extending
+                if isinstance(player.custom_punishments, list):
+                    self.punishments_data.extend(player.custom_punishments)
+                else:
+                    print(f"WARNING: 'custom_punishments' in save file is not a list. Skipping.")
+                return player
             except json.JSONDecodeError as e:
-                print(f"ERROR: Failed to load game from '{SAVE_FILE}'. Invalid JSON data: {e}. Starting new game.")
+                print(f"ERROR: Failed to load game from '{self.save_file}'. Invalid JSON data: {e}. Starting new game.")
                 return Player()
             except Exception as e:
-                print(f"ERROR: An unexpected error occurred while loading game from '{SAVE_FILE}': {e}. Starting new game.")
+                print(f"ERROR: An unexpected error occurred while loading game from '{self.save_file}': {e}. Starting new game.")
                 return Player()
-        print(f"INFO: Save file '{SAVE_FILE}' not found. Starting new game.")
+        print(f"INFO: Save file '{self.save_file}' not found. Starting new game.")
         return Player()
 
     def save_game(self):
+        if self._save_batch_depth:
+            self._save_pending = True
+            return
         # Ensure custom punishments are stored with the player
         self.player.custom_punishments = [p for p in self.punishments_data if p.get('custom')]
-        with open(SAVE_FILE, 'w') as f:
-            json.dump(self.player.to_dict(), f, indent=4)
+        self._write_json('save_game', self.save_file, self.player.to_dict())
         print("Game saved.")
 
+    @contextlib.contextmanager
+    def batched_saves(self):
+        """Holds every save_game() in the block and writes the save once, when the outermost block exits."""
+        self._save_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._save_batch_depth -= 1
+            if self._save_batch_depth == 0 and self._save_pending:
+                self._save_pending = False
+                self.save_game()
+
+    @notifies_changes
     def reset_game(self):
         self.player = Player()
+        self._mark_changed(*CHANGE_TOPICS)
         self.save_game()
         print("Game reset to initial state.")
 
@@ -438,6 +574,7 @@ class GameManager:
                 else:
                     # Buff expired, clear it
                     self.player.transcendence_buff_end_time = None
+                    self._mark_changed('buffs')
                     self.save_game()
             except (ValueError, TypeError):
                 # Handle invalid date format in save file
@@ -475,6 +612,19 @@ class GameManager:
         return current_seasonal_arc
 
 
+    def get_arc_change_time(self):
+        """When get_current_arc_info() can next change: the end of an active transcendence buff, else next month."""
+        now = datetime.datetime.now()
+        if self.player.transcendence_buff_end_time:
+            try:
+                end_time = datetime.datetime.fromisoformat(self.player.transcendence_buff_end_time)
+                if now < end_time:
+                    return end_time
+            except (ValueError, TypeError):
+                pass
+        return datetime.datetime(now.year + (now.month == 12), now.month % 12 + 1, 1) # Seasonal arcs follow the month
+
+
     def get_current_level_name(self):
         sorted_levels = sorted(self.levels_data, key=lambda x: x['xp_required'])
         current_level_name = "Novice"
@@ -493,6 +643,7 @@ class GameManager:
                 return level['xp_required'] - self.player.xp
         return "Max Level Reached"
 
+    @notifies_changes
     def add_xp(self, base_amount, is_quest=False):
         """
         Adds XP to the player, applying various multipliers and pending boosts.
@@ -539,6 +690,7 @@ class GameManager:
         original_xp_for_level_check = self.player.xp
 
         self.player.xp += calculated_amount
+        self._mark_changed('xp')
         print(f"XP added from base/multipliers: {calculated_amount}. Current XP: {self.player.xp}")
 
         # Apply pending XP boost *after* all other calculations
@@ -549,6 +701,7 @@ class GameManager:
             boost_amount_applied = self.player.xp_boost_pending
             self.player.xp += boost_amount_applied
             self.player.xp_boost_pending = 0
+            self._mark_changed('buffs')
             print(f"Applied pending XP boost: {boost_amount_applied} XP. Final XP: {self.player.xp}")
         else:
             print(f"xp_boost_pending is 0. No additional boost applied.")
@@ -570,9 +723,11 @@ class GameManager:
                 self.player.current_level = level['xp_required']
                 print(f"Congratulations! You've reached {level['name']}!")
                 self.player.coins += 5
+                self._mark_changed('xp', 'coins')
                 if random.random() < 0.2:
                     self._unlock_random_title()
 
+    @notifies_changes
     def add_coins(self, amount):
         if self._apply_corruption_failure():
             return "Your laziness gets the better of you... No coins gained due to corruption."
@@ -595,9 +750,11 @@ class GameManager:
 
         actual_amount = amount * self.player.coin_gain_multiplier
         self.player.coins += int(actual_amount)
+        self._mark_changed('coins')
         print(f"Gained {int(actual_amount)} coins. Current Coins: {self.player.coins}")
         return None
 
+    @notifies_changes
     def perform_action(self, action_type, difficulty=None):
         message = ""
         xp_gain, coin_gain = 0, 0
@@ -633,6 +790,7 @@ class GameManager:
 
         return benefit_info.get('type'), current_value, desc_template.format(value=current_value)
 
+    @notifies_changes
     def pet_a_pet(self, pet_name):
         """Handles the logic for petting a pet, including cooldowns and effects."""
         if not self.player.pets or pet_name not in self.player.pets:
@@ -651,6 +809,7 @@ class GameManager:
                 pass
 
         self.player.pet_cooldowns[pet_name] = (now + datetime.timedelta(hours=1)).isoformat()
+        self._mark_changed('pets')
 
         message = ""
         if random.random() < 0.5:
@@ -670,9 +829,11 @@ class GameManager:
                 elif benefit_type == 'punishment':
                     if self.player.punishment_sum > 0:
                         self.player.punishment_sum = max(0, self.player.punishment_sum - benefit_value)
+                        self._mark_changed('stats')
                         message += f"\nYour pet mitigated {benefit_value} punishment point(s)!"
                 elif benefit_type == 'corruption':
                     self.player.corruption = max(0, self.player.corruption - benefit_value)
+                    self._mark_changed('stats')
                     message += f"\nYour pet helped reduce your corruption by {benefit_value}!"
                 elif 'skill' in benefit_type:
                     skill_name = benefit_type.replace('skill_', '').title()
@@ -687,6 +848,7 @@ class GameManager:
         self.save_game()
         return message
 
+    @notifies_changes
     def generate_workout_plan(self, details):
         """Generates a full workout plan with 4-7 exercises as individual quests."""
         difficulty = details.get('difficulty')
@@ -819,11 +981,13 @@ class GameManager:
             if quest:
                 quest.update(base_quest)
                 self.player.quests.append(quest)
+                self._mark_changed('quests')
                 self.add_new_skill(skill_type)
                 generated_quests_names.append(quest['name'])
 
         if generated_quests_names:
             self.player.last_workout_type = workout_type if skill_type in ["Strength", "Durability"] else "Endurance"
+            self._mark_changed('quests')
             self.save_game()
             plan_summary = "\n- ".join(generated_quests_names)
             return (f"Generated a new {difficulty} {training_part} workout plan with {len(generated_quests_names)} exercises:\n\n"
@@ -831,6 +995,7 @@ class GameManager:
         
         return "Failed to generate a workout plan. Not enough available exercises."
 
+    @notifies_changes
     def generate_quest(self, category, sub_category=None, details=None):
         if category == "Training" and details:
             return self.generate_workout_plan(details)
@@ -861,6 +1026,7 @@ class GameManager:
         if quest:
             quest.update(base_quest)
             self.player.quests.append(quest)
+            self._mark_changed('quests')
             if 'skill_reward' in quest:
                 self.add_new_skill(quest['skill_reward']['skill'])
             self.save_game()
@@ -868,6 +1034,7 @@ class GameManager:
         
         return "Failed to generate quest. Check your selections."
 
+    @notifies_changes
     def generate_side_quest(self):
         active_side_quest_names = [q['name'] for q in self.player.quests if q.get('quest_type') == 'side']
         available_templates = [t for t in self.side_quest_templates if t['name'] not in active_side_quest_names]
@@ -883,17 +1050,20 @@ class GameManager:
         quest['steps'] = "1. Identify the task.\n2. Complete the task.\n3. Mark as complete."
 
         self.player.quests.append(quest)
+        self._mark_changed('quests')
         self.save_game()
         return f"New side quest generated: {quest['name']}"
 
     def get_available_quests(self):
         return self.player.quests
 
+    @notifies_changes
     def complete_quest(self, quest_name, completed_duration=None):
         quest = next((q for q in self.player.quests if q['name'] == quest_name), None)
         if quest:
             if self._apply_corruption_failure():
                 self.player.quests.remove(quest)
+                self._mark_changed('quests')
                 self.save_game()
                 return "Your laziness gets the better of you... No rewards gained due to corruption."
 
@@ -924,6 +1094,7 @@ class GameManager:
                 self.gain_skill_points(skill_info['skill'], skill_info['amount'])
 
             self.player.quests.remove(quest)
+            self._mark_changed('quests', 'stats')
             
             # --- SANITY and MAIN QUEST COUNTER LOGIC ---
             message_sanity = ""
@@ -964,6 +1135,7 @@ class GameManager:
             return message
         return f"Quest '{quest_name}' not found or already completed."
 
+    @notifies_changes
     def check_overdue_quests(self):
         now = datetime.datetime.now()
         overdue_quests = [q for q in self.player.quests if q.get('due_date') and now > datetime.datetime.fromisoformat(q['due_date'])]
@@ -976,6 +1148,7 @@ class GameManager:
         for quest in overdue_quests:
             message += f"- {quest['name']}\n"
             self.player.quests.remove(quest)
+            self._mark_changed('quests')
 
             if quest.get('quest_type') == 'main':
                 penalty_func = random.choice(self.overdue_quest_penalties)
@@ -998,6 +1171,7 @@ class GameManager:
 
         if target_skill in self.player.skills:
             self.player.skills[target_skill]['xp'] = max(0, self.player.skills[target_skill]['xp'] - amount)
+            self._mark_changed('skills')
             return f"Your {target_skill} skill has atrophied, losing {amount} XP."
         return ""
 
@@ -1005,6 +1179,7 @@ class GameManager:
         if self.player.pets:
             lost_pet = random.choice(self.player.pets)
             self.player.pets.remove(lost_pet)
+            self._mark_changed('pets')
             return f"In a moment of despair, your pet {lost_pet} has run away!"
         return "You had no pets to lose, a small mercy."
 
@@ -1014,16 +1189,19 @@ class GameManager:
     def _penalize_lose_coins(self, amount):
         lost_amount = min(self.player.coins, amount)
         self.player.coins -= lost_amount
+        self._mark_changed('coins')
         return f"Your wallet feels lighter... You lost {lost_amount} coins."
 
     def _penalize_lose_xp(self, amount):
         lost_amount = min(self.player.xp, amount)
         self.player.xp -= lost_amount
+        self._mark_changed('xp')
         return f"Your spirit wanes... You lost {lost_amount} XP."
 
     def get_shop_items(self):
         return self.shop_items_data
 
+    @notifies_changes
     def purchase_cart(self, cart):
         """Processes a shopping cart, applying item effects based on quantity."""
         if not cart:
@@ -1040,6 +1218,7 @@ class GameManager:
 
         # Deduct cost and apply effects
         self.player.coins -= total_cost
+        self._mark_changed('coins')
         purchase_summary = []
         buff_message = ""
 
@@ -1050,11 +1229,13 @@ class GameManager:
                 if item_data['effect'] == 'xp_boost':
                     # Directly add XP for 'Small XP Boost' without applying multipliers
                     self.player.xp += item_data['amount'] * quantity
+                    self._mark_changed('xp')
                     purchase_summary.append(f"{quantity}x {item_name} (Direct XP Gain: {item_data['amount'] * quantity})")
                 elif item_data['effect'] == 'add_coins':
                     self.add_coins(item_data['amount'] * quantity)
                 elif item_data['effect'] == 'add_pet_food':
                     self.player.pet_food += item_data['amount'] * quantity
+                    self._mark_changed('pets')
                 elif item_data['effect'] == 'gain_skill':
                     self.add_new_skill(item_data['skill'])
                     self.gain_skill_points(item_data['skill'], item_data['amount'] * quantity)
@@ -1062,23 +1243,27 @@ class GameManager:
                     # Store buff end time directly in player
                     self.player.transcendence_buff_end_time = (datetime.datetime.now() + datetime.timedelta(minutes=item_data['duration_minutes'])).isoformat()
                     buff_message = f"XP gain will be {item_data['amount']}x for {item_data['duration_minutes']} minutes!"
+                    self._mark_changed('buffs')
                 elif item_data['effect'] == 'coin_multiplier':
                     # This buff needs to be handled on the player object for a timed duration
                     # For now, it's just a message, actual implementation of timed coin buff would be needed
                     self.player.coin_gain_multiplier *= item_data['amount'] # This is a permanent multiplier, needs adjustment if temporary
                     buff_message = f"Coin gain will be {item_data['amount']}x for {item_data['duration_minutes']} minutes!" # This message is temporary, actual multiplier is permanent here
+                    self._mark_changed('buffs')
                 elif item_data['effect'] == 'unlock_title':
                     for _ in range(quantity): self._unlock_random_title() # Unlock one per quantity
                 elif item_data['effect'] == 'add_gear':
                     for _ in range(quantity): self._add_random_gear_to_inventory()
                 elif item_data['effect'] == 'punishment_mitigation':
                     self.player.punishment_mitigation_pending = True
+                    self._mark_changed('buffs')
                 elif item_data['effect'] == 'add_pet_egg':
                     available_pets = [p for p in self.pets_data if p['Name'] not in self.player.pets]
                     if available_pets:
                         new_pet = random.choice(available_pets)
                         # Only add the name of the pet to the player's pets list
                         self.player.pets.append(new_pet['Name'])
+                        self._mark_changed('pets')
                     else: # No new pets to give, refund for this egg
                         self.player.coins += item_data['cost']
 
@@ -1098,6 +1283,7 @@ class GameManager:
     def get_punishments(self):
         return self.punishments_data
 
+    @notifies_changes
     def add_custom_punishment(self, punishment_data):
         if punishment_data.pop('special_penalty_enabled', False):
             severity_chances = {"OK": 0.05, "Moderate": 0.15, "High": 0.30, "Terrible": 0.50}
@@ -1107,14 +1293,17 @@ class GameManager:
             punishment_data['special_effect'] = random.choice(possible_effects)
 
         self.punishments_data.append(punishment_data)
+        self._mark_changed('punishments')
         self.save_game()
 
 
+    @notifies_changes
     def apply_punishment(self, habit_name):
         punishment = next((p for p in self.punishments_data if p['name'] == habit_name), None)
         if punishment:
             if self.player.punishment_mitigation_pending:
                 self.player.punishment_mitigation_pending = False
+                self._mark_changed('buffs')
                 return f"Punishment for '{habit_name}' was mitigated by your potion!"
 
             punishment_value = punishment.get('punishment', 0)
@@ -1122,6 +1311,7 @@ class GameManager:
 
             self.player.xp = max(0, self.player.xp - punishment.get('xp_penalty', 0))
             self.player.coins = max(0, self.player.coins - punishment.get('coin_penalty', 0))
+            self._mark_changed('xp', 'coins')
 
             message = f"Applied punishment for: {habit_name}. Sum +{punishment_value}, XP -{punishment.get('xp_penalty', 0)}, Coins -{punishment.get('coin_penalty', 0)}."
 
@@ -1130,6 +1320,7 @@ class GameManager:
                 if effect == 'pet_loss' and self.player.pets:
                     lost_pet = random.choice(self.player.pets)
                     self.player.pets.remove(lost_pet)
+                    self._mark_changed('pets')
                     message += f"\nTERRIBLE LUCK! Your pet {lost_pet} got scared and ran away forever!"
                 elif effect == 'title_loss' and len(self.player.unlocked_titles) > 1:
                     losable_titles = [t for t in self.player.unlocked_titles if t != "Novice"]
@@ -1138,6 +1329,7 @@ class GameManager:
                         self.player.unlocked_titles.remove(lost_title)
                         if self.player.active_title == lost_title:
                             self.player.active_title = None
+                        self._mark_changed('titles')
                         message += f"\nTERRIBLE LUCK! You lost the memory of what it meant to be a '{lost_title}'!"
                 elif effect == 'skill_decay':
                     penalty_msg = self._penalize_stat_points('Random', 25)
@@ -1146,13 +1338,16 @@ class GameManager:
                 elif effect == 'corruption_gain':
                     gain_amount = random.randint(5, 15)
                     self.player.corruption += gain_amount
+                    self._mark_changed('stats')
                     message += f"\nTERRIBLE LUCK! Your corruption increased by {gain_amount}!"
                 elif effect == 'reset_streak':
                     self.player.daily_streak = 0
+                    self._mark_changed('stats')
                     message += f"\nTERRIBLE LUCK! Your daily streak has been reset to 0!"
                 elif effect == 'xp_boost_loss':
                     if self.player.xp_boost_pending > 0:
                         self.player.xp_boost_pending = 0
+                        self._mark_changed('buffs')
                         message += f"\nTERRIBLE LUCK! Your pending XP boost was lost!"
 
 
@@ -1164,6 +1359,7 @@ class GameManager:
             return message
         return f"Punishment '{habit_name}' not found."
 
+    @notifies_changes
     def apply_punishment_value(self, value):
         # Apply title and gear buff to the punishment value
         if self.player.active_title == 'Resilient':
@@ -1171,6 +1367,7 @@ class GameManager:
         gear_buff = self._get_gear_buff('punishment_reduction')
         value = int(value * (1 - gear_buff))
         self.player.punishment_sum += value
+        self._mark_changed('stats')
 
     def _check_and_reset_daily_tasks(self):
         today = datetime.date.today()
@@ -1204,6 +1401,7 @@ class GameManager:
             self.player.daily_tasks_completed = 0
             self.player.daily_tasks = {} # Reset daily tasks
             self.player.last_daily_reset_date = today.isoformat()
+            self._mark_changed('stats', 'daily_tasks')
             self.save_game()
             message = decay_message + message if decay_message else message
         return message
@@ -1216,8 +1414,9 @@ class GameManager:
             days_since_update = (datetime.date.today() - last_updated).days
 
             decay_amount = 0
-            if days_since_update >= 7:
-                decay_amount = int(2 * (1.5 ** min(days_since_update - 7, 10)))
+            if days_since_update >= self.skill_decay_grace_days:
+                days_over = min(days_since_update - self.skill_decay_grace_days, self.skill_decay_max_growth_days)
+                decay_amount = int(self.skill_decay_base * (self.skill_decay_growth ** days_over))
             elif days_since_update > 0:
                 decay_amount = days_since_update * random.randint(1, 2)
 
@@ -1226,6 +1425,7 @@ class GameManager:
                 self.player.skills[skill]['xp'] = max(0, original_xp - decay_amount)
                 decayed_by = original_xp - self.player.skills[skill]['xp']
                 if decayed_by > 0:
+                    self._mark_changed('skills')
                     decay_messages.append(f"'{skill}' decayed by {decayed_by} XP.")
 
         return "\n".join(decay_messages) if decay_messages else ""
@@ -1240,15 +1440,19 @@ class GameManager:
     def _apply_corruption_failure(self):
         return random.randint(1, 100) <= self.get_effective_corruption() * 10
 
+    @notifies_changes
     def increment_daily_tasks(self):
         self.player.daily_tasks_completed += 1
+        self._mark_changed('stats')
 
+    @notifies_changes
     def complete_daily_task(self, task_name, is_complete):
         # Prevent multiple calls for the same state on the same day
         if self.player.daily_tasks.get(task_name) == is_complete:
             return ""
 
         self.player.daily_tasks[task_name] = is_complete
+        self._mark_changed('daily_tasks')
 
         if is_complete:
             xp_change = 1 # Small XP for daily task
@@ -1267,6 +1471,7 @@ class GameManager:
         # Iterate through self.pets_data to find the pet by name
         return next((p for p in self.pets_data if p['Name'] == pet_name), None)
 
+    @notifies_changes
     def feed_pet(self, pet_name):
         if self.player.pet_food <= 0:
             return "You don't have any pet food! Buy some from the shop."
@@ -1276,6 +1481,7 @@ class GameManager:
         if pet_in_player:
             self.player.pet_food -= 1
             pet_in_player['XP'] += 10
+            self._mark_changed('pets')
             message = f"You fed {pet_name}. It gained 10 XP. You have {self.player.pet_food} pet food left."
 
             if pet_in_player['XP'] >= pet_in_player['XP_to_Evolve']:
@@ -1288,6 +1494,7 @@ class GameManager:
             return message
         return "Pet not found."
 
+    @notifies_changes
     def play_with_pet(self, pet_name):
         if pet_name not in self.player.pets:
             return "You don't have this pet."
@@ -1305,6 +1512,7 @@ class GameManager:
                 pass
 
         self.player.play_cooldowns[pet_name] = (now + datetime.timedelta(minutes=10)).isoformat()
+        self._mark_changed('pets')
 
         # Fetch the pet data from the main pets_data list, not player.pets
         pet_in_player = self.get_pet_data(pet_name)
@@ -1325,6 +1533,7 @@ class GameManager:
         count = self.player.transcendence_count
         return self.transcend_req_map.get(count, self.transcend_req_map[max(self.transcend_req_map.keys())])
 
+    @notifies_changes
     def transcend(self):
         req_xp = self.get_transcend_requirement()
         if self.player.xp >= req_xp:
@@ -1346,6 +1555,7 @@ class GameManager:
             for slot, item in self.player.gear.items():
                 if item and not item.get('transcended'):
                     self.player.gear[slot] = None
+            self._mark_changed('xp', 'coins', 'stats', 'buffs', 'inventory', 'gear')
 
             self._add_random_gear_to_inventory()
 
@@ -1356,13 +1566,16 @@ class GameManager:
                     "Progress and non-transcended gear reset, but you feel permanently stronger.")
         return "You do not meet the requirements to Transcend yet."
 
+    @notifies_changes
     def add_new_skill(self, skill_name):
         if skill_name and skill_name not in self.player.skills:
             self.player.skills[skill_name] = {'xp': 0, 'last_updated': datetime.date.today().isoformat()}
+            self._mark_changed('skills')
             self.save_game()
             return True
         return False
 
+    @notifies_changes
     def gain_skill_points(self, skill_name, amount):
         if skill_name in self.player.skills:
             # Apply title buffs to skill XP gain
@@ -1377,6 +1590,7 @@ class GameManager:
 
             self.player.skills[skill_name]['xp'] += amount
             self.player.skills[skill_name]['last_updated'] = datetime.date.today().isoformat()
+            self._mark_changed('skills')
             self.save_game()
             return True
         return False
@@ -1386,6 +1600,7 @@ class GameManager:
         if available_titles:
             new_title = random.choice(available_titles)
             self.player.unlocked_titles.append(new_title['name'])
+            self._mark_changed('titles')
             self.save_game()
             return f"Title Unlocked: {new_title['name']}!"
         return None
@@ -1396,10 +1611,12 @@ class GameManager:
     def get_title_effects(self):
         return self.title_effects_data
 
+    @notifies_changes
     def set_active_title(self, title_name):
         if title_name == "None": title_name = None
         if title_name is None or title_name in self.player.unlocked_titles:
             self.player.active_title = title_name
+            self._mark_changed('titles')
             self.save_game()
             return f"Active title set to: {title_name}"
         return "You haven't unlocked that title."
@@ -1410,35 +1627,78 @@ class GameManager:
         return f"{base} ({active})" if active else base
 
     def get_achievements(self):
-        for key, ach in self.achievements_data.items():
-            ach['unlocked'] = key in self.player.achievements
-        return self.achievements_data
+        """Copies of the achievement catalog entries with 'unlocked' set for this player. The catalog itself isn't touched."""
+        unlocked = set(self.player.achievements)
+        return {key: dict(ach, unlocked=key in unlocked) for key, ach in self.achievements_data.items()}
+
+    def get_achievement_progress(self):
+        """(current, target) for each achievement in ACHIEVEMENT_TARGETS, with current capped at the target."""
+        player = self.player
+        unlocked = set(player.achievements)
+        unique_gear_pieces = set()
+        max_enchant_level = 0
+        empowered_items = 0
+        if not unlocked.issuperset(('gear_collector', 'forge_apprentice', 'master_crafter', 'transcended_gear_master')):
+            for item in itertools.chain(player.inventory, player.gear.values()): # One pass for the gear goals
+                if not item:
+                    continue
+                unique_gear_pieces.add(item['name'].split(' +')[0].replace('Transcended ', ''))
+                if not item.get('transcended'):
+                    max_enchant_level = max(max_enchant_level, item.get('enchant_level', 0))
+                elif item.get('extra_effect'):
+                    empowered_items += 1
+                if (len(unique_gear_pieces) >= ACHIEVEMENT_TARGETS['gear_collector']
+                        and max_enchant_level >= ACHIEVEMENT_TARGETS['master_crafter']
+                        and empowered_items >= ACHIEVEMENT_TARGETS['transcended_gear_master']):
+                    break # Every gear goal is met, so the rest of the inventory can't change the capped values
+        current = {
+            'quest_grandmaster': player.main_quests_completed,
+            'transcendent_one': player.transcendence_count,
+            'first_steps': player.main_quests_completed,
+            'pet_lover': len(player.pets),
+            'wealthy_adventurer': player.coins,
+            'skill_master': max((int(skill['xp']) for skill in player.skills.values()), default=0),
+            'gear_collector': len(unique_gear_pieces),
+            'daily_master': player.daily_tasks_completed,
+            'forge_apprentice': max_enchant_level,
+            'master_crafter': max_enchant_level,
+            'transcended_gear_master': empowered_items,
+        }
+        # Unlocked goals count as met even if the stat has dropped since (coins spent, pets lost)
+        return {key: (target if key in unlocked else min(current[key], target), target)
+                for key, target in ACHIEVEMENT_TARGETS.items()}
 
+    @notifies_changes
     def check_achievements(self):
-        if self.player.main_quests_completed >= 20 and 'quest_grandmaster' not in self.player.achievements:
+        unlocked_before = len(self.player.achievements)
+        if self.player.main_quests_completed >= ACHIEVEMENT_TARGETS['quest_grandmaster'] and 'quest_grandmaster' not in self.player.achievements:
             self.player.achievements.append('quest_grandmaster')
             if 'Legendary Quester' not in self.player.unlocked_titles:
                 self.player.unlocked_titles.append('Legendary Quester')
+                self._mark_changed('titles')
 
-        if self.player.transcendence_count >= 3 and 'transcendent_one' not in self.player.achievements:
+        if self.player.transcendence_count >= ACHIEVEMENT_TARGETS['transcendent_one'] and 'transcendent_one' not in self.player.achievements:
             self.player.achievements.append('transcendent_one')
             if 'Ascended' not in self.player.unlocked_titles:
                 self.player.unlocked_titles.append('Ascended')
+                self._mark_changed('titles')
             self.player.coin_gain_multiplier += 0.1
+            self._mark_changed('buffs')
 
-        if self.player.main_quests_completed >= 1 and 'first_steps' not in self.player.achievements:
+        if self.player.main_quests_completed >= ACHIEVEMENT_TARGETS['first_steps'] and 'first_steps' not in self.player.achievements:
             self.player.achievements.append('first_steps')
             self.add_coins(50)
 
-        if len(self.player.pets) >= 3 and 'pet_lover' not in self.player.achievements:
+        if len(self.player.pets) >= ACHIEVEMENT_TARGETS['pet_lover'] and 'pet_lover' not in self.player.achievements:
             self.player.achievements.append('pet_lover')
             self.player.pet_food += 5
+            self._mark_changed('pets')
 
-        if self.player.coins >= 500 and 'wealthy_adventurer' not in self.player.achievements:
+        if self.player.coins >= ACHIEVEMENT_TARGETS['wealthy_adventurer'] and 'wealthy_adventurer' not in self.player.achievements:
             self.player.achievements.append('wealthy_adventurer')
             self.add_coins(100)
 
-        if any(skill_data['xp'] >= 100 for skill_data in self.player.skills.values()) and 'skill_master' not in self.player.achievements:
+        if any(skill_data['xp'] >= ACHIEVEMENT_TARGETS['skill_master'] for skill_data in self.player.skills.values()) and 'skill_master' not in self.player.achievements:
             self.player.achievements.append('skill_master')
             skill_tomes = [item for item in self.shop_items_data if item.get('effect') == 'gain_skill']
             if skill_tomes:
@@ -1450,17 +1710,19 @@ class GameManager:
         for item in self.player.inventory + list(self.player.gear.values()):
             if item:
                 unique_gear_pieces.add(item['name'].split(' +')[0].replace('Transcended ', '')) # Remove enchant/transcended for uniqueness
-        if len(unique_gear_pieces) >= 5 and 'gear_collector' not in self.player.achievements:
+        if len(unique_gear_pieces) >= ACHIEVEMENT_TARGETS['gear_collector'] and 'gear_collector' not in self.player.achievements:
             self.player.achievements.append('gear_collector')
             legendary_gear = {'name': 'Helmet of Legends', 'type': 'Helmet', 'buff': {'type': 'xp_gain', 'value': 0.20}}
             self.player.inventory.append(legendary_gear)
+            self._mark_changed('inventory')
 
-        if self.player.daily_tasks_completed >= 7 and 'daily_master' not in self.player.achievements:
+        if self.player.daily_tasks_completed >= ACHIEVEMENT_TARGETS['daily_master'] and 'daily_master' not in self.player.achievements:
             self.player.achievements.append('daily_master')
             # Call add_xp with base_amount=100
             self.add_xp(100)
             if 'Diligent' not in self.player.unlocked_titles:
                 self.player.unlocked_titles.append('Diligent')
+                self._mark_changed('titles')
 
         if self.player.corruption <= 0 and self._check_corruption_was_high() and 'corruption_cleanse' not in self.player.achievements:
             self.player.achievements.append('corruption_cleanse')
@@ -1473,15 +1735,16 @@ class GameManager:
             if item and not item.get('transcended'):
                 max_enchant_level = max(max_enchant_level, item.get('enchant_level', 0))
 
-        if max_enchant_level >= 3 and 'forge_apprentice' not in self.player.achievements:
+        if max_enchant_level >= ACHIEVEMENT_TARGETS['forge_apprentice'] and 'forge_apprentice' not in self.player.achievements:
             self.player.achievements.append('forge_apprentice')
             self.add_coins(50) # No actual scroll item, just reward
 
-        if max_enchant_level >= 5 and 'master_crafter' not in self.player.achievements:
+        if max_enchant_level >= ACHIEVEMENT_TARGETS['master_crafter'] and 'master_crafter' not in self.player.achievements:
             self.player.achievements.append('master_crafter')
             self.add_coins(200)
             if 'Artisan' not in self.player.unlocked_titles:
                 self.player.unlocked_titles.append('Artisan')
+                self._mark_changed('titles')
 
         # Check for Transcended Gear Master
         transcended_item_with_extra_effect = False
@@ -1494,6 +1757,10 @@ class GameManager:
             self.add_coins(300)
             if 'Empowered' not in self.player.unlocked_titles:
                 self.player.unlocked_titles.append('Empowered')
+                self._mark_changed('titles')
+
+        if len(self.player.achievements) != unlocked_before:
+            self._mark_changed('achievements')
 
 
     def _check_corruption_was_high(self):
@@ -1510,6 +1777,7 @@ class GameManager:
         item_instance['type'] = gear_type
 
         self.player.inventory.append(item_instance)
+        self._mark_changed('inventory')
         print(f"Found gear: {item_instance['name']}!")
         self.save_game()
 
@@ -1532,6 +1800,7 @@ class GameManager:
         return True, None
 
 
+    @notifies_changes
     def equip_gear(self, item_name):
         item_to_equip = next((item for item in self.player.inventory if item['name'] == item_name), None)
         if not item_to_equip: return "Item not in inventory."
@@ -1548,15 +1817,18 @@ class GameManager:
 
         self.player.gear[gear_slot] = item_to_equip
         self.player.inventory.remove(item_to_equip)
+        self._mark_changed('inventory', 'gear')
         self.save_game()
         return f"Equipped {item_name}."
 
+    @notifies_changes
     def unequip_gear(self, gear_slot):
         item_to_unequip = self.player.gear.get(gear_slot)
         if not item_to_unequip: return "No item in that slot."
 
         self.player.inventory.append(item_to_unequip)
         self.player.gear[gear_slot] = None
+        self._mark_changed('inventory', 'gear')
         self.save_game()
         return f"Unequipped {item_to_unequip['name']}."
 
@@ -1572,6 +1844,11 @@ class GameManager:
                     total_buff += item['extra_effect']['value']
         return total_buff
 
+    def get_enchant_cost(self, current_level):
+        """Returns the coin cost of enchanting an item from current_level to the next level."""
+        return self.enchant_base_cost * (current_level + 1)
+
+    @notifies_changes
     def enchant_gear(self, item_name):
         item_ref = None
         # Check in inventory first
@@ -1593,13 +1870,14 @@ class GameManager:
         # Transcended items can now be enchanted.
 
         level = item_ref.get('enchant_level', 0)
-        cost = 100 * (level + 1)
+        cost = self.get_enchant_cost(level)
 
         if self.player.coins < cost:
             return f"Not enough coins. Enchanting to +{level + 1} costs {cost} coins."
 
         self.player.coins -= cost
         item_ref['enchant_level'] = level + 1
+        self._mark_changed('coins', 'inventory', 'gear') # The item may be in either
 
         if 'buff' in item_ref and 'value' in item_ref['buff']:
             item_ref['buff']['value'] *= 1.1 # Increase existing buff by 10%
@@ -1620,6 +1898,7 @@ class GameManager:
         self.save_game()
         return f"Successfully enchanted {base_name} to +{level + 1} for {cost} coins!"
 
+    @notifies_changes
     def transcend_gear(self, item_name):
         item_ref = None
         for i, item in enumerate(self.player.inventory):
@@ -1644,6 +1923,7 @@ class GameManager:
 
         self.player.coins -= cost
         item_ref['transcended'] = True
+        self._mark_changed('coins', 'inventory', 'gear')
         
         # Preserve enchant level in the name when transcending
         base_name_parts = item_ref['name'].split(' +')[0]
@@ -1654,6 +1934,7 @@ class GameManager:
         self.save_game()
         return f"Successfully paid {cost} coins to Transcend {base_name_parts}. It is now safe from resets."
 
+    @notifies_changes
     def roll_extra_effect(self, item_name):
         item_ref = None
         for i, item in enumerate(self.player.inventory):
@@ -1684,6 +1965,7 @@ class GameManager:
         # Select a random extra effect from the predefined list
         new_effect = random.choice(self.extra_status_effects)
         item_ref['extra_effect'] = new_effect.copy() # Store a copy to avoid modifying the original template
+        self._mark_changed('coins', 'inventory', 'gear')
 
         self.check_achievements() # Recheck achievements for 'transcended_gear_master'
         self.save_game()
@@ -1732,6 +2014,7 @@ class GameManager:
 
         return int(sell_price)
 
+    @notifies_changes
     def sell_gear(self, item_name):
         item_ref = None
         is_equipped = False
@@ -1760,6 +2043,7 @@ class GameManager:
 
         if is_equipped:
             self.player.gear[slot_to_remove] = None # Remove from equipped slot
+        self._mark_changed('coins', 'gear' if is_equipped else 'inventory')
 
         self.save_game()
         return f"Successfully sold {item_name} for {sell_price} coins!"
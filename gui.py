@@ -2,23 +2,29 @@
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTabWidget, QScrollArea, QMessageBox, QGridLayout, QFrame, QLineEdit,
-    QComboBox, QSizePolicy, QListWidget, QInputDialog, QListWidgetItem,
+    QComboBox, QSizePolicy, QInputDialog,
     QTextEdit, QDateEdit, QProgressBar, QSpacerItem, QSplitter, QDialog,
     QDialogButtonBox, QFormLayout, QSpinBox, QCheckBox, QTableWidget,
-    QTableWidgetItem, QHeaderView, QApplication, QStackedWidget, QGraphicsOpacityEffect
+    QTableWidgetItem, QHeaderView, QApplication, QStackedWidget, QGraphicsOpacityEffect, QShortcut
 )
-from PyQt5.QtCore import Qt, QTimer, QDateTime, QDate, QSize , QEasingCurve, QPropertyAnimation, pyqtSignal, pyqtProperty
-from PyQt5.QtGui import QFont, QIcon, QColor, QFontMetrics
-
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
-import numpy as np
+from PyQt5.QtCore import Qt, QTimer, QDateTime, QDate, QEasingCurve, QPropertyAnimation, pyqtSignal, pyqtProperty
+from PyQt5.QtGui import QFont, QIcon, QColor, QKeySequence
 
 import datetime
-from functools import partial
+from functools import partial, wraps
 import math
 import sys
 
+import startup_profiler
+import tracing
+import memory_snapshots
+from cprofile_capture import ProfileCapture
+import skills_chart
+from deadline_scheduler import DeadlineScheduler
+from game_executor import GameActionExecutor
+from list_models import (GearListModel, QuestListModel, QuestTypeFilterModel, PetListModel, PunishmentListModel,
+                         PunishmentDelegate, ModelListView, TextFilterModel)
+
 # Global Stylesheet for a modern look
 GLOBAL_STYLESHEET = """
     QMainWindow, QWidget {
@@ -47,6 +53,54 @@ GLOBAL_STYLESHEET = """
         color: #2c3e50;
         margin-bottom: 10px;
     }
+    QLabel#titleLabel, QLabel#statLabel { /* Titles sized with setFont, and the stats panel */
+        color: #2c3e50;
+    }
+    QLabel#detailLabel {
+        color: #555555;
+    }
+    QLabel#quoteLabel {
+        font-style: italic;
+        color: #555555;
+    }
+    QLabel#gearItemLabel[transcended="true"] {
+        color: purple;
+        font-weight: bold;
+    }
+
+    QLabel#achievementName {
+        color: #2c3e50;
+    }
+    QLabel#achievementDescription {
+        color: #34495e;
+    }
+    QLabel#achievementReward {
+        color: #27ae60; /* Green for unlocked rewards */
+        font-weight: bold;
+    }
+    QFrame#achievementCard[locked="true"], QFrame#achievementCard[locked="true"] QLabel {
+        background-color: #ecf0f1;
+        border: 1px solid #bdc3c7;
+        border-radius: 12px;
+        padding: 15px;
+        margin: 5px;
+        box-shadow: none;
+    }
+    QFrame#achievementCard[locked="true"] QLabel#achievementName {
+        color: #7f8c8d; /* Greyed out */
+    }
+    QFrame#achievementCard[locked="true"] QLabel#achievementDescription,
+    QFrame#achievementCard[locked="true"] QLabel#achievementReward {
+        color: #95a5a6;
+        font-weight: normal;
+    }
+
+    QLabel#transcendTitle {
+        color: #2980b9; /* Blue */
+    }
+    QLabel#transcendTitle[ready="true"] {
+        color: #8e44ad; /* Purple when transcending is possible */
+    }
 
     QPushButton {
         /* Reverted to default for QMessageBox compatibility */
@@ -85,6 +139,94 @@ GLOBAL_STYLESHEET = """
     QPushButton#dangerButton:hover {
         background-color: #c0392b;
     }
+    QPushButton#removeButton { /* Small red button in cart rows */
+        background-color: #dc3545;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 3px 8px;
+        font-size: 10px;
+    }
+    QPushButton#removeButton:hover {
+        background-color: #c82333;
+    }
+    QPushButton#rollEffectButton { /* Grey for roll effect */
+        background-color: #6c757d;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 15px;
+        font-weight: bold;
+        min-height: 35px;
+    }
+    QPushButton#rollEffectButton:hover {
+        background-color: #5a6268;
+    }
+    QPushButton#sellButton { /* Yellow for sell */
+        background-color: #ffc107;
+        color: #333333;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 15px;
+        font-weight: bold;
+        min-height: 35px;
+    }
+    QPushButton#sellButton:hover {
+        background-color: #e0a800;
+    }
+    QPushButton#transcendButton {
+        background-color: #f39c12; /* Orange for transcend */
+        color: white;
+        border: none;
+        border-radius: 15px;
+        padding: 15px 30px;
+        font-weight: bold;
+        font-size: 18px;
+        box-shadow: 3px 3px 12px rgba(0, 0, 0, 0.3);
+    }
+    QPushButton#transcendButton:hover {
+        background-color: #e67e22;
+    }
+    QPushButton#transcendButton:pressed {
+        background-color: #d35400;
+    }
+    QPushButton#transcendButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+        box-shadow: none;
+    }
+    QLabel#shopCostLabel {
+        color: #28a745; /* Green for cost */
+    }
+    QLabel#shopCostLabel[affordable="false"] {
+        color: #dc3545; /* Red when the player can't afford it */
+    }
+
+    QProgressBar#transcendProgress {
+        border: 2px solid #2196F3;
+        border-radius: 10px;
+        background-color: #e3f2fd; /* Light blue background */
+        text-align: center;
+        color: #333333;
+        font-weight: bold;
+    }
+    QProgressBar#achievementProgress {
+        border: 1px solid #bdc3c7;
+        border-radius: 6px;
+        background-color: #ffffff;
+        text-align: center;
+        color: #333333;
+        font-size: 9px;
+        max-height: 14px;
+    }
+    QProgressBar#achievementProgress::chunk {
+        background-color: #2196F3; /* Blue for progress */
+        border-radius: 5px;
+    }
+    QProgressBar#transcendProgress::chunk {
+        background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #2196F3, stop:1 #42A5F5); /* Blue gradient */
+        border-radius: 8px;
+    }
 
     QTabWidget::pane { /* The tab content area */
         border: 1px solid #e0e0e0;
@@ -129,17 +271,17 @@ GLOBAL_STYLESHEET = """
         border: 1px solid #4CAF50;
     }
 
-    QListWidget {
+    QListView {
         border: 1px solid #e0e0e0;
         border-radius: 8px;
         background-color: #fdfdfd;
         padding: 5px;
     }
-    QListWidget::item {
+    QListView::item {
         padding: 5px;
         "border-bottom: 1px solid #f0f0f0; /* Subtle separator */"
     }
-    QListWidget::item:selected {
+    QListView::item:selected {
         background-color: #e6f7e6; /* Light green for selected item */
         color: #333333;
     }
@@ -207,9 +349,10 @@ class WelcomeAnimation(QWidget):
         # Initial font size, will be animated
         self.welcome_label.setFont(QFont("Segoe UI", 150, QFont.Bold))
         self.welcome_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.welcome_label.setStyleSheet("color: #2c3e50;") # Darker text for welcome
+        self.welcome_label.setObjectName("titleLabel") # Darker text for welcome
 
-        self.continue_button = QPushButton("Continue")
+        self.continue_button = QPushButton("Loading...")
+        self.continue_button.setEnabled(False) # Until set_ready(): the save is still loading
         self.continue_button.setVisible(False)
         self.continue_button.clicked.connect(self.request_game_start)
         self.continue_button.setFixedSize(250, 60) # Larger button
@@ -224,6 +367,11 @@ class WelcomeAnimation(QWidget):
         self.layout.addWidget(self.continue_button, alignment=Qt.AlignCenter)
         self.layout.addStretch()
 
+    def set_ready(self):
+        """Enables Continue once the game screen is built. The button may not be showing yet."""
+        self.continue_button.setText("Continue")
+        self.continue_button.setEnabled(True)
+
     def request_game_start(self):
         self.continue_button.setEnabled(False)
         self.game_requested.emit()
@@ -264,9 +412,13 @@ class WelcomeAnimation(QWidget):
 
 class ApplicationController(QMainWindow):
     """Main application window that controls the flow between the welcome screen and the game."""
-    def __init__(self, game_manager):
+    def __init__(self, load_game):
+        """load_game() returns the GameManager. It runs on the game executor while the welcome screen plays."""
         super().__init__()
-        self.game_manager = game_manager
+        self.game_manager = None # Set once the save has loaded
+        self.executor = GameActionExecutor(self) # The one thread GameManager actions run on
+        self.executor.submit(self._construct_game_manager, load_game,
+                             on_done=self._on_game_loaded, on_error=self._on_load_failed)
 
         self.setWindowTitle("Self-Improvement RPG")
         # Set the application to start in full screen
@@ -280,13 +432,91 @@ class ApplicationController(QMainWindow):
         self.game_gui = None  # Lazy initialization
 
         self.stacked_widget.addWidget(self.welcome_screen)
+        startup_profiler.watch_first_paint(self.welcome_screen, 'welcome first paint')
 
         self.welcome_screen.game_requested.connect(self.transition_to_game)
+
+        if tracing.is_enabled():
+            self.trace_shortcut = QShortcut(QKeySequence("Ctrl+Shift+T"), self)
+            self.trace_shortcut.activated.connect(self._dump_trace)
+
+        self.memory_session = memory_snapshots.SnapshotSession(None) # Counts game objects once loaded
+        self.memory_shortcut = QShortcut(QKeySequence("Ctrl+Shift+M"), self)
+        self.memory_shortcut.activated.connect(self._take_memory_snapshot)
+
+        self.profile_capture = ProfileCapture(executor=self.executor)
+        self.profile_shortcut = QShortcut(QKeySequence("Ctrl+Shift+P"), self)
+        self.profile_shortcut.activated.connect(self._toggle_profiling)
         
         self.show()
         QTimer.singleShot(100, self.welcome_screen.start_animation)
 
+    def _construct_game_manager(self, load_game):
+        with startup_profiler.phase('GameManager construction'):
+            return load_game()
+
+    def _on_game_loaded(self, game_manager):
+        self.game_manager = game_manager
+        self.memory_session.game_manager = game_manager
+        QTimer.singleShot(0, self._build_game_gui) # Let the animation draw a frame first
+
+    def _on_load_failed(self, error):
+        QMessageBox.critical(self, "Load Failed", f"The game could not be loaded: {error}")
+        QApplication.instance().quit()
+
+    def _build_game_gui(self):
+        # Built behind the welcome screen; the first tabs follow in slices so the animation keeps running
+        with startup_profiler.phase('GameGUI construction'):
+            self.game_gui = GameGUI(self.game_manager, self.executor)
+        self.stacked_widget.addWidget(self.game_gui)
+        self.game_gui.prebuild_tabs(PREBUILT_TABS, on_done=self._on_game_ready)
+
+    def _on_game_ready(self):
+        self.welcome_screen.set_ready()
+        # Cold start ends here; the game screen only paints once the player clicks Continue
+        startup_profiler.mark('game ready')
+        startup_profiler.finish()
+
+    def save_game(self):
+        """Queues a save behind any pending actions. Nothing to save until the game has loaded."""
+        if self.game_manager is not None:
+            self.executor.submit(self.game_manager.save_game)
+
+    def _dump_trace(self):
+        try:
+            path = tracing.dump()
+        except OSError as e:
+            QMessageBox.warning(self, "Trace", f"Could not write the trace: {e}")
+            return
+        QMessageBox.information(self, "Trace", f"Recent activity was saved to:\n{path}")
+
+    def _take_memory_snapshot(self):
+        try:
+            message, report_path = self.memory_session.snapshot()
+        except OSError as e:
+            QMessageBox.warning(self, "Memory Snapshot", f"Could not write the snapshot: {e}")
+            return
+        if report_path:
+            message += f"\nFull report:\n{report_path}"
+        QMessageBox.information(self, "Memory Snapshot", message)
+
+    def _toggle_profiling(self):
+        if not self.profile_capture.running:
+            self.profile_capture.start()
+            self.setWindowTitle("Self-Improvement RPG [profiling]")
+            return
+        self.setWindowTitle("Self-Improvement RPG")
+        # The files are written once the executor has finished the actions already queued
+        self.profile_capture.stop(on_done=self._on_profile_saved, on_error=self._on_profile_failed)
+
+    def _on_profile_saved(self, stats_path, summary_path):
+        QMessageBox.information(self, "Profiling", f"Profile saved to:\n{stats_path}\n\nSummary:\n{summary_path}")
+
+    def _on_profile_failed(self, error):
+        QMessageBox.warning(self, "Profiling", f"Could not write the profile: {error}")
+
     def transition_to_game(self):
+        startup_profiler.watch_first_paint(self.game_gui, 'game first paint after Continue', from_now=True)
         # Fade out the window
         self.fade_anim_out = QPropertyAnimation(self, b"windowOpacity")
         self.fade_anim_out.setDuration(700)
@@ -296,17 +526,14 @@ class ApplicationController(QMainWindow):
         self.fade_anim_out.start()
 
     def setup_and_show_game(self):
-        # Once faded out, swap the widget and fade back in
-        if self.game_gui is None:
-            self.game_gui = GameGUI(self.game_manager)
-            self.stacked_widget.addWidget(self.game_gui)
-        
+        # Once faded out, swap the widget (built while the welcome screen played) and fade back in
         self.stacked_widget.setCurrentWidget(self.game_gui)
 
         self.fade_anim_in = QPropertyAnimation(self, b"windowOpacity")
         self.fade_anim_in.setDuration(700)
         self.fade_anim_in.setStartValue(0.0)
         self.fade_anim_in.setEndValue(1.0)
+        self.fade_anim_in.finished.connect(self.game_gui.show_startup_messages)
         self.fade_anim_in.start()
 
 class CustomPunishmentDialog(QDialog):
@@ -351,12 +578,139 @@ class CustomPunishmentDialog(QDialog):
             'custom': True
         }
 
+
+class AchievementCard(QFrame):
+    """Card for one achievement. Built once; set_state() only touches what changed."""
+    def __init__(self, achievement, parent=None):
+        super().__init__(parent)
+        self.setObjectName("achievementCard")
+        self.setProperty("locked", True) # Set before the first polish; most achievements start locked
+        self.achievement_name = achievement['name']
+        self._state = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10) # Padding inside card
+
+        self.name_label = QLabel(objectName="achievementName")
+        self.name_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        desc_label = QLabel(achievement['description'], objectName="achievementDescription")
+        desc_label.setWordWrap(True)
+        desc_label.setFont(QFont("Segoe UI", 9))
+        reward_label = QLabel(f"<i>Reward: {achievement['reward_text']}</i>", objectName="achievementReward")
+        reward_label.setWordWrap(True)
+        reward_label.setFont(QFont("Segoe UI", 9))
+        self.progress_bar = QProgressBar(objectName="achievementProgress")
+        self.progress_bar.setFormat("%v / %m")
+        self.progress_bar.setVisible(False)
+
+        layout.addWidget(self.name_label); layout.addWidget(desc_label); layout.addWidget(reward_label)
+        layout.addWidget(self.progress_bar)
+
+    def set_state(self, unlocked, progress):
+        """progress is (current, target), or None for achievements without a measurable goal."""
+        if (unlocked, progress) == self._state:
+            return
+        if self._state is None or unlocked != self._state[0]:
+            self.name_label.setText(f"<b>{'🏆' if unlocked else '🔒'} {self.achievement_name}</b>")
+            set_style_property(self, "locked", not unlocked)
+        self._state = (unlocked, progress)
+        self.progress_bar.setVisible(not unlocked and progress is not None) # The bar is only shown while locked
+        if progress is not None:
+            current, target = progress
+            self.progress_bar.setRange(0, target)
+            self.progress_bar.setValue(current)
+
+def set_style_property(widget, name, value):
+    """Sets a dynamic property GLOBAL_STYLESHEET selects on, repolishing the widget and its children only if it changed."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    for target in [widget] + widget.findChildren(QWidget): # Descendant selectors depend on the property too
+        style.unpolish(target)
+        style.polish(target)
+    widget.update()
+
+
+def tab_update(tab_name):
+    """Marks a GameGUI update routine that only runs once its tab's widgets have been built."""
+    def decorator(method):
+        max_args = method.__code__.co_argcount - 1 # Signals may pass arguments the routine doesn't take
+
+        @wraps(method)
+        def wrapper(self, *args):
+            if tab_name not in self._built_tabs:
+                return None
+            return method(self, *args[:max_args])
+        return wrapper
+    return decorator
+
+
+def reads_game_state(method):
+    """
+    Marks a GameGUI handler that reads live GameManager state. While the executor is busy the
+    worker may be changing that state, so the call is skipped and the handler runs again,
+    without arguments, once the executor goes idle.
+    """
+    max_args = method.__code__.co_argcount - 1 # Signals may pass arguments the handler doesn't take
+
+    @wraps(method)
+    def wrapper(self, *args):
+        if self.executor.busy:
+            self._deferred_reads[method.__name__] = None # Dict as an ordered set; one rerun per handler
+            return None
+        return method(self, *args[:max_args])
+    return wrapper
+
+
+# (tab title, builder method, attribute the builder stores the tab widget in), in display order
+TAB_SPECS = [
+    ("Player & Skills", '_create_player_tab', 'player_tab'),
+    ("Quests", '_create_quests_tab', 'quests_tab'),
+    ("Pets", '_create_pets_tab', 'pets_tab'),
+    ("Shop", '_create_shop_tab', 'shop_tab'),
+    ("Forge", '_create_forge_tab', 'forge_tab'),
+    ("Punishments", '_create_punishments_tab', 'punishments_tab'),
+    ("Achievements", '_create_achievements_tab', 'achievements_tab'),
+    ("Transcend", '_create_transcend_tab', 'transcend_tab'),
+    ("Exit", '_create_exit_tab', 'exit_tab'),
+]
+PREBUILT_TABS = ["Player & Skills", "Quests"] # Built during the welcome screen; the rest on first use
+
+# Panels kept current by GameManager change events: (tab title, or None for the stats panel above
+# the tabs, refresh method, change topics it shows). Panels on hidden tabs catch up when shown.
+PANELS = [
+    (None, '_update_arc_display', {'buffs'}),
+    (None, '_update_player_stats_display', {'xp', 'coins', 'titles', 'buffs', 'stats'}),
+    ("Player & Skills", '_update_player_status', {'stats', 'titles'}),
+    ("Player & Skills", '_update_gear_display', {'inventory', 'gear'}),
+    ("Player & Skills", '_update_combined_stat_boosts', {'gear'}),
+    ("Player & Skills", '_update_skills_chart', {'skills'}),
+    ("Quests", '_update_quests_display', {'quests'}),
+    ("Quests", '_update_daily_tasks_display', {'daily_tasks'}),
+    ("Pets", '_update_pets_display', {'pets'}),
+    ("Shop", '_update_shop_display', {'coins'}), # Cards are built once; coins only change affordability
+    ("Forge", '_update_forge_display', {'inventory', 'gear'}),
+    ("Punishments", '_update_punishments_display', {'punishments'}),
+    ("Achievements", '_update_achievements_display', {'achievements', 'quests', 'coins', 'pets', 'skills', # Progress bars
+                                                      'inventory', 'gear', 'daily_tasks', 'stats'}),
+    ("Transcend", '_update_transcend_display', {'xp', 'stats'}),
+]
+
+
 class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the controller
-    def __init__(self, game_manager):
+    game_changed = pyqtSignal(object) # frozenset of GameManager change topics
+
+    def __init__(self, game_manager, executor=None):
         super().__init__()
         self.game_manager = game_manager
+        self.executor = executor or GameActionExecutor(self) # Runs every GameManager action off the GUI thread
+        self._deferred_topics = set() # Change topics that arrived while actions were still queued
+        self._deferred_reads = {} # Names of @reads_game_state handlers skipped while actions were queued
         self._block_daily_task_signal = False
         self.shopping_cart = {} # For the shop cart
+        self._shop_cards = [] # (cost, cost label, add button) per shop card
+        self._shop_catalog_version = None # Catalog the cards were built from
+        self.scheduler = DeadlineScheduler(self) # Clock, arc and countdown updates
 
         # Create a QScrollArea to make the entire content scrollable
         self.scroll_area = QScrollArea(self)
@@ -371,27 +725,56 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         self.main_layout.setContentsMargins(20, 20, 20, 20) # Add overall padding
 
 
-        self._create_time_section()
+        with startup_profiler.phase('gui: time section'):
+            self._create_time_section()
         self.main_layout.addWidget(self.time_frame)
 
-        self._create_player_stats_widget()
+        with startup_profiler.phase('gui: stats widget'):
+            self._create_player_stats_widget()
         self.main_layout.addWidget(self.stats_frame)
 
-        self._create_tab_widget()
+        with startup_profiler.phase('gui: tabs'):
+            self._create_tab_widget()
         self.main_layout.addWidget(self.tab_widget)
 
-        if self.game_manager.daily_check_message:
-            QMessageBox.information(self, "Daily Report", self.game_manager.daily_check_message)
+        with startup_profiler.phase('gui: initial refresh'):
+            self._update_all_displays()
 
-        overdue_message = self.game_manager.check_overdue_quests()
-        if overdue_message:
-            QMessageBox.warning(self, "Overdue Quests", overdue_message)
+        # From here on panels refresh only when an action changes what they show
+        self._change_listener = self.game_changed.emit
+        self.game_changed.connect(self._on_game_changed)
+        self.game_manager.add_change_listener(self._change_listener)
+        self.destroyed.connect(partial(self.game_manager.remove_change_listener, self._change_listener))
+        self.executor.idle.connect(self._apply_deferred_changes)
 
-        self._update_all_displays()
+        # Time-based labels each wake the app only when their text next changes
+        self.scheduler.add('clock', self._tick_clock)
+        self.scheduler.add('arc', self._tick_arc)
+        self.scheduler.add('countdowns', self._tick_countdowns)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_timers)
-        self.timer.start(1000)
+    def show_startup_messages(self):
+        """The daily report and overdue quests from loading the save, shown once the game is on screen."""
+        if self.game_manager.daily_check_message:
+            QMessageBox.information(self, "Daily Report", self.game_manager.daily_check_message)
+        if self.game_manager.overdue_check_message:
+            QMessageBox.warning(self, "Overdue Quests", self.game_manager.overdue_check_message)
+        # More quests may have fallen due while the welcome screen waited for Continue
+        self._run_action(self.game_manager.check_overdue_quests,
+                         on_done=lambda message: message and QMessageBox.warning(self, "Overdue Quests", message))
+
+    def prebuild_tabs(self, tab_names, on_done=None):
+        """Builds and fills the named tabs one per event loop pass, then calls on_done()."""
+        QTimer.singleShot(0, partial(self._prebuild_next_tab, list(tab_names), on_done))
+
+    def _prebuild_next_tab(self, pending, on_done):
+        if not pending:
+            if on_done:
+                on_done()
+            return
+        tab_name = pending.pop(0)
+        self._ensure_tab_built(tab_name)
+        self._refresh_stale_panels(tab_name)
+        QTimer.singleShot(0, partial(self._prebuild_next_tab, pending, on_done))
 
     def _create_time_section(self):
         self.time_frame = QFrame(self)
@@ -403,7 +786,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         self.arc_label = QLabel()
         self.arc_quote_label = QLabel() # New label for the arc quote
         self.arc_quote_label.setWordWrap(True) # Ensure quote wraps
-        self.arc_quote_label.setStyleSheet("font-style: italic; color: #555555;") # Style quote
+        self.arc_quote_label.setObjectName("quoteLabel") # Style quote
 
         # Set specific fonts for time/date/arc for better visual hierarchy
         font_large = QFont("Segoe UI", 12)
@@ -423,18 +806,35 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         time_layout.addWidget(self.arc_quote_label, 1) # Give quote more space
         time_layout.addStretch(1)
 
-    def _update_timers(self):
+    def _tick_clock(self):
         now = QDateTime.currentDateTime()
-        self.date_label.setText(f"🗓️ {now.toString('yyyy-MM-dd')}")
+        date_text = f"🗓️ {now.toString('yyyy-MM-dd')}"
+        if date_text != self.date_label.text():
+            self.date_label.setText(date_text)
         self.time_label.setText(f"⏰ {now.toString('hh:mm:ss AP')}")
+        return (1000 - now.time().msec()) / 1000 # Next whole second
+
+    def _tick_arc(self):
+        if self.executor.busy:
+            return None # Re-run once the executor is idle
         arc_info = self.game_manager.get_current_arc_info()
         self.arc_label.setText(f"✨ Arc: {arc_info['name']} | Ends: {arc_info['end_date']}")
         self.arc_quote_label.setText(f"<i>\"{arc_info['quote']}\"</i>") # Display the quote
-        if self.tab_widget.tabText(self.tab_widget.currentIndex()) == "Quests":
-            self._update_quest_timers_text()
-        # The animation is now handled in _update_transcend_display, no need for separate timer call here.
-        # if self.tab_widget.tabText(self.tab_widget.currentIndex()) == "Transcend":
-        #     self._animate_transcend_title() # This line was causing the crash
+        return (self.game_manager.get_arc_change_time() - datetime.datetime.now()).total_seconds()
+
+    def _update_arc_display(self):
+        self.scheduler.run_now('arc') # A transcendence buff starts or ends a Transcendent Surge
+
+    def _tick_countdowns(self):
+        """Countdowns only exist on the Quests and Pets tabs; elsewhere this sleeps until a tab change."""
+        if self.executor.busy:
+            return None # Re-run once the executor is idle
+        current_tab = self.tab_widget.tabText(self.tab_widget.currentIndex())
+        if current_tab == "Quests":
+            return self._update_quest_timers_text()
+        if current_tab == "Pets":
+            return self._update_pet_cooldowns_text()
+        return None
 
     def _create_player_stats_widget(self):
         self.stats_frame = QFrame(self)
@@ -460,7 +860,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
                        self.punishment_label, self.sanity_label, self.daily_tasks_completed_label,
                        self.xp_boost_label, self.coin_multiplier_label, self.punishment_mitigation_label]:
             label.setFont(font_bold)
-            label.setStyleSheet("color: #2c3e50;") # Darker color for stats
+            label.setObjectName("statLabel") # Darker color for stats
 
         stats_layout.addWidget(self.title_label, 0, 0)
         stats_layout.addWidget(self.level_label, 0, 1)
@@ -487,42 +887,79 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         self.daily_tasks_completed_label.setText(f"✔️ <b>Daily Actions:</b> {player.daily_tasks_completed}")
 
     def _create_tab_widget(self):
+        # Tabs start as empty placeholders and are built the first time they're shown
         self.tab_widget = QTabWidget(self)
-        self._create_player_tab()
-        self._create_quests_tab()
-        self._create_pets_tab()
-        self._create_shop_tab()
-        self._create_forge_tab()
-        self._create_punishments_tab()
-        self._create_achievements_tab()
-        self._create_transcend_tab()
-        self._create_exit_tab() # Add the new exit tab
-
-        self.tab_widget.addTab(self.player_tab, "Player & Skills")
-        self.tab_widget.addTab(self.quests_tab, "Quests")
-        self.tab_widget.addTab(self.pets_tab, "Pets")
-        self.tab_widget.addTab(self.shop_tab, "Shop")
-        self.tab_widget.addTab(self.forge_tab, "Forge")
-        self.tab_widget.addTab(self.punishments_tab, "Punishments")
-        self.tab_widget.addTab(self.achievements_tab, "Achievements")
-        self.tab_widget.addTab(self.transcend_tab, "Transcend")
-        self.tab_widget.addTab(self.exit_tab, "Exit") # Add exit tab to the tab widget
+        self._built_tabs = set()
+        self._stale_panels = set() # Refresh methods whose data changed while their tab was hidden
+        self._tab_placeholders = {}
+        for title, _, _ in TAB_SPECS:
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            self._tab_placeholders[title] = placeholder
+            self.tab_widget.addTab(placeholder, title)
 
         self.tab_widget.currentChanged.connect(self._on_tab_change)
 
-    def _on_tab_change(self, index):
-        tab_name = self.tab_widget.tabText(index)
-        if tab_name == "Player & Skills": self._update_player_tab()
-        elif tab_name == "Quests": self._update_quests_display()
-        elif tab_name == "Pets": self._update_pets_display()
-        elif tab_name == "Shop": self._update_shop_display()
-        elif tab_name == "Forge": self._update_forge_display()
-        elif tab_name == "Punishments": self._update_punishments_display()
-        elif tab_name == "Achievements": self._update_achievements_display()
-        elif tab_name == "Transcend": self._update_transcend_display()
-        # No specific update needed for Exit tab, but it's good to have it here for completeness
+    def _ensure_tab_built(self, tab_name):
+        """Builds a tab's widgets into its placeholder on first use."""
+        if tab_name in self._built_tabs or tab_name not in self._tab_placeholders:
+            return
+        _, builder, attribute = next(spec for spec in TAB_SPECS if spec[0] == tab_name)
+        with startup_profiler.phase(f'tab: {tab_name}'):
+            getattr(self, builder)()
+            self._tab_placeholders[tab_name].layout().addWidget(getattr(self, attribute))
+        self._built_tabs.add(tab_name)
+        self._stale_panels.update(method for tab, method, _ in PANELS if tab == tab_name)
 
-        self._update_player_stats_display()
+    def _on_tab_change(self, index):
+        self._ensure_tab_built(self.tab_widget.tabText(index))
+        self._refresh_stale_panels()
+        # After the page is shown and laid out, so the countdowns on screen are known
+        QTimer.singleShot(0, lambda: self.scheduler.run_now('countdowns'))
+
+    def _refresh_stale_panels(self, tab_name=None):
+        """Catches up a tab's panels (the current tab's by default) whose data changed while they were hidden."""
+        if self.executor.busy:
+            return # Done by _apply_deferred_changes once the queued actions have finished
+        tab_name = tab_name or self.tab_widget.tabText(self.tab_widget.currentIndex())
+        for tab, method, _ in PANELS:
+            if tab == tab_name and method in self._stale_panels:
+                self._stale_panels.discard(method)
+                getattr(self, method)()
+
+    def _on_game_changed(self, topics):
+        """Refreshes the visible panels showing what an action changed and marks hidden ones stale."""
+        if self.executor.busy:
+            # GameManager may be part way through the next queued action, so wait until it's idle
+            self._deferred_topics |= topics
+            return
+        current_tab = self.tab_widget.tabText(self.tab_widget.currentIndex())
+        for tab, method, panel_topics in PANELS:
+            if not topics & panel_topics:
+                continue
+            if tab is None or tab == current_tab:
+                getattr(self, method)()
+            elif tab in self._built_tabs: # Unbuilt tabs get a full refresh when first shown anyway
+                self._stale_panels.add(method)
+
+    def _apply_deferred_changes(self):
+        """Runs when the executor goes idle: catches the panels up with everything the queued actions changed."""
+        topics, self._deferred_topics = frozenset(self._deferred_topics), set()
+        if topics:
+            self._on_game_changed(topics)
+        self._refresh_stale_panels()
+        self.scheduler.run_now('arc', 'countdowns')
+        reads, self._deferred_reads = self._deferred_reads, {}
+        for name in reads:
+            getattr(self, name)()
+
+    def _run_action(self, func, *args, on_done=None, **kwargs):
+        """Queues a GameManager call on the executor. on_done(result) runs after the panels show its changes."""
+        self.executor.submit(func, *args, on_done=on_done, on_error=self._on_action_failed, **kwargs)
+
+    def _on_action_failed(self, error):
+        QMessageBox.warning(self, "Action Failed", f"Something went wrong: {error}")
 
     def _create_player_tab(self):
         self.player_tab = QWidget()
@@ -577,6 +1014,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         gear_layout = QVBoxLayout(gear_box)
         gear_layout.addWidget(QLabel("<b>🛡️ Equipped Gear</b>", objectName="headerLabel"))
         self.gear_display_layout = QGridLayout()
+        self._gear_item_labels = {} # Slot -> item QLabel, created on the first refresh
         gear_layout.addLayout(self.gear_display_layout)
 
         unequip_layout = QHBoxLayout()
@@ -588,11 +1026,17 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         unequip_layout.addWidget(self.unequip_button)
         gear_layout.addLayout(unequip_layout)
 
-        self.inventory_list = QListWidget()
-        self.inventory_list.itemDoubleClicked.connect(self._equip_item_from_inventory)
-        self.inventory_list.itemClicked.connect(self._show_inventory_item_details)
+        self.inventory_model = GearListModel(lambda: self.game_manager.player.inventory, self)
+        inventory_filter = TextFilterModel(self.inventory_model, self)
+        self.inventory_list = ModelListView(inventory_filter, "Inventory is empty.")
+        self.inventory_list.doubleClicked.connect(self._equip_item_from_inventory)
+        self.inventory_list.clicked.connect(self._show_inventory_item_details)
+        self.inventory_search_input = QLineEdit()
+        self.inventory_search_input.setPlaceholderText("Filter inventory...")
+        self.inventory_search_input.textChanged.connect(inventory_filter.set_search)
 
         gear_layout.addWidget(QLabel("<b>Inventory (Double-click to equip)</b>", objectName="headerLabel"))
+        gear_layout.addWidget(self.inventory_search_input)
         gear_layout.addWidget(self.inventory_list)
 
         self.inventory_item_buffs_label = QLabel("Click an item for details.")
@@ -627,7 +1071,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
                       self.combined_intellect_boost_label, self.combined_faith_boost_label,
                       self.combined_corruption_reduction_label, self.combined_daily_streak_chance_label]:
             label.setFont(QFont("Segoe UI", 9)) # Slightly smaller font for details
-            label.setStyleSheet("color: #555555;")
+            label.setObjectName("detailLabel")
 
         combined_stats_layout.addWidget(self.combined_xp_boost_label)
         combined_stats_layout.addWidget(self.combined_coin_boost_label)
@@ -642,10 +1086,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
 
         right_layout.addWidget(combined_stats_box)
 
-        self.skills_figure, self.skills_ax = plt.subplots()
-        self.skills_canvas = FigureCanvasQTAgg(self.skills_figure)
-        self.skills_figure.patch.set_facecolor('#f0f2f5') # Match background
-        self.skills_ax.set_facecolor('#f0f2f5') # Match background
+        self.skills_chart = skills_chart.SkillsChart() # QPainter donut of core and custom skills
 
         add_skill_layout = QHBoxLayout()
         self.new_skill_input = QLineEdit()
@@ -657,13 +1098,21 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         add_skill_layout.addWidget(self.add_skill_button)
 
         right_layout.addWidget(QLabel("<b>⭐ Skills Distribution</b>", objectName="headerLabel"))
-        right_layout.addWidget(self.skills_canvas)
+        right_layout.addWidget(self.skills_chart)
         right_layout.addLayout(add_skill_layout)
 
         main_layout.addWidget(left_widget, 1)
         main_layout.addWidget(right_widget, 1)
 
+    @tab_update("Player & Skills")
     def _update_player_tab(self):
+        self._update_player_status()
+        self._update_gear_display()
+        self._update_skills_chart()
+        self._update_combined_stat_boosts()
+
+    @tab_update("Player & Skills")
+    def _update_player_status(self):
         player = self.game_manager.player
         effective_corruption = self.game_manager.get_effective_corruption()
         self.streak_label.setText(f"{player.daily_streak} Days")
@@ -678,73 +1127,58 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         self.titles_combo_box.blockSignals(False)
         self._update_title_effect_display()
 
-        self._update_gear_display()
-        self._update_skills_chart()
-        self.inventory_item_buffs_label.setText("Click an item for details.")
-        self._update_combined_stat_boosts()
-
 
+    @tab_update("Player & Skills")
     def _update_title_effect_display(self):
         title_name = self.titles_combo_box.currentText()
         effect_data = next((t for t in self.game_manager.get_title_effects() if t['name'] == title_name), None)
         self.title_effect_label.setText(f"<b>Effect:</b> {effect_data['effect']}" if effect_data else "<b>Effect:</b> None")
 
     def _set_active_title(self, title_name):
-        self.game_manager.set_active_title(title_name)
-        self._update_player_tab()
-        self._update_player_stats_display()
+        self._run_action(self.game_manager.set_active_title, title_name)
 
+    @tab_update("Player & Skills")
     def _update_gear_display(self):
-        for i in reversed(range(self.gear_display_layout.count())):
-            self.gear_display_layout.itemAt(i).widget().setParent(None)
-
         player_gear = self.game_manager.player.gear
-        row = 0
         self.unequip_combo_box.clear()
         self.unequip_button.setEnabled(False)
 
+        # The slots are fixed, so their labels are built once and only their text and color are updated
         for slot, item in player_gear.items():
-            slot_label = QLabel(f"<b>{slot}:</b>")
-            item_name = item['name'] if item else "Empty"
-            item_label = QLabel(item_name)
-            if item and item.get('transcended'):
-                item_label.setStyleSheet("color: purple; font-weight: bold;")
-            else:
-                item_label.setStyleSheet("")
-            self.gear_display_layout.addWidget(slot_label, row, 0)
-            self.gear_display_layout.addWidget(item_label, row, 1)
-            row += 1
+            item_label = self._gear_item_labels.get(slot)
+            if item_label is None:
+                row = len(self._gear_item_labels)
+                item_label = self._gear_item_labels[slot] = QLabel(objectName="gearItemLabel")
+                item_label.setProperty("transcended", False) # Set before the first polish
+                self.gear_display_layout.addWidget(QLabel(f"<b>{slot}:</b>"), row, 0)
+                self.gear_display_layout.addWidget(item_label, row, 1)
+            item_label.setText(item['name'] if item else "Empty")
+            set_style_property(item_label, "transcended", bool(item and item.get('transcended')))
             if item: # Only add to unequip combo if there's an item
                 self.unequip_combo_box.addItem(slot)
                 self.unequip_button.setEnabled(True)
 
-        self.inventory_list.clear()
-        if not self.game_manager.player.inventory:
-            self.inventory_list.addItem("Inventory is empty.")
-        else:
-            for item in self.game_manager.player.inventory:
-                list_item = QListWidgetItem(f"{item['name']} ({item['type']})")
-                if item.get('transcended'):
-                    list_item.setForeground(QColor('purple'))
-                list_item.setData(Qt.UserRole, item)
-                self.inventory_list.addItem(list_item)
+        self.inventory_model.sync()
+        self.inventory_list.clearSelection()
+        self.inventory_item_buffs_label.setText("Click an item for details.")
 
     def _equip_item_from_inventory(self, item):
         item_data = item.data(Qt.UserRole)
-        message = self.game_manager.equip_gear(item_data['name'])
-        QMessageBox.information(self, "Equip Gear", message)
-        self._update_player_tab()
+        self._run_action(self.game_manager.equip_gear, item_data['name'],
+                         on_done=partial(QMessageBox.information, self, "Equip Gear"))
 
     def _unequip_selected_gear(self):
         selected_slot = self.unequip_combo_box.currentText()
         if selected_slot:
-            message = self.game_manager.unequip_gear(selected_slot)
-            QMessageBox.information(self, "Unequip Gear", message)
-            self._update_player_tab()
+            self._run_action(self.game_manager.unequip_gear, selected_slot,
+                             on_done=partial(QMessageBox.information, self, "Unequip Gear"))
         else:
             QMessageBox.warning(self, "No Slot Selected", "Please select a gear slot to unequip from.")
 
-    def _show_inventory_item_details(self, item):
+    @reads_game_state
+    def _show_inventory_item_details(self, item=None):
+        if item is None: # Rerun after the executor went idle
+            item = self.inventory_list.currentIndex()
         item_data = item.data(Qt.UserRole)
         if item_data:
             details = f"<b>{item_data['name']} ({item_data['type']})</b><br>"
@@ -784,6 +1218,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
             self.inventory_item_buffs_label.setText("Click an item for details.")
 
 
+    @tab_update("Player & Skills")
     def _update_combined_stat_boosts(self):
         # Initialize all potential buff types
         xp_gain_buff = self.game_manager._get_gear_buff('xp_gain')
@@ -836,50 +1271,17 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
             QMessageBox.warning(self, "Error", "Skill name cannot be empty.")
             return
 
-        if self.game_manager.add_new_skill(skill_name):
+        self._run_action(self.game_manager.add_new_skill, skill_name, on_done=self._on_skill_added)
+
+    def _on_skill_added(self, added):
+        if added:
             self.new_skill_input.clear()
-            self._update_skills_chart()
         else:
             QMessageBox.warning(self, "Error", "Could not add skill. It may already exist.")
 
+    @tab_update("Player & Skills")
     def _update_skills_chart(self):
-        skills = self.game_manager.player.skills
-        self.skills_ax.clear()
-
-        desired_skills = ["Strength", "Endurance", "Durability", "Intellect", "Faith"]
-        labels_for_pie = []
-        values = []
-
-        for skill_name in desired_skills:
-            if skill_name in skills and skills[skill_name]['xp'] > 0:
-                labels_for_pie.append(skill_name)
-                values.append(skills[skill_name]['xp'])
-
-        if not values:
-            self.skills_ax.text(0.5, 0.5, "No XP in core skills.", ha='center', va='center', transform=self.skills_ax.transAxes)
-            self.skills_canvas.draw()
-            return
-
-        total_xp = sum(values)
-        if total_xp == 0:
-            self.skills_ax.text(0.5, 0.5, "No XP in core skills.", ha='center', va='center', transform=self.skills_ax.transAxes)
-            self.skills_canvas.draw()
-            return
-
-        formatted_labels = [f"{label}: {val} ({(val/total_xp)*100:.1f}%)" for label, val in zip(labels_for_pie, values)]
-        colors = ['#8A2BE2', '#66CDAA', '#1E90FF', '#FF69B4', '#FFD700'] # Consistent color scheme
-
-        wedges, texts = self.skills_ax.pie(values,
-                                           labels=formatted_labels,
-                                           autopct=None,
-                                           startangle=90,
-                                           wedgeprops=dict(width=0.3),
-                                           colors=colors,
-                                           labeldistance=1.05)
-        self.skills_ax.text(0, 0, f"{total_xp}", ha='center', va='center', fontsize=24, color='#333333') # Total XP in center
-        self.skills_ax.axis('equal')
-        self.skills_figure.tight_layout()
-        self.skills_canvas.draw()
+        self.skills_chart.set_skills(self.game_manager.player.skills)
 
     # --- QUESTS TAB (REVAMPED) ---
     def _create_quests_tab(self):
@@ -903,6 +1305,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         daily_tasks_layout = QVBoxLayout(daily_tasks_box)
         daily_tasks_layout.addWidget(QLabel("<b>✔️ Daily Tasks:</b>", objectName="headerLabel"))
         self.daily_tasks_list_layout = QVBoxLayout()
+        self._daily_task_checkboxes = {} # Task name -> QCheckBox, created on the first refresh
         daily_tasks_layout.addLayout(self.daily_tasks_list_layout)
         left_layout.addWidget(daily_tasks_box)
 
@@ -1004,10 +1407,17 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         left_layout.addWidget(generation_box)
         
         # --- Quest Lists ---
-        self.main_quests_list = QListWidget()
-        self.side_quests_list = QListWidget()
-        self.main_quests_list.itemSelectionChanged.connect(self._show_quest_details)
-        self.side_quests_list.itemSelectionChanged.connect(self._show_quest_details)
+        # One model over player.quests, split into main and side quests by filter proxies
+        self.quests_model = QuestListModel(lambda: self.game_manager.player.quests, self)
+        self.main_quests_list = ModelListView(QuestTypeFilterModel(self.quests_model, side=False, parent=self),
+                                              "No active main quests.")
+        self.side_quests_list = ModelListView(QuestTypeFilterModel(self.quests_model, side=True, parent=self),
+                                              "No active side quests.")
+        self.main_quests_list.selection_changed.connect(self._show_quest_details)
+        self.side_quests_list.selection_changed.connect(self._show_quest_details)
+        # Scrolling brings other countdowns on screen, which may tick sooner
+        self.main_quests_list.verticalScrollBar().valueChanged.connect(lambda *_: self.scheduler.run_now('countdowns'))
+        self.side_quests_list.verticalScrollBar().valueChanged.connect(lambda *_: self.scheduler.run_now('countdowns'))
 
         self.main_quests_label = QLabel(f"<b>🎯 Main Quests (Last Workout: {self.game_manager.player.last_workout_type or 'None'})</b>")
         self.main_quests_label.setObjectName("headerLabel") # Apply header style
@@ -1079,6 +1489,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
             # Could add a check for project name to enable button
             self.generate_quest_button.setEnabled(True) # For now, enable it
 
+    @tab_update("Quests")
     def _update_training_quest_ui(self):
         """Shows/hides training-specific widgets and enables/disables the generate button."""
         training_part = self.quest_training_part_combo.currentText()
@@ -1143,78 +1554,48 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
             if not details['project_name']:
                  QMessageBox.warning(self, "Input Needed", "Please provide a project name."); return
 
-        message = self.game_manager.generate_quest(category, details=details)
+        self._run_action(self.game_manager.generate_quest, category, details=details,
+                         on_done=self._on_main_quest_generated)
+
+    def _on_main_quest_generated(self, message):
         if "Failed" in message or "There are no more variations" in message:
             QMessageBox.warning(self, "Quest Generation Failed", message)
         else:
             QMessageBox.information(self, "Quest Generation", message)
-        self._update_quests_display()
 
     def _generate_new_side_quest(self):
-        message = self.game_manager.generate_side_quest()
-        QMessageBox.information(self, "Side Quest Generation", message)
-        self._update_quests_display()
+        self._run_action(self.game_manager.generate_side_quest,
+                         on_done=partial(QMessageBox.information, self, "Side Quest Generation"))
 
+    @tab_update("Quests")
     def _update_quests_display(self):
-        self.main_quests_list.clear()
-        self.side_quests_list.clear()
-        quests = self.game_manager.get_available_quests()
-
         self.main_quests_label.setText(f"<b>🎯 Main Quests (Last Workout: {self.game_manager.player.last_workout_type or 'None'})</b>")
+        self.quests_model.sync()
+        self.scheduler.run_now('countdowns')
 
-        main_quests_exist = any(q.get('quest_type') != 'side' for q in quests)
-        side_quests_exist = any(q.get('quest_type') == 'side' for q in quests)
-
-        for quest in quests:
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, quest)
-            if quest.get('quest_type') == 'side': self.side_quests_list.addItem(item)
-            else: self.main_quests_list.addItem(item)
-
-        if not main_quests_exist: self.main_quests_list.addItem("No active main quests.")
-        if not side_quests_exist: self.side_quests_list.addItem("No active side quests.")
-        self._update_quest_timers_text()
-        self._update_daily_tasks_display() # Update daily tasks here
-
+    @tab_update("Quests")
     def _update_quest_timers_text(self):
-        now = datetime.datetime.now()
-        for list_widget in [self.main_quests_list, self.side_quests_list]:
-            for i in range(list_widget.count()):
-                item = list_widget.item(i)
-                quest_data = item.data(Qt.UserRole)
-                if not quest_data: continue
-                due_date_str = quest_data.get('due_date')
-                time_left_str = ""
-                if due_date_str:
-                    try:
-                        due_date = datetime.datetime.fromisoformat(due_date_str)
-                        time_left = due_date - now
-                        if time_left.total_seconds() < 0:
-                            time_left_str = " (Overdue)"; item.setForeground(QColor('red'))
-                        else:
-                            days, rem = divmod(time_left.total_seconds(), 86400)
-                            hours, rem = divmod(rem, 3600)
-                            minutes, _ = divmod(rem, 60)
-                            time_left_str = f" (Due: {int(days)}d {int(hours)}h {int(minutes)}m)"
-                            item.setForeground(QColor('#333333')) # Reset color if not overdue
-                    except (ValueError, TypeError): time_left_str = " (Invalid Date)"
-                item.setText(f"{quest_data['name']}{time_left_str}")
-
+        """Repaints the on-screen quest rows; returns the seconds until one of them changes."""
+        visible = []
+        for view in (self.main_quests_list, self.side_quests_list):
+            view.viewport().update()
+            visible.extend(view.visible_indexes())
+        return QuestListModel.seconds_to_next_change(visible)
+
+    @tab_update("Quests")
     def _update_daily_tasks_display(self):
-        # Clear existing checkboxes
-        for i in reversed(range(self.daily_tasks_list_layout.count())):
-            widget = self.daily_tasks_list_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
+        # The task list is fixed, so the checkboxes are built once and only their state is synced
+        if not self._daily_task_checkboxes:
+            for task_name in self.game_manager.daily_task_templates:
+                checkbox = QCheckBox(task_name)
+                checkbox.stateChanged.connect(partial(self._on_daily_task_checked, task_name))
+                self.daily_tasks_list_layout.addWidget(checkbox)
+                self._daily_task_checkboxes[task_name] = checkbox
 
         self._block_daily_task_signal = True # Block signals during update
-
-        for task_name in self.game_manager.daily_task_templates:
-            checkbox = QCheckBox(task_name)
+        for task_name, checkbox in self._daily_task_checkboxes.items():
             # Check if the task is already completed for today in player data
             checkbox.setChecked(self.game_manager.player.daily_tasks.get(task_name, False))
-            checkbox.stateChanged.connect(partial(self._on_daily_task_checked, task_name))
-            self.daily_tasks_list_layout.addWidget(checkbox)
         self._block_daily_task_signal = False # Re-enable signals
 
 
@@ -1222,19 +1603,17 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         if self._block_daily_task_signal: return # Prevent recursive calls
 
         is_complete = bool(state) # 0 for unchecked, 2 for checked
-        message = self.game_manager.complete_daily_task(task_name, is_complete)
-        if message:
-            QMessageBox.information(self, "Daily Task", message)
-        self._update_player_stats_display()
+        self._run_action(self.game_manager.complete_daily_task, task_name, is_complete,
+                         on_done=lambda message: message and QMessageBox.information(self, "Daily Task", message))
 
 
     def _show_quest_details(self):
         selected_item = None
-        if self.main_quests_list.selectedItems():
-            selected_item = self.main_quests_list.selectedItems()[0]
+        if self.main_quests_list.selected_indexes():
+            selected_item = self.main_quests_list.selected_indexes()[0]
             self.side_quests_list.clearSelection() # Clear other list's selection
-        elif self.side_quests_list.selectedItems():
-            selected_item = self.side_quests_list.selectedItems()[0]
+        elif self.side_quests_list.selected_indexes():
+            selected_item = self.side_quests_list.selected_indexes()[0]
             self.main_quests_list.clearSelection() # Clear other list's selection
 
         if selected_item and selected_item.data(Qt.UserRole):
@@ -1269,10 +1648,10 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
 
     def _complete_selected_quest(self):
         selected_item = None
-        if self.main_quests_list.selectedItems():
-            selected_item = self.main_quests_list.selectedItems()[0]
-        elif self.side_quests_list.selectedItems():
-            selected_item = self.side_quests_list.selectedItems()[0]
+        if self.main_quests_list.selected_indexes():
+            selected_item = self.main_quests_list.selected_indexes()[0]
+        elif self.side_quests_list.selected_indexes():
+            selected_item = self.side_quests_list.selected_indexes()[0]
 
         if selected_item and selected_item.data(Qt.UserRole):
             quest_data = selected_item.data(Qt.UserRole)
@@ -1281,34 +1660,34 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
                 return
 
             quest_name = quest_data['name']
-            message = self.game_manager.complete_quest(quest_name)
-            QMessageBox.information(self, "Quest Completion", message)
-            self.quest_details_panel.setVisible(False)
-            self._update_all_displays()
+            self._run_action(self.game_manager.complete_quest, quest_name,
+                             on_done=partial(self._on_quest_completed, "Quest Completion"))
         else:
             QMessageBox.warning(self, "No Quest Selected", "Please select a quest to complete.")
 
     def _confirm_endurance_quest_completion(self):
         selected_item = None
-        if self.main_quests_list.selectedItems():
-            selected_item = self.main_quests_list.selectedItems()[0]
-        elif self.side_quests_list.selectedItems():
-            selected_item = self.side_quests_list.selectedItems()[0]
+        if self.main_quests_list.selected_indexes():
+            selected_item = self.main_quests_list.selected_indexes()[0]
+        elif self.side_quests_list.selected_indexes():
+            selected_item = self.side_quests_list.selected_indexes()[0]
 
         if selected_item and selected_item.data(Qt.UserRole):
             quest_data = selected_item.data(Qt.UserRole)
             if quest_data.get('skill_reward', {}).get('skill') == 'Endurance':
                 completed_duration = self.details_duration_input.value()
                 quest_name = quest_data['name']
-                message = self.game_manager.complete_quest(quest_name, completed_duration=completed_duration)
-                QMessageBox.information(self, "Endurance Quest Completion", message)
-                self.quest_details_panel.setVisible(False)
-                self._update_all_displays()
+                self._run_action(self.game_manager.complete_quest, quest_name, completed_duration=completed_duration,
+                                 on_done=partial(self._on_quest_completed, "Endurance Quest Completion"))
             else:
                 QMessageBox.warning(self, "Invalid Quest Type", "This button is only for Endurance quests.")
         else:
             QMessageBox.warning(self, "No Quest Selected", "Please select an Endurance quest to complete.")
 
+    def _on_quest_completed(self, title, message):
+        QMessageBox.information(self, title, message)
+        self.quest_details_panel.setVisible(False)
+
 
     # --- PETS TAB ---
     def _create_pets_tab(self):
@@ -1325,9 +1704,13 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         top_layout.addWidget(self.pet_food_label)
         layout.addLayout(top_layout)
 
-        self.pets_list_widget = QListWidget()
+        self.pets_model = PetListModel(
+            lambda: [name for name in self.game_manager.player.pets if self.game_manager.get_pet_data(name)],
+            self.game_manager.get_pet_data, self)
+        self.pets_list_widget = ModelListView(self.pets_model, "You don't have any pets yet. Buy one from the shop!")
         layout.addWidget(self.pets_list_widget)
-        self.pets_list_widget.itemSelectionChanged.connect(self._show_pet_details)
+        self.pets_list_widget.selection_changed.connect(self._show_pet_details)
+        self.pets_list_widget.selection_changed.connect(lambda: self.scheduler.run_now('countdowns'))
 
         self.pet_details_label = QLabel("Select a pet to see details.", self)
         self.pet_details_label.setAlignment(Qt.AlignCenter)
@@ -1352,25 +1735,20 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         layout.addLayout(pet_action_layout)
         layout.addStretch(1)
 
+    @tab_update("Pets")
     def _update_pets_display(self):
-        self.pets_list_widget.clear()
         self.pet_food_label.setText(f"🍖 Pet Food: {self.game_manager.player.pet_food}")
-        pets = self.game_manager.player.pets
-        if not pets:
-            self.pets_list_widget.addItem("You don't have any pets yet. Buy one from the shop!")
+        self.pets_model.sync()
+        if not self.game_manager.player.pets:
             self.pet_details_label.setText("No pets owned.")
         else:
-            for pet_name in pets:
-                pet_data = self.game_manager.get_pet_data(pet_name)
-                if pet_data:
-                    item_text = f"{pet_data['Name']} (Level: {pet_data['Level']}, XP: {pet_data['XP']}/{pet_data['XP_to_Evolve']})"
-                    item = QListWidgetItem(item_text); item.setData(Qt.UserRole, pet_name)
-                    self.pets_list_widget.addItem(item)
-            if self.pets_list_widget.currentRow() == -1: self.pets_list_widget.setCurrentRow(0)
+            if not self.pets_list_widget.selected_indexes() and self.pets_model.rowCount():
+                self.pets_list_widget.setCurrentIndex(self.pets_model.index(0))
             self._show_pet_details()
 
+    @reads_game_state
     def _show_pet_details(self):
-        selected_items = self.pets_list_widget.selectedItems()
+        selected_items = self.pets_list_widget.selected_indexes()
         if not selected_items:
             self.pet_details_label.setText("Select a pet to see details."); return
         pet_name = selected_items[0].data(Qt.UserRole)
@@ -1392,20 +1770,38 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
             self.pet_details_label.setText(details)
         else: self.pet_details_label.setText(f"Details for {pet_name} not found.")
 
+    @tab_update("Pets")
+    def _update_pet_cooldowns_text(self):
+        """Refreshes the selected pet's cooldowns; returns the seconds until the next one ticks."""
+        selected_items = self.pets_list_widget.selected_indexes()
+        if not selected_items:
+            return None
+        self._show_pet_details()
+        pet_name = selected_items[0].data(Qt.UserRole)
+        now = datetime.datetime.now()
+        remaining = []
+        for cooldowns in (self.game_manager.player.pet_cooldowns, self.game_manager.player.play_cooldowns):
+            end_str = cooldowns.get(pet_name)
+            if end_str:
+                seconds_left = (datetime.datetime.fromisoformat(end_str) - now).total_seconds()
+                if seconds_left > 0:
+                    remaining.append(seconds_left % 1) # Cooldowns show whole seconds
+        return min(remaining) + 0.01 if remaining else None
+
     def _pet_selected_pet(self):
-        if self.pets_list_widget.selectedItems():
-            message = self.game_manager.pet_a_pet(self.pets_list_widget.selectedItems()[0].data(Qt.UserRole))
-            QMessageBox.information(self, "Pet Interaction", message); self._update_all_displays()
+        if self.pets_list_widget.selected_indexes():
+            self._run_action(self.game_manager.pet_a_pet, self.pets_list_widget.selected_indexes()[0].data(Qt.UserRole),
+                             on_done=partial(QMessageBox.information, self, "Pet Interaction"))
         else: QMessageBox.warning(self, "No Pet Selected", "Please select a pet to pet.")
     def _feed_selected_pet(self):
-        if self.pets_list_widget.selectedItems():
-            message = self.game_manager.feed_pet(self.pets_list_widget.selectedItems()[0].data(Qt.UserRole))
-            QMessageBox.information(self, "Feed Pet", message); self._update_all_displays()
+        if self.pets_list_widget.selected_indexes():
+            self._run_action(self.game_manager.feed_pet, self.pets_list_widget.selected_indexes()[0].data(Qt.UserRole),
+                             on_done=partial(QMessageBox.information, self, "Feed Pet"))
         else: QMessageBox.warning(self, "No Pet Selected", "Please select a pet to feed.")
     def _play_with_selected_pet(self):
-        if self.pets_list_widget.selectedItems():
-            message = self.game_manager.play_with_pet(self.pets_list_widget.selectedItems()[0].data(Qt.UserRole))
-            QMessageBox.information(self, "Play With Pet", message); self._update_all_displays()
+        if self.pets_list_widget.selected_indexes():
+            self._run_action(self.game_manager.play_with_pet, self.pets_list_widget.selected_indexes()[0].data(Qt.UserRole),
+                             on_done=partial(QMessageBox.information, self, "Play With Pet"))
         else: QMessageBox.warning(self, "No Pet Selected", "Please select a pet to play with.")
 
     # --- SHOP TAB (REVAMPED WITH CART) ---
@@ -1458,12 +1854,30 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         layout.addWidget(item_panel, 2) # Give more space to items
         layout.addWidget(cart_panel, 1) # Give less space to cart
 
+    @tab_update("Shop")
     def _update_shop_display(self):
+        shop_items = self.game_manager.get_shop_items()
+        catalog_version = tuple((i['name'], i['cost'], i['description'], i.get('emoji', '')) for i in shop_items)
+        if catalog_version != self._shop_catalog_version:
+            self._build_shop_cards(shop_items)
+            self._shop_catalog_version = catalog_version
+            self._update_cart_display() # Cart costs follow the catalog
+
+        # Affordability is the only per-visit change; restyle just the cards that flipped
+        coins = self.game_manager.player.coins
+        for cost, cost_label, add_button in self._shop_cards:
+            affordable = cost <= coins
+            if add_button.isEnabled() != affordable:
+                add_button.setEnabled(affordable)
+                set_style_property(cost_label, "affordable", affordable)
+        self._update_cart_total()
+
+    def _build_shop_cards(self, shop_items):
         # Clear existing item cards from the grid
         while self.shop_grid_layout.count():
             self.shop_grid_layout.takeAt(0).widget().deleteLater()
+        self._shop_cards = []
 
-        shop_items = self.game_manager.get_shop_items()
         row, col = 0, 0
         for item in shop_items:
             # Create a "card" for each item
@@ -1475,9 +1889,8 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
             name_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
             desc_label = QLabel(item['description']); desc_label.setWordWrap(True)
             desc_label.setFont(QFont("Segoe UI", 9))
-            cost_label = QLabel(f"💰 {item['cost']} Coins")
+            cost_label = QLabel(f"💰 {item['cost']} Coins", objectName="shopCostLabel")
             cost_label.setFont(QFont("Segoe UI", 10, QFont.Bold))
-            cost_label.setStyleSheet("color: #28a745;") # Green for cost
 
             card_layout.addWidget(name_label)
             card_layout.addWidget(desc_label)
@@ -1496,13 +1909,12 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
             card_layout.addLayout(add_to_cart_layout)
 
             self.shop_grid_layout.addWidget(card, row, col)
+            self._shop_cards.append((item['cost'], cost_label, add_button))
             col += 1
             if col > 1: # Create a 2-column layout
                 col = 0
                 row += 1
 
-        self._update_cart_display()
-
     def _add_to_cart(self, item, quantity_spin):
         item_name = item['name']
         quantity = quantity_spin.value()
@@ -1513,45 +1925,56 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         else:
             self.shopping_cart[item_name] = quantity
 
-        self._update_cart_display()
+        self._update_cart_row(item_name)
+        self._update_cart_total()
         quantity_spin.setValue(1) # Reset for next use
 
-    def _update_cart_display(self):
-        self.cart_table.setRowCount(0) # Clear the table
-        total_cost = 0
+    def _cart_row(self, item_name):
+        for row in range(self.cart_table.rowCount()):
+            if self.cart_table.item(row, 0).text() == item_name:
+                return row
+        return None
 
-        shop_items = self.game_manager.get_shop_items()
+    def _update_cart_row(self, item_name):
+        """Inserts, updates or removes the one cart table row for item_name."""
+        row = self._cart_row(item_name)
+        item_data = next((i for i in self.game_manager.get_shop_items() if i['name'] == item_name), None)
+        quantity = self.shopping_cart.get(item_name)
+        if quantity is None or item_data is None:
+            if row is not None:
+                self.cart_table.removeRow(row)
+            return
 
-        # Repopulate the table from the shopping_cart dictionary
-        for item_name, quantity in self.shopping_cart.items():
-            item_data = next((i for i in shop_items if i['name'] == item_name), None)
-            if item_data:
-                row_position = self.cart_table.rowCount()
-                self.cart_table.insertRow(row_position)
-
-                cost = item_data['cost'] * quantity
-                total_cost += cost
-
-                self.cart_table.setItem(row_position, 0, QTableWidgetItem(item_name))
-                self.cart_table.setItem(row_position, 1, QTableWidgetItem(str(quantity)))
-                self.cart_table.setItem(row_position, 2, QTableWidgetItem(f"{cost}"))
-
-                # Add a "Remove" button to each row
-                remove_button = QPushButton("Remove")
-                remove_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #dc3545; /* Red for remove */
-                        color: white;
-                        border: none;
-                        border-radius: 6px;
-                        padding: 3px 8px;
-                        font-size: 10px;
-                    }
-                    QPushButton:hover { background-color: #c82333; }
-                """)
-                remove_button.clicked.connect(partial(self._remove_from_cart, item_name))
-                self.cart_table.setCellWidget(row_position, 3, remove_button)
+        cost = item_data['cost'] * quantity
+        if row is None:
+            row = self.cart_table.rowCount()
+            self.cart_table.insertRow(row)
+            self.cart_table.setItem(row, 0, QTableWidgetItem(item_name))
+            self.cart_table.setItem(row, 1, QTableWidgetItem(str(quantity)))
+            self.cart_table.setItem(row, 2, QTableWidgetItem(f"{cost}"))
+            # Add a "Remove" button to each row
+            remove_button = QPushButton("Remove", objectName="removeButton")
+            remove_button.clicked.connect(partial(self._remove_from_cart, item_name))
+            self.cart_table.setCellWidget(row, 3, remove_button)
+        else:
+            self.cart_table.item(row, 1).setText(str(quantity))
+            self.cart_table.item(row, 2).setText(f"{cost}")
 
+    @tab_update("Shop")
+    def _update_cart_display(self):
+        # Drop rows no longer in the cart, then bring the rest up to date
+        for row in reversed(range(self.cart_table.rowCount())):
+            if self.cart_table.item(row, 0).text() not in self.shopping_cart:
+                self.cart_table.removeRow(row)
+        for item_name in self.shopping_cart:
+            self._update_cart_row(item_name)
+        self._update_cart_total()
+
+    @reads_game_state
+    def _update_cart_total(self):
+        shop_costs = {i['name']: i['cost'] for i in self.game_manager.get_shop_items()}
+        total_cost = sum(shop_costs[name] * quantity for name, quantity in self.shopping_cart.items()
+                         if name in shop_costs)
         self.cart_total_label.setText(f"<b>Total: {total_cost} Coins</b>")
         # Enable purchase button only if cart has items and player has enough coins
         self.purchase_cart_button.setEnabled(total_cost > 0 and self.game_manager.player.coins >= total_cost)
@@ -1559,23 +1982,36 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
     def _remove_from_cart(self, item_name):
         if item_name in self.shopping_cart:
             del self.shopping_cart[item_name]
-            self._update_cart_display()
+            self._update_cart_row(item_name)
+            self._update_cart_total()
 
     def _clear_cart(self):
         self.shopping_cart.clear()
-        self._update_cart_display()
+        self.cart_table.setRowCount(0)
+        self._update_cart_total()
 
     def _purchase_cart(self):
         if not self.shopping_cart:
             QMessageBox.warning(self, "Empty Cart", "Your shopping cart is empty.")
             return
 
-        success, message = self.game_manager.purchase_cart(self.shopping_cart)
+        # A copy, so adding to the cart while the purchase is queued can't change what gets bought
+        cart = dict(self.shopping_cart)
+        self._run_action(self.game_manager.purchase_cart, cart, on_done=partial(self._on_cart_purchased, cart))
 
+    def _on_cart_purchased(self, purchased, result):
+        success, message = result
         if success:
+            # Only take out what was bought; items added while the purchase was queued stay in the cart
+            for item_name, quantity in purchased.items():
+                remaining = self.shopping_cart.get(item_name, 0) - quantity
+                if remaining > 0:
+                    self.shopping_cart[item_name] = remaining
+                else:
+                    self.shopping_cart.pop(item_name, None)
+                self._update_cart_row(item_name)
+            self._update_cart_total()
             QMessageBox.information(self, "Purchase Successful", message)
-            self._clear_cart()
-            self._update_all_displays()
         else:
             QMessageBox.warning(self, "Purchase Failed", message)
 
@@ -1589,10 +2025,18 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         left_panel = QWidget()
         left_layout = QVBoxLayout(left_panel)
         left_layout.addWidget(QLabel("<b>Equipped Gear</b>", objectName="headerLabel"))
-        self.forge_equipped_list = QListWidget()
+        self.forge_equipped_model = GearListModel(
+            lambda: [item for item in self.game_manager.player.gear.values() if item], self)
+        self.forge_equipped_list = ModelListView(self.forge_equipped_model)
         left_layout.addWidget(self.forge_equipped_list)
         left_layout.addWidget(QLabel("<b>Inventory Gear</b>", objectName="headerLabel"))
-        self.forge_inventory_list = QListWidget()
+        self.forge_inventory_model = GearListModel(lambda: self.game_manager.player.inventory, self)
+        forge_inventory_filter = TextFilterModel(self.forge_inventory_model, self)
+        self.forge_inventory_list = ModelListView(forge_inventory_filter)
+        self.forge_search_input = QLineEdit()
+        self.forge_search_input.setPlaceholderText("Filter inventory...")
+        self.forge_search_input.textChanged.connect(forge_inventory_filter.set_search)
+        left_layout.addWidget(self.forge_search_input)
         left_layout.addWidget(self.forge_inventory_list)
 
         right_panel = QFrame()
@@ -1600,7 +2044,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         right_layout.setSpacing(10)
         self.forge_item_name = QLabel("Select an item to upgrade")
         self.forge_item_name.setFont(QFont("Segoe UI", 14, QFont.Bold))
-        self.forge_item_name.setStyleSheet("color: #2c3e50;")
+        self.forge_item_name.setObjectName("titleLabel")
         self.forge_item_details = QLabel()
         self.forge_item_details.setWordWrap(True)
         self.forge_item_details.setFont(QFont("Segoe UI", 10))
@@ -1611,21 +2055,13 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         self.transcend_item_button = QPushButton("Transcend Item")
         self.transcend_item_button.setObjectName("primaryButton") # Apply primary button style
         self.transcend_item_button.clicked.connect(self._transcend_selected_item)
-        self.roll_extra_effect_button = QPushButton("Roll Extra Effect (1500 Coins)")
+        self.roll_extra_effect_button = QPushButton("Roll Extra Effect (1500 Coins)", objectName="rollEffectButton")
         self.roll_extra_effect_button.clicked.connect(self._roll_extra_effect_on_item)
         self.roll_extra_effect_button.setVisible(False)
-        self.roll_extra_effect_button.setStyleSheet("""
-            QPushButton { background-color: #6c757d; color: white; border: none; border-radius: 8px; padding: 10px 15px; font-weight: bold; min-height: 35px;} /* Grey for roll effect */
-            QPushButton:hover { background-color: #5a6268; }
-        """)
 
-        self.sell_item_button = QPushButton("Sell Item")
+        self.sell_item_button = QPushButton("Sell Item", objectName="sellButton")
         self.sell_item_button.clicked.connect(self._sell_selected_item)
         self.sell_item_button.setVisible(False)
-        self.sell_item_button.setStyleSheet("""
-            QPushButton { background-color: #ffc107; color: #333333; border: none; border-radius: 8px; padding: 10px 15px; font-weight: bold; min-height: 35px;} /* Yellow for sell */
-            QPushButton:hover { background-color: #e0a800; }
-        """)
 
 
         right_layout.addWidget(self.forge_item_name)
@@ -1641,37 +2077,31 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         layout.addWidget(right_panel, 1)
 
         # Connect item selection signals to the detail display
-        self.forge_equipped_list.itemClicked.connect(self._show_forge_item_details)
-        self.forge_inventory_list.itemClicked.connect(self._show_forge_item_details)
+        self.forge_equipped_list.clicked.connect(self._on_forge_item_clicked)
+        self.forge_inventory_list.clicked.connect(self._on_forge_item_clicked)
 
+    @tab_update("Forge")
     def _update_forge_display(self):
-        self.forge_equipped_list.clear()
-        self.forge_inventory_list.clear()
+        self.forge_equipped_model.sync()
+        self.forge_inventory_model.sync()
+        # The selected item may have been renamed, moved or sold, so start from a clean selection
+        self.forge_equipped_list.clearSelection()
+        self.forge_inventory_list.clearSelection()
         self._clear_forge_details()
 
-        for slot, item in self.game_manager.player.gear.items():
-            if item:
-                list_item = QListWidgetItem(f"{item['name']} ({item['type']})")
-                if item.get('transcended'): list_item.setForeground(QColor('purple'))
-                list_item.setData(Qt.UserRole, item)
-                self.forge_equipped_list.addItem(list_item)
-
-        for item in self.game_manager.player.inventory:
-            list_item = QListWidgetItem(f"{item['name']} ({item['type']})")
-            if item.get('transcended'): 
-                list_item.setForeground(QColor('purple'))
-            list_item.setData(Qt.UserRole, item) # Ensure item data is stored
-            self.forge_inventory_list.addItem(list_item)
-
-    def _show_forge_item_details(self, item):
+    def _on_forge_item_clicked(self, item):
         # Clear selection in the other list to ensure only one item is selected
         sender = self.sender()
         if sender == self.forge_equipped_list:
             self.forge_inventory_list.clearSelection()
         else: # sender == self.forge_inventory_list
             self.forge_equipped_list.clearSelection()
+        self._show_forge_item_details()
 
-        item_data = item.data(Qt.UserRole)
+    @reads_game_state
+    def _show_forge_item_details(self):
+        item = self._get_selected_forge_item()
+        item_data = item.data(Qt.UserRole) if item else None
         if not item_data:
             self._clear_forge_details()
             return
@@ -1715,7 +2145,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         self.transcend_item_button.setVisible(True)
         self.roll_extra_effect_button.setVisible(False) # Hide by default, show if transcended and no extra effect
 
-        next_level_cost = 100 * (enchant_level + 1)
+        next_level_cost = self.game_manager.get_enchant_cost(enchant_level)
         details += f"<br><b>Enchant Level:</b> +{enchant_level}\n"
         details += f"<b>Next Enchant Cost:</b> {next_level_cost} Coins\n"
         self.enchant_button.setEnabled(self.game_manager.player.coins >= next_level_cost)
@@ -1761,10 +2191,10 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
 
     def _get_selected_forge_item(self):
         # Check both lists for a selected item
-        if self.forge_equipped_list.selectedItems():
-            return self.forge_equipped_list.selectedItems()[0]
-        if self.forge_inventory_list.selectedItems():
-            return self.forge_inventory_list.selectedItems()[0]
+        if self.forge_equipped_list.selected_indexes():
+            return self.forge_equipped_list.selected_indexes()[0]
+        if self.forge_inventory_list.selected_indexes():
+            return self.forge_inventory_list.selected_indexes()[0]
         return None
 
     def _enchant_selected_item(self):
@@ -1774,9 +2204,8 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
             return
 
         item_name = item_widget.data(Qt.UserRole)['name']
-        message = self.game_manager.enchant_gear(item_name)
-        QMessageBox.information(self, "Enchanting Result", message)
-        self._update_all_displays()
+        self._run_action(self.game_manager.enchant_gear, item_name,
+                         on_done=partial(QMessageBox.information, self, "Enchanting Result"))
 
     def _transcend_selected_item(self):
         item_widget = self._get_selected_forge_item()
@@ -1789,9 +2218,8 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
             item_name = item_widget.data(Qt.UserRole)['name']
-            message = self.game_manager.transcend_gear(item_name)
-            QMessageBox.information(self, "Transcendence Result", message)
-            self._update_all_displays()
+            self._run_action(self.game_manager.transcend_gear, item_name,
+                             on_done=partial(QMessageBox.information, self, "Transcendence Result"))
 
     def _roll_extra_effect_on_item(self):
         item_widget = self._get_selected_forge_item()
@@ -1800,10 +2228,10 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
             return
         
         item_name = item_widget.data(Qt.UserRole)['name']
-        message = self.game_manager.roll_extra_effect(item_name)
-        QMessageBox.information(self, "Extra Effect Roll", message)
-        self._update_all_displays()
+        self._run_action(self.game_manager.roll_extra_effect, item_name,
+                         on_done=partial(QMessageBox.information, self, "Extra Effect Roll"))
 
+    @reads_game_state
     def _sell_selected_item(self):
         item_widget = self._get_selected_forge_item()
         if not item_widget:
@@ -1818,9 +2246,8 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
                                      f"Are you sure you want to sell {item_name} for {sell_price} coins?",
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            message = self.game_manager.sell_gear(item_name)
-            QMessageBox.information(self, "Sell Item Result", message)
-            self._update_all_displays()
+            self._run_action(self.game_manager.sell_gear, item_name,
+                             on_done=partial(QMessageBox.information, self, "Sell Item Result"))
 
 
     # --- PUNISHMENTS TAB ---
@@ -1830,8 +2257,9 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(15)
 
-        self.punishments_list = QListWidget()
-        self.punishments_list.setWordWrap(True)
+        self.punishments_model = PunishmentListModel(self.game_manager.get_punishments, self)
+        self.punishments_list = ModelListView(self.punishments_model, uniform_rows=False)
+        self.punishments_list.setItemDelegate(PunishmentDelegate(self.punishments_list))
         right_panel = QWidget()
         right_layout = QVBoxLayout(right_panel)
         right_layout.setAlignment(Qt.AlignTop)
@@ -1848,46 +2276,16 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         layout.addWidget(self.punishments_list, 2)
         layout.addWidget(right_panel, 1)
 
+    @tab_update("Punishments")
     def _update_punishments_display(self):
-        self.punishments_list.clear()
-        severity_order = {"Terrible": 0, "High": 1, "Moderate": 2, "OK": 3}
-        severity_colors = {"OK": "green", "Moderate": "orange", "High": "red", "Terrible": "darkred"}
-
-        sorted_punishments = sorted(
-            self.game_manager.get_punishments(),
-            key=lambda p: severity_order.get(p['severity'], 99)
-        )
-
-        for p in sorted_punishments:
-            item_text = (f"<b>{p['name']}</b> ({p['severity']})<br>"
-                         f"Points: {p['punishment']} | XP: -{p.get('xp_penalty', 0)} | Coins: -{p.get('coin_penalty', 0)}")
-            if p.get('special_chance', 0) > 0:
-                effect_name = p.get('special_effect', 'a penalty').replace('_', ' ')
-                item_text += f"<br><i>({p['special_chance']*100:.0f}% chance of special penalty: {effect_name})</i>"
-
-            item = QListWidgetItem()
-            label = QLabel(item_text)
-            label.setStyleSheet(f"color: {severity_colors.get(p['severity'], 'black')}; padding: 5px;")
-            label.setWordWrap(True)
-            # Calculate height hint based on content
-            font_metrics = QFontMetrics(label.font())
-            text_height = font_metrics.boundingRect(label.text()).height()
-            # Estimate number of lines based on fixed width, add padding
-            num_lines = label.text().count('<br>') + 1
-            item.setSizeHint(QSize(self.punishments_list.width(), text_height * num_lines + 20))
-
-
-            self.punishments_list.addItem(item)
-            self.punishments_list.setItemWidget(item, label)
-            item.setData(Qt.UserRole, p)
+        self.punishments_model.sync()
 
     def _apply_selected_punishment(self):
-        selected = self.punishments_list.currentItem()
-        if selected:
+        selected = self.punishments_list.currentIndex()
+        if selected.isValid():
             punishment_name = selected.data(Qt.UserRole)['name']
-            message = self.game_manager.apply_punishment(punishment_name)
-            QMessageBox.warning(self, "Punishment Applied", message)
-            self._update_all_displays()
+            self._run_action(self.game_manager.apply_punishment, punishment_name,
+                             on_done=partial(QMessageBox.warning, self, "Punishment Applied"))
         else: QMessageBox.information(self, "Info", "Select a punishment first.")
 
     def _create_new_punishment(self):
@@ -1895,8 +2293,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         if dialog.exec_() == QDialog.Accepted:
             data = dialog.get_data()
             if data['name']:
-                self.game_manager.add_custom_punishment(data)
-                self._update_punishments_display()
+                self._run_action(self.game_manager.add_custom_punishment, data)
             else: QMessageBox.warning(self, "Input Error", "Punishment name cannot be empty.")
 
     # --- ACHIEVEMENTS TAB ---
@@ -1915,38 +2312,29 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         self.achievements_layout.setAlignment(Qt.AlignTop)
         self.achievements_layout.setSpacing(10) # Spacing between achievement cards
         scroll_area.setWidget(content_widget)
+        self._achievement_cards = {} # Achievement key -> AchievementCard
+        self._achievements_catalog_version = None # Catalog the cards were built from
 
+    @tab_update("Achievements")
     def _update_achievements_display(self):
-        while self.achievements_layout.count():
-            self.achievements_layout.takeAt(0).widget().deleteLater()
         achievements = self.game_manager.get_achievements()
-        for key, ach in achievements.items():
-            card = QFrame();
-            card_layout = QVBoxLayout(card)
-            card_layout.setContentsMargins(10, 10, 10, 10) # Padding inside card
+        catalog_version = tuple((key, ach['name'], ach['description'], ach['reward_text']) for key, ach in achievements.items())
+        if catalog_version != self._achievements_catalog_version:
+            self._build_achievement_cards(achievements)
+            self._achievements_catalog_version = catalog_version
 
-            name_text = f"🏆 {ach['name']}" if ach['unlocked'] else f"🔒 {ach['name']}"
-            name_label = QLabel(f"<b>{name_text}</b>")
-            name_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
-            desc_label = QLabel(ach['description'])
-            desc_label.setWordWrap(True)
-            desc_label.setFont(QFont("Segoe UI", 9))
-            reward_label = QLabel(f"<i>Reward: {ach['reward_text']}</i>")
-            reward_label.setWordWrap(True)
-            reward_label.setFont(QFont("Segoe UI", 9))
-
-            if not ach['unlocked']:
-                name_label.setStyleSheet("color: #7f8c8d;"); # Greyed out
-                desc_label.setStyleSheet("color: #95a5a6;")
-                reward_label.setStyleSheet("color: #95a5a6;")
-                card.setStyleSheet("background-color: #ecf0f1; border: 1px solid #bdc3c7; border-radius: 12px; padding: 15px; margin: 5px; box-shadow: none;")
-            else:
-                name_label.setStyleSheet("color: #2c3e50;");
-                desc_label.setStyleSheet("color: #34495e;")
-                reward_label.setStyleSheet("color: #27ae60; font-weight: bold;") # Green for unlocked rewards
-                card.setStyleSheet("") # Reset to global style for unlocked
+        # Cards only change when an achievement unlocks or its progress moves
+        progress = self.game_manager.get_achievement_progress()
+        for key, ach in achievements.items():
+            self._achievement_cards[key].set_state(ach['unlocked'], progress.get(key))
 
-            card_layout.addWidget(name_label); card_layout.addWidget(desc_label); card_layout.addWidget(reward_label)
+    def _build_achievement_cards(self, achievements):
+        while self.achievements_layout.count():
+            self.achievements_layout.takeAt(0).widget().deleteLater()
+        self._achievement_cards = {}
+        for key, ach in achievements.items():
+            card = AchievementCard(ach)
+            self._achievement_cards[key] = card
             self.achievements_layout.addWidget(card)
 
     # --- TRANSCEND TAB ---
@@ -1957,10 +2345,9 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(20)
 
-        self.transcend_title = QLabel()
+        self.transcend_title = QLabel(objectName="transcendTitle") # Blue, purple once "ready" is set
         self.transcend_title.setFont(QFont("Segoe UI", 28, QFont.Bold)) # Larger font
         self.transcend_title.setAlignment(Qt.AlignCenter)
-        self.transcend_title.setStyleSheet("color: #2980b9;") # Initial color (blue)
         
         # Animation for the transcend title
         self.transcend_animation = QPropertyAnimation(self.transcend_title, b"font")
@@ -1972,27 +2359,12 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         desc = QLabel("Reset your journey to gain permanent power and unlock new potentials.")
         desc.setAlignment(Qt.AlignCenter); desc.setWordWrap(True)
         desc.setFont(QFont("Segoe UI", 11))
-        desc.setStyleSheet("color: #555555;")
+        desc.setObjectName("detailLabel")
 
         status_box = QFrame();
         status_layout = QVBoxLayout(status_box)
-        status_title = QLabel("Your Progress to Divinity"); status_title.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        status_title.setStyleSheet("color: #2c3e50;")
-        self.transcend_progress_bar = QProgressBar()
-        self.transcend_progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #2196F3;
-                border-radius: 10px;
-                background-color: #e3f2fd; /* Light blue background */
-                text-align: center;
-                color: #333333;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #2196F3, stop:1 #42A5F5); /* Blue gradient */
-                border-radius: 8px;
-            }
-        """)
+        status_title = QLabel("Your Progress to Divinity", objectName="titleLabel"); status_title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        self.transcend_progress_bar = QProgressBar(objectName="transcendProgress")
         self.transcend_progress_label = QLabel()
         self.transcend_progress_label.setFont(QFont("Segoe UI", 10, QFont.Bold))
         status_layout.addWidget(status_title); status_layout.addWidget(self.transcend_progress_bar)
@@ -2000,8 +2372,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
 
         benefits_box = QFrame();
         benefits_layout = QVBoxLayout(benefits_box)
-        benefits_title = QLabel("Rewards of Rebirth"); benefits_title.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        benefits_title.setStyleSheet("color: #2c3e50;")
+        benefits_title = QLabel("Rewards of Rebirth", objectName="titleLabel"); benefits_title.setFont(QFont("Segoe UI", 16, QFont.Bold))
         benefits_text = QLabel("✅ <b>Permanent Bonus:</b> +0.1x Coin Gain Multiplier per transcension.<br>"
                                "✅ <b>Transcension Gift:</b> Receive a random piece of gear.<br>"
                                "✅ <b>Temporary Buff:</b> 30 minutes of 2x XP and Coin gain.<br>"
@@ -2010,33 +2381,15 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         benefits_text.setFont(QFont("Segoe UI", 10))
         benefits_layout.addWidget(benefits_title); benefits_layout.addWidget(benefits_text)
 
-        self.transcend_button = QPushButton()
+        self.transcend_button = QPushButton(objectName="transcendButton")
         self.transcend_button.setFont(QFont("Segoe UI", 18, QFont.Bold)) # Larger font for button
         self.transcend_button.clicked.connect(self._confirm_transcend)
-        self.transcend_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12; /* Orange for transcend */
-                color: white;
-                border: none;
-                border-radius: 15px;
-                padding: 15px 30px;
-                font-weight: bold;
-                font-size: 18px;
-                box-shadow: 3px 3px 12px rgba(0, 0, 0, 0.3);
-            }
-            QPushButton:hover { background-color: #e67e22; }
-            QPushButton:pressed { background-color: #d35400; }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-                box-shadow: none;
-            }
-        """)
         
         layout.addWidget(self.transcend_title); layout.addWidget(desc); layout.addSpacing(20)
         layout.addWidget(status_box); layout.addSpacing(20); layout.addWidget(benefits_box)
         layout.addStretch(1); layout.addWidget(self.transcend_button)
 
+    @tab_update("Transcend")
     def _update_transcend_display(self):
         player = self.game_manager.player
         required_xp = self.game_manager.get_transcend_requirement()
@@ -2050,7 +2403,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         else:
             self.transcend_button.setEnabled(False); self.transcend_button.setText("🔒 Divinity Awaits... 🔒")
             self._stop_transcend_animation()
-            self.transcend_title.setStyleSheet("color: #2980b9;") # Reset color (blue)
+            set_style_property(self.transcend_title, "ready", False) # Reset color (blue)
 
 
     def _start_transcend_animation(self):
@@ -2059,14 +2412,14 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
             self.transcend_animation.setStartValue(QFont("Segoe UI", 28, QFont.Bold)) # Base font size
             self.transcend_animation.setEndValue(QFont("Segoe UI", 34, QFont.Bold)) # Larger font size for animation
             self.transcend_animation.start()
-            self.transcend_title.setStyleSheet("color: #8e44ad;") # Make it stand out when ready (purple)
+            set_style_property(self.transcend_title, "ready", True) # Make it stand out when ready (purple)
 
 
     def _stop_transcend_animation(self):
         if self.transcend_animation.state() == QPropertyAnimation.Running:
             self.transcend_animation.stop()
             self.transcend_title.setFont(QFont("Segoe UI", 28, QFont.Bold)) # Reset to base font size
-            self.transcend_title.setStyleSheet("color: #2980b9;") # Reset color (blue)
+            set_style_property(self.transcend_title, "ready", False) # Reset color (blue)
 
 
     def _confirm_transcend(self):
@@ -2074,10 +2427,11 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
                                      "Are you sure you want to Transcend? This will reset your progress, level, and non-Transcended gear for a permanent bonus.",
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            message = self.game_manager.transcend()
-            QMessageBox.information(self, "Transcended!", message)
-            self._update_all_displays()
-            self._stop_transcend_animation() # Stop animation after transcending
+            self._run_action(self.game_manager.transcend, on_done=self._on_transcended)
+
+    def _on_transcended(self, message):
+        QMessageBox.information(self, "Transcended!", message)
+        self._stop_transcend_animation() # Stop animation after transcending
 
     # --- EXIT TAB ---
     def _create_exit_tab(self):
@@ -2090,7 +2444,7 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
         exit_label = QLabel("Thank you for playing!")
         exit_label.setFont(QFont("Segoe UI", 24, QFont.Bold))
         exit_label.setAlignment(Qt.AlignCenter)
-        exit_label.setStyleSheet("color: #2c3e50;")
+        exit_label.setObjectName("titleLabel")
 
         exit_button = QPushButton("Exit Game")
         exit_button.setFixedSize(200, 60)
@@ -2104,12 +2458,15 @@ class GameGUI(QWidget): # Changed from QMainWindow to QWidget to fit into the co
 
     def close_application(self):
         """Saves the game and closes the application."""
-        self.game_manager.save_game()
-        QApplication.instance().quit() # Properly quit the QApplication
+        # Queued behind any pending actions, so their changes are saved too
+        self._run_action(self.game_manager.save_game, on_done=lambda _: QApplication.instance().quit())
 
     # --- GLOBAL UPDATE & CLOSE ---
     def _update_all_displays(self):
+        """Full refresh of the stats panel and the current tab. Change events keep them current afterwards."""
         self._update_player_stats_display()
+        current_tab = self.tab_widget.tabText(self.tab_widget.currentIndex())
+        self._stale_panels.update(method for tab, method, _ in PANELS if tab == current_tab)
         self._on_tab_change(self.tab_widget.currentIndex())
 
     def closeEvent(self, event):
@@ -2126,15 +2483,12 @@ if __name__ == '__main__':
     
     app = QApplication(sys.argv)
     
-    # Initialize the game manager once
-    game_manager = GameManager()
-
-    # The controller now manages the main window and the game lifecycle
-    controller = ApplicationController(game_manager)
+    # The controller now manages the main window and the game lifecycle, and loads the game in the background
+    controller = ApplicationController(GameManager)
     
     # Connect the app's lastWindowClosed signal to save the game
     # This ensures the game is saved when the application is closed by any means
-    app.lastWindowClosed.connect(game_manager.save_game)
+    app.lastWindowClosed.connect(controller.save_game)
 
     sys.exit(app.exec_())
     
\ No newline at end of file
@@ -0,0 +1,194 @@
+# gui_benchmark.py
+"""
+Offscreen benchmark harness for the GameGUI panels.
+
+Runs GameGUI under the Qt offscreen platform with a synthetic large profile and
+reports p50/p99 latencies and widget allocation counts for every _update_* method,
+for switching to each tab and for a forced run of all scheduled time-based updates
+(clock, arc, countdowns). Each measurement includes the event processing that
+follows the call (deferred deletes, layout and paint), since that is part of what
+the user waits for. It also records timer wakeups and CPU time while the window
+sits idle on a tab.
+
+Usage:
+    python gui_benchmark.py --quests 2000 --inventory 5000 --punishments 500 --output gui_bench.json
+"""
+import os
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen') # Must be set before Qt is imported
+
+import argparse
+import contextlib
+import inspect
+import json
+import statistics
+import sys
+import tempfile
+import time
+
+from PyQt5.QtCore import QEvent, QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication, QMessageBox
+
+from game_manager import GameManager
+from profile_generator import build_profile
+
+
+def _silence_message_boxes():
+    """Replaces the blocking QMessageBox helpers so handlers never wait for a click."""
+    QMessageBox.information = staticmethod(lambda *args, **kwargs: QMessageBox.Ok)
+    QMessageBox.warning = staticmethod(lambda *args, **kwargs: QMessageBox.Ok)
+    QMessageBox.question = staticmethod(lambda *args, **kwargs: QMessageBox.Yes)
+
+
+class GuiBenchmark:
+    """Times GameGUI refresh paths and counts the widgets each one allocates."""
+
+    def __init__(self, app, gui):
+        self.app = app
+        self.gui = gui
+
+    def _flush_events(self):
+        self.app.processEvents()
+        self.app.sendPostedEvents(None, QEvent.DeferredDelete)
+        self.app.processEvents()
+
+    def measure(self, func, iterations, before=None):
+        """Returns latency percentiles and widget counts for calling func repeatedly."""
+        samples = []
+        created_counts = []
+        live_before_all = len(self.app.allWidgets())
+        for _ in range(iterations):
+            if before:
+                before()
+                self._flush_events()
+            # Keep the wrappers alive while comparing, otherwise Python may recycle their ids
+            widgets_before = self.app.allWidgets()
+            ids_before = {id(w) for w in widgets_before}
+            started = time.perf_counter()
+            func()
+            widgets_during = self.app.allWidgets() # Before the flush, so deleteLater'd widgets still count
+            self._flush_events()
+            samples.append(time.perf_counter() - started)
+            created_counts.append(sum(1 for w in widgets_during if id(w) not in ids_before))
+            del widgets_before, widgets_during
+        ordered = sorted(samples)
+        return {
+            'iterations': iterations,
+            'p50_ms': round(statistics.median(ordered) * 1000, 3),
+            'p99_ms': round(ordered[min(len(ordered) - 1, int(round(0.99 * (len(ordered) - 1))))] * 1000, 3),
+            'max_ms': round(ordered[-1] * 1000, 3),
+            'widgets_created_per_call': round(statistics.fmean(created_counts), 1),
+            'live_widget_growth': len(self.app.allWidgets()) - live_before_all,
+        }
+
+    def measure_idle(self, seconds):
+        """Scheduler wakeups and process CPU time while the event loop runs with no input."""
+        wakeups_before = self.gui.scheduler.wakeups
+        cpu_before = time.process_time()
+        loop = QEventLoop()
+        QTimer.singleShot(int(seconds * 1000), loop.quit)
+        loop.exec_()
+        cpu_ms = (time.process_time() - cpu_before) * 1000
+        return {
+            'seconds': seconds,
+            'wakeups_per_second': round((self.gui.scheduler.wakeups - wakeups_before) / seconds, 2),
+            'cpu_ms_per_second': round(cpu_ms / seconds, 3),
+        }
+
+    def update_methods(self):
+        """Every zero-argument _update_* method on the GUI."""
+        names = []
+        for name in sorted(dir(self.gui)):
+            if not name.startswith('_update_'):
+                continue
+            method = getattr(self.gui, name)
+            if callable(method) and not inspect.signature(method).parameters:
+                names.append(name)
+        return names
+
+    def run(self, iterations, idle_seconds=0):
+        results = {'update_methods': {}, 'tab_switches': {}, 'timer_tick': {}, 'idle': {}}
+        tab_widget = self.gui.tab_widget
+
+        for index in range(tab_widget.count()):
+            tab_name = tab_widget.tabText(index)
+            other_index = (index + 1) % tab_widget.count()
+            results['tab_switches'][tab_name] = self.measure(
+                lambda: tab_widget.setCurrentIndex(index), iterations,
+                before=lambda: tab_widget.setCurrentIndex(other_index))
+
+        for tab_name in ["Player & Skills", "Quests"]:
+            index = next(i for i in range(tab_widget.count()) if tab_widget.tabText(i) == tab_name)
+            tab_widget.setCurrentIndex(index)
+            self._flush_events()
+            results['timer_tick'][f"on {tab_name}"] = self.measure(self.gui.scheduler.run_now, iterations)
+            if idle_seconds:
+                results['idle'][f"on {tab_name}"] = self.measure_idle(idle_seconds)
+
+        for name in self.update_methods():
+            results['update_methods'][name] = self.measure(getattr(self.gui, name), iterations)
+        return results
+
+
+def _print_table(title, rows):
+    print(f"\n{title}")
+    print(f"  {'name':<36}{'p50 ms':>10}{'p99 ms':>10}{'widgets/call':>14}")
+    for name, row in sorted(rows.items(), key=lambda kv: -kv[1]['p50_ms']):
+        print(f"  {name:<36}{row['p50_ms']:>10.2f}{row['p99_ms']:>10.2f}{row['widgets_created_per_call']:>14.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark GameGUI panel refreshes offscreen.")
+    parser.add_argument('--quests', type=int, default=2000)
+    parser.add_argument('--inventory', type=int, default=5000)
+    parser.add_argument('--punishments', type=int, default=500)
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--idle-seconds', type=float, default=5, help="Idle time to sample per tab (0 to skip).")
+    parser.add_argument('--output', default='gui_bench.json')
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    _silence_message_boxes()
+    from gui import GameGUI, GLOBAL_STYLESHEET # Imported after the offscreen platform is configured
+
+    document = build_profile(quests=args.quests, inventory=args.inventory, punishments=args.punishments,
+                             seed=args.seed)
+    with tempfile.TemporaryDirectory() as temp_dir, open(os.devnull, 'w') as devnull, \
+            contextlib.redirect_stdout(devnull):
+        save_path = os.path.join(temp_dir, 'save_game.json')
+        with open(save_path, 'w') as f:
+            json.dump(document, f)
+        game_manager = GameManager(save_file=save_path)
+
+        started = time.perf_counter()
+        gui = GameGUI(game_manager)
+        gui.setStyleSheet(GLOBAL_STYLESHEET)
+        gui.resize(1600, 1000)
+        gui.show()
+        app.processEvents()
+        construction_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        results = GuiBenchmark(app, gui).run(args.iterations, args.idle_seconds)
+        gui.scheduler.stop()
+
+    results['profile'] = {'quests': args.quests, 'inventory': args.inventory,
+                          'custom_punishments': args.punishments, 'seed': args.seed}
+    results['construction_ms'] = construction_ms
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=4)
+
+    print(f"GameGUI construction: {construction_ms:.1f} ms")
+    _print_table("Tab switches", results['tab_switches'])
+    _print_table("Timer tick", results['timer_tick'])
+    _print_table("Update methods", results['update_methods'])
+    if results['idle']:
+        print("\nIdle")
+        print(f"  {'name':<36}{'wakeups/s':>10}{'CPU ms/s':>10}")
+        for name, row in results['idle'].items():
+            print(f"  {name:<36}{row['wakeups_per_second']:>10.2f}{row['cpu_ms_per_second']:>10.3f}")
+    print(f"\nResults written to '{args.output}'.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,254 @@
+# io_accounting.py
+"""
+Save I/O accounting for GameManager.
+
+When enabled, every persistence path (save_game, _load_game, _save_custom_actions,
+_load_custom_actions) reports the bytes serialized, bytes read or written, and
+serialize vs I/O time through GameManager.io_observer. Each event is attributed to
+the top-level GameManager action that caused it (the outermost public method on the
+stack, e.g. purchase_cart), and every finished action records how many saves it
+triggered. That is the write amplification any batching or journaling change has to
+reduce.
+
+In-process, summary() gives rolling per-action totals. Every event and action is also
+appended to a JSONL log (config.IO_LOG_FILE) that the CLI report reads:
+
+    RPG_IO_ACCOUNTING=1 python main.py
+    python io_accounting.py report io_log.jsonl
+"""
+import argparse
+import collections
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+
+from config import IO_LOG_FILE
+
+ENV_VAR = 'RPG_IO_ACCOUNTING'
+WRITE_OPERATIONS = ('save_game', '_save_custom_actions')
+NO_ACTION = '<startup>' # Attribution for I/O outside any public method, e.g. the initial load
+
+
+class _ActionTotals:
+    def __init__(self):
+        self.calls = 0
+        self.saves = 0
+        self.max_saves = 0
+        self.loads = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.serialize_seconds = 0.0
+        self.io_seconds = 0.0
+
+    def to_dict(self):
+        calls = max(self.calls, 1)
+        return {
+            'calls': self.calls,
+            'saves': self.saves,
+            'saves_per_call': round(self.saves / calls, 3),
+            'max_saves_per_call': self.max_saves,
+            'loads': self.loads,
+            'bytes_written': self.bytes_written,
+            'bytes_written_per_call': round(self.bytes_written / calls),
+            'bytes_read': self.bytes_read,
+            'serialize_ms': round(self.serialize_seconds * 1000, 3),
+            'io_ms': round(self.io_seconds * 1000, 3),
+        }
+
+
+class IOAccountant:
+    """GameManager.io_observer that attributes persistence I/O to the current top-level action."""
+
+    def __init__(self, log_path=None, recent=1000):
+        self.log_path = log_path
+        self.recent = collections.deque(maxlen=recent) # Latest events, newest last
+        self.totals = collections.defaultdict(_ActionTotals)
+        self.fsyncs = 0 # GameManager doesn't fsync today; kept so durability changes show up here
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._originals = {}
+        self._log_file = open(log_path, 'a') if log_path else None
+
+    def _current(self):
+        """The action in progress on this thread as [name, saves so far], or None."""
+        stack = getattr(self._local, 'stack', None)
+        return stack[0] if stack else None
+
+    def record(self, operation, path, serialized_bytes, io_bytes, serialize_seconds, io_seconds, fsync=False):
+        current = self._current()
+        action = current[0] if current else NO_ACTION
+        is_write = operation in WRITE_OPERATIONS
+        event = {
+            'type': 'io', 'time': time.time(), 'action': action, 'operation': operation,
+            'path': path, 'serialized_bytes': serialized_bytes, 'io_bytes': io_bytes,
+            'serialize_ms': round(serialize_seconds * 1000, 3), 'io_ms': round(io_seconds * 1000, 3),
+            'fsync': fsync,
+        }
+        with self._lock:
+            if current and operation == 'save_game':
+                current[1] += 1
+            totals = self.totals[action]
+            if is_write:
+                totals.saves += operation == 'save_game'
+                totals.bytes_written += io_bytes
+            else:
+                totals.loads += 1
+                totals.bytes_read += io_bytes
+            totals.serialize_seconds += serialize_seconds
+            totals.io_seconds += io_seconds
+            self.fsyncs += fsync
+            self.recent.append(event)
+            self._write_log(event)
+
+    def _finish_action(self, name, saves, elapsed):
+        with self._lock:
+            totals = self.totals[name]
+            totals.calls += 1
+            totals.max_saves = max(totals.max_saves, saves)
+            self._write_log({'type': 'action', 'time': time.time(), 'action': name, 'saves': saves,
+                             'duration_ms': round(elapsed * 1000, 3)})
+
+    def _write_log(self, entry):
+        if self._log_file is not None:
+            self._log_file.write(json.dumps(entry) + '\n')
+            self._log_file.flush()
+
+    def _wrap(self, name, func):
+        accountant = self
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stack = getattr(accountant._local, 'stack', None)
+            if stack is None:
+                stack = accountant._local.stack = []
+            if stack:
+                # Nested call; I/O is charged to the outermost action
+                return func(*args, **kwargs)
+            frame = [name, 0]
+            stack.append(frame)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stack.pop()
+                accountant._finish_action(name, frame[1], time.perf_counter() - started)
+        return wrapper
+
+    def install(self, cls):
+        """Sets this accountant as cls.io_observer and tracks cls's public methods as actions."""
+        cls.io_observer = self
+        for name, func in list(vars(cls).items()):
+            if inspect.isfunction(func) and not name.startswith('_') and (cls, name) not in self._originals:
+                self._originals[(cls, name)] = func
+                setattr(cls, name, self._wrap(name, func))
+
+    def uninstall(self):
+        for (cls, name), func in self._originals.items():
+            setattr(cls, name, func)
+            cls.io_observer = None
+        self._originals.clear()
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    def summary(self):
+        """Per-action totals plus the overall write volume, most bytes written first."""
+        with self._lock:
+            actions = {name: totals.to_dict() for name, totals in self.totals.items()}
+        return {
+            'actions': dict(sorted(actions.items(), key=lambda kv: -kv[1]['bytes_written'])),
+            'total_saves': sum(a['saves'] for a in actions.values()),
+            'total_bytes_written': sum(a['bytes_written'] for a in actions.values()),
+            'fsyncs': self.fsyncs,
+        }
+
+
+accountant = None
+
+
+def enable(log_path=IO_LOG_FILE):
+    global accountant
+    from game_manager import GameManager
+    if accountant is None:
+        accountant = IOAccountant(log_path)
+        accountant.install(GameManager)
+        print(f"INFO: Save I/O accounting enabled, logging to '{log_path}'.")
+    return accountant
+
+
+def enable_from_environment():
+    if os.environ.get(ENV_VAR, '') in ('', '0'):
+        return None
+    return enable()
+
+
+def summarize_log(path):
+    """Rebuilds per-action totals from a JSONL log written by IOAccountant."""
+    totals = collections.defaultdict(_ActionTotals)
+    fsyncs = 0
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"WARNING: Skipping malformed log line: {line[:80]}")
+                continue
+            action = totals[entry['action']]
+            if entry['type'] == 'action':
+                action.calls += 1
+                action.max_saves = max(action.max_saves, entry['saves'])
+                continue
+            if entry['operation'] in WRITE_OPERATIONS:
+                action.saves += entry['operation'] == 'save_game'
+                action.bytes_written += entry['io_bytes']
+            else:
+                action.loads += 1
+                action.bytes_read += entry['io_bytes']
+            action.serialize_seconds += entry['serialize_ms'] / 1000
+            action.io_seconds += entry['io_ms'] / 1000
+            fsyncs += entry.get('fsync', False)
+    return {name: t.to_dict() for name, t in totals.items()}, fsyncs
+
+
+def print_report(actions, fsyncs, top=None):
+    rows = sorted(actions.items(), key=lambda kv: -kv[1]['bytes_written'])[:top]
+    print(f"{'action':<32}{'calls':>7}{'saves':>7}{'saves/call':>12}{'max':>6}{'MB written':>12}"
+          f"{'KB/call':>10}{'serialize ms':>14}{'io ms':>10}")
+    for name, row in rows:
+        print(f"{name:<32}{row['calls']:>7}{row['saves']:>7}{row['saves_per_call']:>12.2f}"
+              f"{row['max_saves_per_call']:>6}{row['bytes_written'] / 1e6:>12.2f}"
+              f"{row['bytes_written_per_call'] / 1e3:>10.1f}{row['serialize_ms']:>14.1f}{row['io_ms']:>10.1f}")
+    total_saves = sum(r['saves'] for r in actions.values())
+    total_bytes = sum(r['bytes_written'] for r in actions.values())
+    print(f"\nTotal: {total_saves} saves, {total_bytes / 1e6:.2f} MB written, {fsyncs} fsyncs.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report save I/O per action from an accounting log.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    report = subparsers.add_parser('report', help="Summarize a JSONL log.")
+    report.add_argument('log', nargs='?', default=IO_LOG_FILE)
+    report.add_argument('--top', type=int, default=None, help="Only show the N actions that wrote the most.")
+    report.add_argument('--json', action='store_true', help="Print the summary as JSON instead of a table.")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.log):
+        print(f"ERROR: Log file '{args.log}' not found.")
+        return 1
+    actions, fsyncs = summarize_log(args.log)
+    if args.json:
+        print(json.dumps({'actions': actions, 'fsyncs': fsyncs}, indent=4))
+    else:
+        print_report(actions, fsyncs, args.top)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,450 @@
+# list_models.py
+"""
+Item models for the long lists in GameGUI (quests, inventory, forge, pets, punishments).
+
+Each model reads a live Player collection through a callable and keeps a cheap
+version tuple per row. sync() diffs the collection against the rows it last showed,
+by identity and then by version, and emits row-level remove/insert/dataChanged
+signals, so the view repaints only what changed. The display snapshot of a row
+(formatted text, parsed dates) is built when the row is first painted and dropped
+when its version changes, so only rows on screen are ever formatted. The item itself
+is available through Qt.UserRole.
+
+Punishment rows are several lines of styled text; PunishmentDelegate paints them
+directly instead of the view hosting one QLabel per row.
+"""
+import bisect
+import datetime
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QPoint, QRect, QSize, QSortFilterProxyModel, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PyQt5.QtWidgets import QApplication, QListView, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+QUEST_TYPE_ROLE = Qt.UserRole + 1
+QUEST_DUE_ROLE = Qt.UserRole + 2
+PUNISHMENT_LINES_ROLE = Qt.UserRole + 3
+
+SEVERITY_ORDER = {"Terrible": 0, "High": 1, "Moderate": 2, "OK": 3}
+SEVERITY_COLORS = {"OK": "green", "Moderate": "orange", "High": "red", "Terrible": "darkred"}
+
+TRANSCENDED_COLOR = QColor('purple')
+OVERDUE_COLOR = QColor('red')
+DUE_COLOR = QColor('#333333')
+PLACEHOLDER_COLOR = QColor('#7f8c8d')
+
+
+class SnapshotListModel(QAbstractListModel):
+    """List model over a live collection; subclasses define version(), row_data() and maybe snapshot()."""
+
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self._source = source # Callable returning the current items
+        self._keys = []
+        self._items = []
+        self._versions = []
+        self._snapshots = [] # None until the row is painted
+
+    def key(self, item):
+        """Row identity across syncs. Items are the Player's own objects, so identity is enough."""
+        return id(item)
+
+    def version(self, item):
+        """Cheap comparable stand-in for what a row displays; a changed version means dataChanged."""
+        raise NotImplementedError
+
+    def snapshot(self, item):
+        """What row_data() renders from. Most rows display their version as it is."""
+        return self.version(item)
+
+    def row_data(self, snapshot, role):
+        raise NotImplementedError
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._items):
+            return None
+        row = index.row()
+        if role == Qt.UserRole:
+            return self._items[row]
+        snapshot = self._snapshots[row]
+        if snapshot is None:
+            snapshot = self._snapshots[row] = self.snapshot(self._items[row])
+        return self.row_data(snapshot, role)
+
+    def item(self, row):
+        return self._items[row]
+
+    def sync(self):
+        """Brings the rows in line with the source, signalling only the rows that changed."""
+        items = list(self._source())
+        keys = list(map(self.key, items))
+        versions = list(map(self.version, items))
+        if keys != self._keys and not self._sync_rows(items, keys, versions):
+            # Rows were reordered; a reset is simpler than working out the moves
+            self.beginResetModel()
+            self._keys, self._items, self._versions = keys, items, versions
+            self._snapshots = [None] * len(items)
+            self.endResetModel()
+            return
+        self._items = items
+        if versions != self._versions: # One C-level comparison when nothing changed
+            self._sync_data(versions)
+
+    def _sync_rows(self, items, keys, versions):
+        """Removes and inserts rows to match keys. Returns False if the kept rows changed order."""
+        wanted = set(keys)
+        if len(wanted) != len(keys):
+            return False
+        # Removals, bottom up so the row numbers above stay valid
+        row = len(self._keys) - 1
+        while row >= 0:
+            if self._keys[row] in wanted:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._keys[row] not in wanted:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._keys[row + 1:last + 1]
+            del self._items[row + 1:last + 1]
+            del self._versions[row + 1:last + 1]
+            del self._snapshots[row + 1:last + 1]
+            self.endRemoveRows()
+
+        kept = set(self._keys)
+        if [k for k in keys if k in kept] != self._keys:
+            return False
+        # Insertions, in runs of consecutive new rows
+        row = 0
+        while row < len(keys):
+            if row < len(self._keys) and self._keys[row] == keys[row]:
+                row += 1
+                continue
+            end = row
+            while end < len(keys) and keys[end] not in kept:
+                end += 1
+            self.beginInsertRows(QModelIndex(), row, end - 1)
+            self._keys[row:row] = keys[row:end]
+            self._items[row:row] = items[row:end]
+            self._versions[row:row] = versions[row:end]
+            self._snapshots[row:row] = [None] * (end - row)
+            self.endInsertRows()
+            row = end
+        return True
+
+    def _sync_data(self, versions):
+        changed = [row for row, (old, new) in enumerate(zip(self._versions, versions)) if old != new]
+        self._versions = versions
+        for row in changed:
+            self._snapshots[row] = None
+        # One dataChanged per run of consecutive changed rows
+        start = 0
+        for i in range(1, len(changed) + 1):
+            if i == len(changed) or changed[i] != changed[i - 1] + 1:
+                self.dataChanged.emit(self.index(changed[start]), self.index(changed[i - 1]))
+                start = i
+
+
+class GearListModel(SnapshotListModel):
+    """Gear pieces as 'name (type)', transcended ones in purple."""
+
+    def version(self, item):
+        return (item['name'], item['type'], bool(item.get('transcended')))
+
+    def row_data(self, snapshot, role):
+        name, gear_type, transcended = snapshot
+        if role == Qt.DisplayRole:
+            return f"{name} ({gear_type})"
+        if role == Qt.ForegroundRole and transcended:
+            return TRANSCENDED_COLOR
+        return None
+
+
+def _parse_due_date(due_date_str):
+    if not due_date_str:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(due_date_str)
+    except (ValueError, TypeError):
+        return 'invalid'
+
+
+class QuestListModel(SnapshotListModel):
+    """
+    All active quests with their time left. Countdowns are computed when a row is painted,
+    so repainting the visible rows is enough to bring them up to date. Due dates are
+    compared as stored and only parsed for rows that are painted.
+    """
+
+    def version(self, quest):
+        return (quest['name'], quest.get('quest_type'), quest.get('due_date'))
+
+    def snapshot(self, quest):
+        return (quest['name'], quest.get('quest_type'), _parse_due_date(quest.get('due_date')))
+
+    def row_data(self, snapshot, role):
+        name, quest_type, due_date = snapshot
+        if role == QUEST_TYPE_ROLE:
+            return quest_type
+        if role == QUEST_DUE_ROLE:
+            return due_date if isinstance(due_date, datetime.datetime) else None
+        if role not in (Qt.DisplayRole, Qt.ForegroundRole):
+            return None
+        if due_date is None:
+            return name if role == Qt.DisplayRole else None
+        if due_date == 'invalid':
+            return f"{name} (Invalid Date)" if role == Qt.DisplayRole else None
+        seconds_left = (due_date - datetime.datetime.now()).total_seconds()
+        if role == Qt.ForegroundRole:
+            return OVERDUE_COLOR if seconds_left < 0 else DUE_COLOR
+        if seconds_left < 0:
+            return f"{name} (Overdue)"
+        days, rem = divmod(seconds_left, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes, _ = divmod(rem, 60)
+        return f"{name} (Due: {int(days)}d {int(hours)}h {int(minutes)}m)"
+
+    @staticmethod
+    def seconds_to_next_change(indexes):
+        """Seconds until the first of these rows shows a different countdown, or None if none will."""
+        now = datetime.datetime.now()
+        delays = []
+        for index in indexes:
+            due_date = index.data(QUEST_DUE_ROLE)
+            if due_date is None:
+                continue
+            seconds_left = (due_date - now).total_seconds()
+            if seconds_left >= 0: # Overdue rows never change again
+                delays.append(seconds_left % 60) # Countdowns show whole minutes
+        return min(delays) + 0.05 if delays else None
+
+
+class QuestTypeFilterModel(QSortFilterProxyModel):
+    """The main (or side) quests out of a QuestListModel."""
+
+    def __init__(self, source_model, side, parent=None):
+        super().__init__(parent)
+        self.side = side
+        # A quest never changes type, so rows are filtered when inserted and dataChanged is
+        # passed through without re-running the filter on every changed row
+        self.setDynamicSortFilter(False)
+        self.setSourceModel(source_model)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        # Read from the quest itself so filtering doesn't build a snapshot for every row
+        quest_type = self.sourceModel().item(source_row).get('quest_type')
+        return (quest_type == 'side') == self.side
+
+
+class TextFilterModel(QSortFilterProxyModel):
+    """Rows whose display text contains a search string, ignoring case. Empty shows every row."""
+
+    def __init__(self, source_model, parent=None):
+        super().__init__(parent)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setSourceModel(source_model)
+
+    def set_search(self, text):
+        self.setFilterFixedString(text.strip())
+
+
+class PetListModel(SnapshotListModel):
+    """Owned pets with their level and XP. The items are pet names."""
+
+    def __init__(self, source, pet_data, parent=None):
+        super().__init__(source, parent)
+        self._pet_data = pet_data # Callable: pet name -> catalog entry
+
+    def key(self, pet_name):
+        return pet_name
+
+    def version(self, pet_name):
+        pet = self._pet_data(pet_name)
+        return (pet['Name'], pet['Level'], pet['XP'], pet['XP_to_Evolve'])
+
+    def row_data(self, snapshot, role):
+        if role == Qt.DisplayRole:
+            name, level, xp, xp_to_evolve = snapshot
+            return f"{name} (Level: {level}, XP: {xp}/{xp_to_evolve})"
+        return None
+
+
+def _severity_rank(punishment):
+    return SEVERITY_ORDER.get(punishment['severity'], 99)
+
+
+class PunishmentListModel(SnapshotListModel):
+    """
+    Punishments ordered by severity, worst first, in creation order within a severity.
+    Punishments are only ever appended, so sync() places each new one at its sorted
+    position instead of re-sorting; anything else (e.g. a shorter list) rebuilds the rows.
+    """
+
+    def __init__(self, source, parent=None):
+        super().__init__(source, parent)
+        self._ranks = [] # Severity rank per row, for bisect
+        self._seen = [] # Source order of the punishments placed so far
+
+    def snapshot(self, p):
+        title = f"{p['name']} ({p['severity']})"
+        stats = f"Points: {p['punishment']} | XP: -{p.get('xp_penalty', 0)} | Coins: -{p.get('coin_penalty', 0)}"
+        special = None
+        if p.get('special_chance', 0) > 0:
+            effect_name = p.get('special_effect', 'a penalty').replace('_', ' ')
+            special = f"({p['special_chance']*100:.0f}% chance of special penalty: {effect_name})"
+        return (title, stats, special), SEVERITY_COLORS.get(p['severity'], 'black')
+
+    def row_data(self, snapshot, role):
+        lines, color = snapshot
+        if role == PUNISHMENT_LINES_ROLE:
+            return lines
+        if role == Qt.DisplayRole:
+            return "\n".join(line for line in lines if line)
+        if role == Qt.ForegroundRole:
+            return QColor(color)
+        return None
+
+    def sync(self):
+        punishments = self._source()
+        seen = len(self._seen)
+        if len(punishments) < seen or (seen and punishments[seen - 1] is not self._seen[-1]):
+            seen = 0 # Not a plain append
+        if seen == 0:
+            ordered = sorted(punishments, key=_severity_rank)
+            self.beginResetModel()
+            self._items = ordered
+            self._keys = [self.key(p) for p in ordered]
+            self._snapshots = [self.snapshot(p) for p in ordered]
+            self._ranks = [_severity_rank(p) for p in ordered]
+            self._seen = list(punishments)
+            self.endResetModel()
+            return
+        for p in punishments[seen:]:
+            rank = _severity_rank(p)
+            row = bisect.bisect_right(self._ranks, rank) # After the existing ones of equal severity
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._items.insert(row, p)
+            self._keys.insert(row, self.key(p))
+            self._snapshots.insert(row, self.snapshot(p))
+            self._ranks.insert(row, rank)
+            self.endInsertRows()
+            self._seen.append(p)
+
+
+class PunishmentDelegate(QStyledItemDelegate):
+    """
+    Paints a punishment row in its severity color: bold title, stats, italic special effect.
+    Text widths are measured once per line, and only lines that wrap are measured again
+    per view width, so the relayout after every insert or resize is mostly cache lookups.
+    """
+    PADDING = 5
+    MAX_CACHED = 50000
+
+    def __init__(self, view):
+        super().__init__(view)
+        self._view = view
+        self._base_font = None
+        self._advances = {} # (line index, text) -> unwrapped width
+        self._wrapped = {} # (line index, text, width) -> wrapped height
+
+    def _update_fonts(self):
+        """Derives the line fonts from the view's, which the stylesheet can change after creation."""
+        base = self._view.font()
+        if base == self._base_font and len(self._advances) < self.MAX_CACHED and len(self._wrapped) < self.MAX_CACHED:
+            return
+        self._base_font = QFont(base)
+        bold, italic = QFont(base), QFont(base)
+        bold.setBold(True)
+        italic.setItalic(True)
+        self._fonts = (bold, QFont(base), italic)
+        self._metrics = tuple(QFontMetrics(font) for font in self._fonts)
+        self._line_heights = tuple(metrics.height() for metrics in self._metrics)
+        self._advances.clear()
+        self._wrapped.clear()
+
+    def _text_width(self):
+        return max(50, self._view.viewport().width() - 2 * self.PADDING)
+
+    def _layout(self, lines, width):
+        """(line index, text, height) for each line shown."""
+        self._update_fonts()
+        layout = []
+        for i, text in enumerate(lines):
+            if not text:
+                continue
+            advance = self._advances.get((i, text))
+            if advance is None:
+                advance = self._advances[(i, text)] = self._metrics[i].horizontalAdvance(text)
+            if advance <= width:
+                height = self._line_heights[i]
+            else:
+                height = self._wrapped.get((i, text, width))
+                if height is None:
+                    height = self._metrics[i].boundingRect(QRect(0, 0, width, 100000), Qt.TextWordWrap, text).height()
+                    self._wrapped[(i, text, width)] = height
+            layout.append((i, text, height))
+        return layout
+
+    def sizeHint(self, option, index):
+        width = self._text_width()
+        height = sum(h for _, _, h in self._layout(index.data(PUNISHMENT_LINES_ROLE), width))
+        return QSize(width + 2 * self.PADDING, height + 2 * self.PADDING)
+
+    def paint(self, painter, option, index):
+        # Background, hover and selection come from the style (and the ::item stylesheet rules)
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        width = self._text_width()
+        painter.save()
+        painter.setPen(index.data(Qt.ForegroundRole))
+        y = option.rect.y() + self.PADDING
+        for i, text, height in self._layout(index.data(PUNISHMENT_LINES_ROLE), width):
+            painter.setFont(self._fonts[i])
+            painter.drawText(QRect(option.rect.x() + self.PADDING, y, width, height),
+                             Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, text)
+            y += height
+        painter.restore()
+
+
+class ModelListView(QListView):
+    """QListView showing a placeholder when its model is empty, with QListWidget-style helpers."""
+    selection_changed = pyqtSignal()
+
+    def __init__(self, model, placeholder="", parent=None, uniform_rows=True):
+        super().__init__(parent)
+        self.placeholder = placeholder
+        if uniform_rows:
+            self.setUniformItemSizes(True) # Rows are single lines, so the view never measures them one by one
+        else:
+            self.setResizeMode(QListView.Adjust) # Wrapped rows change height with the width
+        self.setModel(model)
+        self.selectionModel().selectionChanged.connect(lambda *_: self.selection_changed.emit())
+
+    def selected_indexes(self):
+        return self.selectionModel().selectedRows()
+
+    def visible_indexes(self):
+        """Indexes of the rows currently on screen (none while the view is hidden)."""
+        model = self.model()
+        if not self.isVisible() or not model.rowCount():
+            return []
+        x = self.viewport().width() // 2
+        top = self.indexAt(QPoint(x, 1))
+        bottom = self.indexAt(QPoint(x, self.viewport().height() - 2))
+        first = top.row() if top.isValid() else 0
+        last = bottom.row() if bottom.isValid() else model.rowCount() - 1
+        return [model.index(row, 0) for row in range(first, last + 1)]
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.placeholder and self.model().rowCount() == 0:
+            painter = QPainter(self.viewport())
+            painter.setPen(PLACEHOLDER_COLOR)
+            painter.drawText(self.viewport().rect().adjusted(8, 8, -8, -8),
+                             Qt.AlignTop | Qt.AlignLeft | Qt.TextWordWrap, self.placeholder)
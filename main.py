@@ -1,23 +1,44 @@
 # main.py
 
 import sys
-from PyQt5.QtWidgets import QApplication
-from gui import ApplicationController # Import ApplicationController instead of GameGUI
-from game_manager import GameManager
+from functools import partial
+import startup_profiler
+startup_profiler.enable_from_environment(sys.argv) # Must run before the heavy imports below to time them
+import memory_snapshots
+memory_snapshots.start_from_environment() # RPG_TRACEMALLOC traces allocations from launch
+
+with startup_profiler.phase('import PyQt5'):
+    from PyQt5.QtWidgets import QApplication
+with startup_profiler.phase('import gui'):
+    from gui import ApplicationController # Import ApplicationController instead of GameGUI
+with startup_profiler.phase('import game_manager'):
+    from game_manager import GameManager
 # config, levels_csv, etc. are imported within GameManager via its init
+import metrics
+import tracing
+import stall_watchdog
+import io_accounting
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    with startup_profiler.phase('QApplication'):
+        app = QApplication(sys.argv)
+    watchdog = stall_watchdog.start(app) # Opt-in stall logging of the GUI thread's stack, see stall_watchdog.py
+
+    metrics.enable_from_environment() # Opt-in GameManager timings, see metrics.py
+    tracing.enable_from_environment() # Opt-in span ring buffer, see tracing.py
+    io_accounting.enable_from_environment() # Opt-in save I/O log, see io_accounting.py
 
-    # Initialize the game manager.
+    # The game manager is constructed by the controller on its game executor, so the
+    # save loads while the welcome screen plays.
     # Set 'force_new_game=True' to always start with fresh data,
     # discarding any existing save file at startup.
     # If you want to load previously saved data in the future, change this to 'False'.
-    game_manager = GameManager(force_new_game=False)
+    load_game = partial(GameManager, force_new_game=False)
 
     # Create and show the main window using ApplicationController
-    controller = ApplicationController(game_manager) # Instantiate ApplicationController
+    with startup_profiler.phase('ApplicationController construction'):
+        controller = ApplicationController(load_game) # Instantiate ApplicationController
     # The ApplicationController internally handles showing the welcome screen and then the main GUI.
 
     # Ensure the application exits cleanly
-    sys.exit(app.exec_())
\ No newline at end of file
+    sys.exit(app.exec_())
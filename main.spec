@@ -10,7 +10,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['matplotlib', 'numpy'], # The skills chart is drawn with QPainter
     noarchive=False,
     optimize=0,
 )
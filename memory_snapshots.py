@@ -0,0 +1,198 @@
+# memory_snapshots.py
+"""
+On-demand memory snapshots for finding leaks in long sessions.
+
+Each snapshot combines a tracemalloc snapshot with object counts: the sizes of the
+Player sub-structures (quests, inventory, skills, ...), live Qt widgets by class, and
+the most common Python object types. Comparing two snapshots attributes the growth
+to module and line and shows which counts went up.
+
+In the game, Ctrl+Shift+M takes a snapshot. The first press starts tracemalloc and
+records a baseline; each later press writes a diff against the previous snapshot.
+Snapshots are saved under config.MEMORY_DIR and can be compared offline:
+
+    python memory_snapshots.py compare memory/snapshot_1 memory/snapshot_2 --group-by filename
+
+tracemalloc only sees allocations made after it starts. Set RPG_TRACEMALLOC=<frames>
+to start it at launch (main.py calls start_from_environment()).
+"""
+import argparse
+import collections
+import datetime
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+from config import MEMORY_DIR
+
+ENV_VAR = 'RPG_TRACEMALLOC'
+DEFAULT_FRAMES = 10
+TOP_TYPES = 30
+
+PLAYER_COLLECTIONS = ['quests', 'inventory', 'skills', 'pets', 'custom_punishments', 'achievements',
+                      'unlocked_titles', 'completed_side_quests_today', 'pet_cooldowns', 'play_cooldowns',
+                      'daily_tasks', 'gear']
+
+# Allocations made by the profiling machinery itself are noise
+_IGNORED = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+]
+
+
+def start(frames=DEFAULT_FRAMES):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def start_from_environment():
+    frames = os.environ.get(ENV_VAR, '')
+    if frames in ('', '0'):
+        return False
+    start(int(frames) if frames.isdigit() else DEFAULT_FRAMES)
+    return True
+
+
+def collect_counts(game_manager=None):
+    """Player sub-structure sizes, live Qt widgets by class and the most common object types."""
+    counts = {'player': {}, 'widgets': {}, 'types': {}}
+    if game_manager is not None:
+        player = game_manager.player
+        for name in PLAYER_COLLECTIONS:
+            value = getattr(player, name, None)
+            if value is not None:
+                counts['player'][name] = len(value)
+        counts['player']['punishments_data'] = len(game_manager.punishments_data)
+
+    if 'PyQt5.QtWidgets' in sys.modules: # Never import Qt just for counting
+        from PyQt5.QtWidgets import QApplication
+        app = QApplication.instance()
+        if app is not None:
+            widget_counts = collections.Counter(type(w).__name__ for w in app.allWidgets())
+            counts['widgets'] = dict(widget_counts.most_common())
+            counts['widgets_total'] = sum(widget_counts.values())
+
+    type_counts = collections.Counter(type(o).__name__ for o in gc.get_objects())
+    counts['types'] = dict(type_counts.most_common(TOP_TYPES))
+    return counts
+
+
+class MemorySnapshot:
+    def __init__(self, label, tracemalloc_snapshot, counts, taken_at=None):
+        self.label = label
+        self.tracemalloc_snapshot = tracemalloc_snapshot
+        self.counts = counts
+        self.taken_at = taken_at or datetime.datetime.now().isoformat(timespec='seconds')
+
+    @classmethod
+    def take(cls, label, game_manager=None):
+        start()
+        gc.collect()
+        counts = collect_counts(game_manager)
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        return cls(label, snapshot, counts)
+
+    def dump(self, base_path):
+        """Writes <base_path>.tracemalloc and <base_path>.json."""
+        os.makedirs(os.path.dirname(base_path) or '.', exist_ok=True)
+        self.tracemalloc_snapshot.dump(f"{base_path}.tracemalloc")
+        with open(f"{base_path}.json", 'w') as f:
+            json.dump({'label': self.label, 'taken_at': self.taken_at, 'counts': self.counts}, f, indent=4)
+
+    @classmethod
+    def load(cls, base_path):
+        base_path = base_path[:-len('.tracemalloc')] if base_path.endswith('.tracemalloc') else base_path
+        base_path = base_path[:-len('.json')] if base_path.endswith('.json') else base_path
+        with open(f"{base_path}.json", 'r') as f:
+            meta = json.load(f)
+        snapshot = tracemalloc.Snapshot.load(f"{base_path}.tracemalloc")
+        return cls(meta['label'], snapshot, meta['counts'], meta['taken_at'])
+
+
+def _count_deltas(before, after):
+    deltas = {}
+    for key in set(before) | set(after):
+        change = after.get(key, 0) - before.get(key, 0)
+        if change:
+            deltas[key] = (before.get(key, 0), after.get(key, 0), change)
+    return sorted(deltas.items(), key=lambda kv: -abs(kv[1][2]))
+
+
+def compare(before, after, top=25, group_by='lineno'):
+    """Returns a text report of what grew between two MemorySnapshots."""
+    stats = after.tracemalloc_snapshot.compare_to(before.tracemalloc_snapshot, group_by)
+    total_change = sum(stat.size_diff for stat in stats)
+    lines = [f"Memory diff: '{before.label}' ({before.taken_at}) -> '{after.label}' ({after.taken_at})",
+             f"Traced memory change: {total_change / 1024:+.1f} KiB", "",
+             f"Top {top} allocation changes by {group_by}:"]
+    for stat in stats[:top]:
+        frame = stat.traceback[0]
+        lines.append(f"  {stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8d} blocks  "
+                     f"{frame.filename}:{frame.lineno if group_by != 'filename' else ''}")
+
+    for section, title in [('player', 'Player structures'), ('widgets', 'Qt widgets by class'),
+                           ('types', 'Python objects by type')]:
+        deltas = _count_deltas(before.counts.get(section, {}), after.counts.get(section, {}))
+        lines.append("")
+        lines.append(f"{title}:" if deltas else f"{title}: no change")
+        for name, (old, new, change) in deltas[:top]:
+            lines.append(f"  {name:<32}{old:>10}{new:>10}{change:>+10}")
+    if 'widgets_total' in after.counts:
+        lines.append("")
+        lines.append(f"Live widgets: {before.counts.get('widgets_total', 0)} -> {after.counts['widgets_total']}")
+    return "\n".join(lines)
+
+
+class SnapshotSession:
+    """Backs the in-game hotkey: every call snapshots and diffs against the previous snapshot."""
+
+    def __init__(self, game_manager, directory=MEMORY_DIR):
+        self.game_manager = game_manager
+        self.directory = directory
+        self.previous = None
+        self.index = 0
+
+    def snapshot(self):
+        """Returns (message, report path or None)."""
+        self.index += 1
+        stamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        label = f"snapshot_{self.index}"
+        current = MemorySnapshot.take(label, self.game_manager)
+        current.dump(os.path.join(self.directory, f"{stamp}_{label}"))
+        if self.previous is None:
+            self.previous = current
+            return f"Memory baseline recorded ({label}). Take another snapshot later to see what grew.", None
+        report = compare(self.previous, current)
+        report_path = os.path.join(self.directory, f"{stamp}_diff_{self.previous.label}_{label}.txt")
+        with open(report_path, 'w') as f:
+            f.write(report + "\n")
+        self.previous = current
+        return report.splitlines()[1], report_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare memory snapshots written by the game.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    compare_parser = subparsers.add_parser('compare', help="Diff two snapshots (paths without extension).")
+    compare_parser.add_argument('before')
+    compare_parser.add_argument('after')
+    compare_parser.add_argument('--top', type=int, default=25)
+    compare_parser.add_argument('--group-by', choices=['lineno', 'filename', 'traceback'], default='lineno')
+    args = parser.parse_args(argv)
+
+    try:
+        before = MemorySnapshot.load(args.before)
+        after = MemorySnapshot.load(args.after)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"ERROR: Could not load snapshots: {e}")
+        return 1
+    print(compare(before, after, args.top, args.group_by))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,204 @@
+# metrics.py
+"""
+Opt-in per-method metrics for GameManager.
+
+install() wraps GameManager's public methods (plus a few private hot paths) at the
+class level and records, per method, call counts, cumulative and percentile latency
+and how many save_game calls (disk writes) each call triggered, including saves made
+by nested calls. Nothing is wrapped until install() runs, so there is no overhead when
+metrics are disabled.
+
+Enable it with RPG_METRICS=1. The registry is then dumped periodically to the
+metrics file (config.METRICS_FILE, or RPG_METRICS_FILE) and once more at exit.
+In-process, use snapshot() to query the numbers.
+"""
+import atexit
+import collections
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+
+from config import METRICS_FILE, METRICS_DUMP_INTERVAL
+
+ENV_VAR = 'RPG_METRICS'
+FILE_ENV_VAR = 'RPG_METRICS_FILE'
+INTERVAL_ENV_VAR = 'RPG_METRICS_INTERVAL'
+
+SAMPLE_WINDOW = 1024 # Latency samples kept per method for percentiles
+EXTRA_METHODS = ['_load_game', '_check_and_reset_daily_tasks', '_decay_skills', '_add_random_gear_to_inventory']
+
+
+class _MethodStats:
+    def __init__(self):
+        self.calls = 0
+        self.top_level_calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.samples = collections.deque(maxlen=SAMPLE_WINDOW)
+        self.saves_total = 0
+        self.saves_max = 0
+
+    def to_dict(self):
+        ordered = sorted(self.samples)
+
+        def percentile(fraction):
+            if not ordered:
+                return 0.0
+            return round(ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))] * 1000, 4)
+
+        return {
+            'calls': self.calls,
+            'top_level_calls': self.top_level_calls,
+            'total_ms': round(self.total_seconds * 1000, 4),
+            'mean_ms': round(self.total_seconds * 1000 / self.calls, 4) if self.calls else 0.0,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'p99_ms': percentile(0.99),
+            'max_ms': round(self.max_seconds * 1000, 4),
+            'saves_total': self.saves_total,
+            'saves_per_call': round(self.saves_total / self.calls, 3) if self.calls else 0.0,
+            'saves_max': self.saves_max,
+        }
+
+
+class MetricsRegistry:
+    """Collects timings for the wrapped methods. Safe to use from several threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = collections.defaultdict(_MethodStats)
+        self._local = threading.local() # Per-thread stack of save counters for the calls in progress
+        self._originals = {} # (class, name) -> original function
+        self.started_at = time.time()
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _wrap(self, name, func):
+        registry = self
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stack = registry._stack()
+            is_save = name == 'save_game'
+            if is_save:
+                # Every call in progress on this thread gets charged for the write
+                for frame in stack:
+                    frame[0] += 1
+            frame = [1 if is_save else 0]
+            stack.append(frame)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                stack.pop()
+                registry._record(name, elapsed, frame[0], top_level=not stack)
+        return wrapper
+
+    def _record(self, name, elapsed, saves, top_level):
+        with self._lock:
+            stats = self._stats[name]
+            stats.calls += 1
+            stats.top_level_calls += top_level
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            stats.samples.append(elapsed)
+            stats.saves_total += saves
+            stats.saves_max = max(stats.saves_max, saves)
+
+    def install(self, cls):
+        """Wraps the public methods of cls (and EXTRA_METHODS) in place."""
+        for name, func in list(vars(cls).items()):
+            if not inspect.isfunction(func) or (name.startswith('_') and name not in EXTRA_METHODS):
+                continue
+            if (cls, name) in self._originals:
+                continue
+            self._originals[(cls, name)] = func
+            setattr(cls, name, self._wrap(name, func))
+
+    def uninstall(self):
+        for (cls, name), func in self._originals.items():
+            setattr(cls, name, func)
+        self._originals.clear()
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
+
+    def snapshot(self, method=None):
+        """Returns the stats for one method, or for every method that has been called."""
+        with self._lock:
+            if method is not None:
+                return self._stats[method].to_dict() if method in self._stats else None
+            return {
+                'started_at': self.started_at,
+                'taken_at': time.time(),
+                'methods': {name: stats.to_dict() for name, stats in sorted(self._stats.items())},
+            }
+
+    def slowest(self, count=10, key='total_ms'):
+        """The `count` methods with the highest value for `key` (e.g. 'p99_ms', 'saves_total')."""
+        methods = self.snapshot()['methods']
+        return sorted(methods.items(), key=lambda kv: -kv[1][key])[:count]
+
+    def dump(self, path):
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(self.snapshot(), f, indent=4)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"WARNING: Could not write metrics to '{path}': {e}")
+
+
+class _PeriodicDumper(threading.Thread):
+    def __init__(self, registry, path, interval):
+        super().__init__(name='metrics-dumper', daemon=True)
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.registry.dump(self.path)
+
+    def stop(self):
+        self._stop_event.set()
+
+
+registry = MetricsRegistry()
+_dumper = None
+
+
+def enable(path=METRICS_FILE, interval=METRICS_DUMP_INTERVAL):
+    """Instruments GameManager and starts the periodic dump thread."""
+    global _dumper
+    from game_manager import GameManager
+    registry.install(GameManager)
+    if _dumper is None:
+        _dumper = _PeriodicDumper(registry, path, interval)
+        _dumper.start()
+        atexit.register(registry.dump, path)
+    print(f"INFO: GameManager metrics enabled, dumping to '{path}' every {interval}s.")
+
+
+def enable_from_environment():
+    if os.environ.get(ENV_VAR, '') in ('', '0'):
+        return False
+    path = os.environ.get(FILE_ENV_VAR, METRICS_FILE)
+    interval = float(os.environ.get(INTERVAL_ENV_VAR, METRICS_DUMP_INTERVAL))
+    enable(path, interval)
+    return True
+
+
+def snapshot(method=None):
+    return registry.snapshot(method)
@@ -0,0 +1,234 @@
+# profile_generator.py
+"""
+Synthetic player profile generator for load and scaling tests.
+
+Emits valid Player.to_dict documents at a configurable scale: quests with due
+dates, inventories of enchanted and transcended gear with extra effects, custom
+skills, pets with feed/play cooldowns and custom punishment lists. Item shapes come
+from the GameManager catalogs so the documents load like a real save.
+
+Generation is seeded (every section has its own random stream, so growing one
+section does not change the others) and write_profile streams the large sections
+element by element, so multi-gigabyte fixtures never have to fit in memory.
+
+Usage:
+    python profile_generator.py big_save.json --quests 10000 --inventory 50000 --custom-skills 500 \\
+        --punishments 5000 --seed 1
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import random
+import sys
+
+from game_manager import GameManager
+
+CORE_SKILLS = ['Strength', 'Endurance', 'Durability', 'Intellect', 'Faith']
+SEVERITIES = ["OK", "Moderate", "High", "Terrible"]
+SPECIAL_EFFECTS = ['pet_loss', 'title_loss', 'skill_decay']
+QUEST_STEPS = "1. Identify the task.\n2. Complete the task.\n3. Mark as complete."
+
+
+class _Stream:
+    """A lazily generated list ('list') or dict ('dict', yielding key/value pairs) section."""
+
+    def __init__(self, kind, iterator):
+        self.kind = kind
+        self.iterator = iterator
+
+    def materialize(self):
+        return dict(self.iterator) if self.kind == 'dict' else list(self.iterator)
+
+
+def load_catalog():
+    """A throwaway GameManager whose catalogs (quests, gear, pets, effects) drive the generator."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        return GameManager(force_new_game=True, save_file=os.devnull)
+
+
+def _rng(seed, section):
+    return random.Random(f"{seed}:{section}")
+
+
+def _iter_quests(catalog, count, seed, now, overdue_fraction):
+    rng = _rng(seed, 'quests')
+    for i in range(count):
+        template = rng.choice(catalog.side_quest_templates)
+        if rng.random() < overdue_fraction:
+            due = now - datetime.timedelta(minutes=rng.randint(1, 60 * 24 * 7))
+        else:
+            due = now + datetime.timedelta(days=365, minutes=i)
+        yield {
+            'name': f"{template['name']} #{i}",
+            'description': template['description'],
+            'xp_reward': template['xp_reward'],
+            'coin_reward': template['coin_reward'],
+            'quest_type': 'side' if i % 3 else 'main',
+            'due_date': due.isoformat(),
+            'steps': QUEST_STEPS,
+        }
+
+
+def _make_gear_item(catalog, rng, index, gear_type=None):
+    gear_type = gear_type or rng.choice(list(catalog.gear_data))
+    item = dict(rng.choice(catalog.gear_data[gear_type]))
+    item['buff'] = dict(item['buff'])
+    item['type'] = gear_type
+    item['enchant_level'] = rng.randint(0, 6)
+    item['transcended'] = rng.random() < 0.3
+    if item['transcended'] and rng.random() < 0.5:
+        item['extra_effect'] = dict(rng.choice(catalog.extra_status_effects))
+    prefix = 'Transcended ' if item['transcended'] else ''
+    item['name'] = f"{prefix}{item['name']} #{index} +{item['enchant_level']}"
+    return item
+
+
+def _iter_inventory(catalog, count, seed):
+    rng = _rng(seed, 'inventory')
+    for i in range(count):
+        yield _make_gear_item(catalog, rng, i)
+
+
+def _iter_skills(count, seed, today):
+    rng = _rng(seed, 'skills')
+    names = CORE_SKILLS + [f"Custom Skill #{i}" for i in range(count)]
+    for name in names:
+        last_updated = today - datetime.timedelta(days=rng.randint(0, 3))
+        yield name, {'xp': rng.randint(0, 600), 'last_updated': last_updated.isoformat()}
+
+
+def _pet_names(catalog, count=None):
+    """
+    The first count catalog pets (all of them if count is None). A player owns each pet
+    at most once (add_pet_egg only hands out new ones), so count is capped at the catalog size.
+    """
+    names = [p['Name'] for p in catalog.pets_data if 'Name' in p]
+    return names if count is None else names[:count]
+
+
+def _iter_cooldowns(pet_names, seed, section, now, max_minutes):
+    rng = _rng(seed, section)
+    for name in pet_names:
+        # Mix of cooldowns still running and ones that already expired
+        offset = datetime.timedelta(minutes=rng.randint(-max_minutes, max_minutes))
+        yield name, (now + offset).isoformat()
+
+
+def _iter_punishments(count, seed):
+    rng = _rng(seed, 'punishments')
+    for i in range(count):
+        yield {
+            'name': f"Custom Habit #{i}",
+            'severity': rng.choice(SEVERITIES),
+            'punishment': rng.randint(0, 10),
+            'xp_penalty': rng.randint(0, 50),
+            'coin_penalty': rng.randint(0, 50),
+            'special_chance': rng.choice([0, 0.05, 0.15, 0.3]),
+            'special_effect': rng.choice(SPECIAL_EFFECTS),
+            'custom': True,
+        }
+
+
+def _document(catalog, quests, inventory, custom_skills, pets, punishments, seed, now, overdue_fraction):
+    """The profile with its large sections left as _Stream objects, in Player.to_dict key order."""
+    today = now.date()
+    pet_names = _pet_names(catalog, pets)
+    gear_rng = _rng(seed, 'gear')
+    gear = {slot: _make_gear_item(catalog, gear_rng, f"E{n}", gear_type=slot) if slot in catalog.gear_data else None
+            for n, slot in enumerate(['Helmet', 'Chest', 'Weapon', 'Boots'])}
+    return {
+        'xp': 1200, 'coins': 0, 'title': 'Immortal', 'current_level': 1100, 'punishment_sum': 0,
+        'xp_boost_pending': 0, 'coin_gain_multiplier': 1.0, 'punishment_mitigation_pending': False,
+        'pets': pet_names,
+        'quests': _Stream('list', _iter_quests(catalog, quests, seed, now, overdue_fraction)),
+        'daily_tasks_completed': 0, 'last_daily_reset_date': today.isoformat(),
+        'skills': _Stream('dict', _iter_skills(custom_skills, seed, today)),
+        'pet_cooldowns': _Stream('dict', _iter_cooldowns(pet_names, seed, 'pet_cooldowns', now, 60)),
+        'play_cooldowns': _Stream('dict', _iter_cooldowns(pet_names, seed, 'play_cooldowns', now, 10)),
+        'transcendence_buff_end_time': None,
+        'daily_tasks': {}, 'pet_food': 10, 'corruption': 0, 'daily_streak': 3,
+        'unlocked_titles': ['Novice'], 'active_title': None,
+        'gear': gear,
+        'inventory': _Stream('list', _iter_inventory(catalog, inventory, seed)),
+        'achievements': [], 'transcendence_count': 0, 'main_quests_completed': 0,
+        'custom_punishments': _Stream('list', _iter_punishments(punishments, seed)),
+        'last_workout_type': None, 'corruption_peak': 0, 'sanity': 100,
+        'completed_side_quests_today': [],
+    }
+
+
+def build_profile(quests=0, inventory=0, custom_skills=0, pets=3, punishments=0, seed=0,
+                  catalog=None, now=None, overdue_fraction=0.0):
+    """Returns the whole profile as an in-memory dict. Use write_profile for large fixtures."""
+    catalog = catalog or load_catalog()
+    now = (now or datetime.datetime.now()).replace(microsecond=0)
+    document = _document(catalog, quests, inventory, custom_skills, pets, punishments, seed, now, overdue_fraction)
+    return {key: value.materialize() if isinstance(value, _Stream) else value
+            for key, value in document.items()}
+
+
+def stream_profile(f, quests=0, inventory=0, custom_skills=0, pets=3, punishments=0, seed=0,
+                   catalog=None, now=None, overdue_fraction=0.0):
+    """Writes the profile as JSON to the text file f one element at a time. Returns the element count."""
+    catalog = catalog or load_catalog()
+    now = (now or datetime.datetime.now()).replace(microsecond=0)
+    document = _document(catalog, quests, inventory, custom_skills, pets, punishments, seed, now, overdue_fraction)
+    elements = 0
+    f.write('{')
+    for position, (key, value) in enumerate(document.items()):
+        f.write(',\n' if position else '\n')
+        f.write(f"{json.dumps(key)}: ")
+        if not isinstance(value, _Stream):
+            f.write(json.dumps(value))
+            continue
+        opening, closing = ('{', '}') if value.kind == 'dict' else ('[', ']')
+        f.write(opening)
+        for index, element in enumerate(value.iterator):
+            f.write(',\n' if index else '\n')
+            if value.kind == 'dict':
+                f.write(f"{json.dumps(element[0])}: {json.dumps(element[1])}")
+            else:
+                f.write(json.dumps(element))
+            elements += 1
+        f.write(closing)
+    f.write('\n}\n')
+    return elements
+
+
+def write_profile(path, **options):
+    """Streams a profile to path, replacing it atomically once it's complete."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w') as f:
+        elements = stream_profile(f, **options)
+    os.replace(temp_path, path)
+    return elements
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic save_game.json at a configurable scale.")
+    parser.add_argument('output', help="Where to write the profile JSON.")
+    parser.add_argument('--quests', type=int, default=1000)
+    parser.add_argument('--inventory', type=int, default=5000)
+    parser.add_argument('--custom-skills', type=int, default=50)
+    parser.add_argument('--pets', type=int, default=None,
+                        help="Pets owned, one of each catalog pet at most (default: the whole catalog).")
+    parser.add_argument('--punishments', type=int, default=500)
+    parser.add_argument('--overdue-fraction', type=float, default=0.0,
+                        help="Fraction of quests whose due date has already passed.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--now', help="ISO timestamp that due dates and cooldowns are relative to (default: now).")
+    args = parser.parse_args(argv)
+
+    now = datetime.datetime.fromisoformat(args.now) if args.now else None
+    elements = write_profile(args.output, quests=args.quests, inventory=args.inventory,
+                             custom_skills=args.custom_skills, pets=args.pets, punishments=args.punishments,
+                             seed=args.seed, now=now, overdue_fraction=args.overdue_fraction)
+    size_mb = os.path.getsize(args.output) / (1024 * 1024)
+    print(f"Wrote {elements} elements ({size_mb:.1f} MB) to '{args.output}'.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+# skills_chart.py
+"""
+Skills donut chart drawn with QPainter.
+
+Shows every skill with XP (the five core skills in their usual colors, custom skills
+after them) as a donut with the total in the middle and a legend beside it. Setting
+the same values again does nothing. New values animate from the previous state, and
+the finished frame is cached in a QPixmap keyed by the skill values and widget size,
+so repaints without a data change are a single pixmap blit.
+"""
+import zlib
+
+from PyQt5.QtCore import Qt, QRectF, QVariantAnimation, QEasingCurve
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen, QPixmap
+from PyQt5.QtWidgets import QSizePolicy, QWidget
+
+CORE_SKILLS = ["Strength", "Endurance", "Durability", "Intellect", "Faith"]
+CORE_COLORS = ['#8A2BE2', '#66CDAA', '#1E90FF', '#FF69B4', '#FFD700'] # Consistent color scheme
+BACKGROUND = '#f0f2f5'
+TEXT_COLOR = '#333333'
+ANIMATION_MS = 350
+RING_WIDTH = 0.3 # Fraction of the radius, like the old matplotlib wedge width
+
+
+def _skill_color(name):
+    if name in CORE_SKILLS:
+        return QColor(CORE_COLORS[CORE_SKILLS.index(name)])
+    # Custom skills get a stable color derived from their name
+    return QColor.fromHsv(zlib.crc32(name.encode('utf-8')) % 360, 150, 210)
+
+
+def skill_values(skills):
+    """(name, xp) for every skill with XP: core skills first, then custom skills in save order."""
+    core = [(name, skills[name]['xp']) for name in CORE_SKILLS if name in skills and skills[name]['xp'] > 0]
+    custom = [(name, data['xp']) for name, data in skills.items()
+              if name not in CORE_SKILLS and data.get('xp', 0) > 0]
+    return tuple(core + custom)
+
+
+class SkillsChart(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(280, 220)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self._values = () # Target (name, xp) pairs
+        self._from_values = {} # Displayed values when the current animation started
+        self._progress = 1.0
+        self._cache_key = None
+        self._cache = None
+
+        self._animation = QVariantAnimation(self)
+        self._animation.setStartValue(0.0)
+        self._animation.setEndValue(1.0)
+        self._animation.setDuration(ANIMATION_MS)
+        self._animation.setEasingCurve(QEasingCurve.OutCubic)
+        self._animation.valueChanged.connect(self._on_animation_step)
+
+    def set_skills(self, skills):
+        values = skill_values(skills)
+        if values == self._values:
+            return # Nothing changed, nothing to repaint
+        self._from_values = dict(self._displayed_values())
+        self._values = values
+        if self.isVisible():
+            self._animation.stop()
+            self._animation.start()
+        else:
+            self._progress = 1.0 # No point animating off screen
+            self.update()
+
+    def _on_animation_step(self, value):
+        self._progress = value
+        self.update()
+
+    def _displayed_values(self):
+        """The values as currently drawn, part way between the old and new ones while animating."""
+        if self._progress >= 1.0:
+            return self._values
+        targets = dict(self._values)
+        names = [name for name, _ in self._values] + [n for n in self._from_values if n not in targets]
+        return tuple((name, self._from_values.get(name, 0) + (targets.get(name, 0) - self._from_values.get(name, 0)) * self._progress)
+                     for name in names)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self._progress < 1.0:
+            self._paint(painter, self._displayed_values())
+            return
+        ratio = self.devicePixelRatioF()
+        key = (self._values, self.width(), self.height(), ratio)
+        if key != self._cache_key:
+            self._cache = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+            self._cache.setDevicePixelRatio(ratio)
+            self._cache.fill(QColor(BACKGROUND))
+            cache_painter = QPainter(self._cache)
+            self._paint(cache_painter, self._values)
+            cache_painter.end()
+            self._cache_key = key
+        painter.drawPixmap(0, 0, self._cache)
+
+    def _paint(self, painter, values):
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), QColor(BACKGROUND))
+        total = sum(xp for _, xp in values)
+        if total <= 0:
+            painter.setPen(QColor(TEXT_COLOR))
+            painter.drawText(self.rect(), Qt.AlignCenter, "No XP in skills yet.")
+            return
+
+        # Donut on the left, legend on the right
+        margin = 10
+        side = max(40, min(self.height() - 2 * margin, int(self.width() * 0.55) - 2 * margin))
+        ring = side / 2 * RING_WIDTH
+        donut = QRectF(margin + ring / 2, (self.height() - side) / 2 + ring / 2, side - ring, side - ring)
+
+        pen = QPen()
+        pen.setWidthF(ring)
+        pen.setCapStyle(Qt.FlatCap)
+        angle = 90 * 16 # Start at the top and go counterclockwise, like the old pie
+        for name, xp in values:
+            span = round(360 * 16 * xp / total)
+            if span <= 0:
+                continue
+            pen.setColor(_skill_color(name))
+            painter.setPen(pen)
+            painter.drawArc(donut, angle, span)
+            angle += span
+
+        painter.setPen(QColor(TEXT_COLOR))
+        center_font = QFont("Segoe UI", max(10, int(side / 9)), QFont.Bold)
+        painter.setFont(center_font)
+        painter.drawText(donut, Qt.AlignCenter, f"{round(total)}") # Total XP in center
+
+        self._paint_legend(painter, values, total, margin + side + margin)
+
+    def _paint_legend(self, painter, values, total, left):
+        font = QFont("Segoe UI", 9)
+        painter.setFont(font)
+        metrics = QFontMetrics(font)
+        row_height = metrics.height() + 4
+        max_rows = max(1, (self.height() - 20) // row_height)
+        shown = values if len(values) <= max_rows else values[:max_rows - 1]
+        top = (self.height() - row_height * (len(shown) + (len(shown) < len(values)))) / 2
+        width = self.width() - left - 10
+        for row, (name, xp) in enumerate(shown):
+            y = top + row * row_height
+            painter.fillRect(QRectF(left, y + (row_height - 10) / 2, 10, 10), _skill_color(name))
+            painter.setPen(QColor(TEXT_COLOR))
+            text = metrics.elidedText(f"{name}: {round(xp)} ({xp / total * 100:.1f}%)", Qt.ElideRight, int(width - 16))
+            painter.drawText(QRectF(left + 16, y, width - 16, row_height), Qt.AlignVCenter | Qt.AlignLeft, text)
+        if len(shown) < len(values):
+            painter.drawText(QRectF(left + 16, top + len(shown) * row_height, width - 16, row_height),
+                             Qt.AlignVCenter | Qt.AlignLeft, f"+{len(values) - len(shown)} more")
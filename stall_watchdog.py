@@ -0,0 +1,140 @@
+# stall_watchdog.py
+"""
+Event-loop stall watchdog.
+
+A heartbeat QTimer on the GUI thread stamps the time on every tick, and a monitor
+thread checks that stamp. If the event loop goes longer than the stall threshold
+without a beat, the monitor grabs the GUI thread's Python stack with
+sys._current_frames(). It then logs the stack with the name of the GUI handler that
+is running (the outermost gui.py frame). A second entry with the total freeze time
+is written once the loop recovers. Heartbeat lateness is also tracked, so
+latency() reports how responsive the loop has been overall.
+
+Enable it with RPG_WATCHDOG=1 (or WATCHDOG_ENABLED in config.py); it is off by default
+because the heartbeat keeps waking an otherwise idle GUI thread. Tuned through
+WATCHDOG_* in config.py.
+"""
+import collections
+import datetime
+import os
+import sys
+import threading
+import time
+import traceback
+
+from PyQt5.QtCore import QObject, QTimer
+
+from config import WATCHDOG_ENABLED, WATCHDOG_HEARTBEAT_MS, WATCHDOG_STALL_MS, WATCHDOG_LOG
+
+ENV_VAR = 'RPG_WATCHDOG'
+HANDLER_FILE = 'gui.py'
+
+
+def _describe_frame(frame):
+    self_obj = frame.f_locals.get('self')
+    prefix = f"{type(self_obj).__name__}." if self_obj is not None else ''
+    return f"{prefix}{frame.f_code.co_name}"
+
+
+def find_handler(frame):
+    """Name of the slot Qt called into: the outermost gui.py frame, else the frame the event loop entered."""
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse() # Outermost first; frames[0] is the one sitting in app.exec_()
+    handler = next((f for f in frames if os.path.basename(f.f_code.co_filename) == HANDLER_FILE), None)
+    if handler is None and frames:
+        handler = frames[1] if len(frames) > 1 else frames[0]
+    return _describe_frame(handler) if handler is not None else None
+
+
+class EventLoopWatchdog(QObject):
+    def __init__(self, parent=None, heartbeat_ms=WATCHDOG_HEARTBEAT_MS, stall_ms=WATCHDOG_STALL_MS,
+                 log_path=WATCHDOG_LOG):
+        super().__init__(parent)
+        self.heartbeat_ms = heartbeat_ms
+        self.stall_seconds = stall_ms / 1000
+        self.log_path = log_path
+        self.gui_thread_id = threading.get_ident()
+        self.lateness_ms = collections.deque(maxlen=600) # Heartbeat delays over the last minute or so
+        self.stalls = [] # (handler, duration in ms) for every stall seen this session
+        self._last_beat = time.monotonic()
+        self._current_stall = None # Handler and start time of the stall in progress
+        self._lock = threading.Lock()
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._beat)
+        self._stop_event = threading.Event()
+        self._monitor = threading.Thread(target=self._monitor_loop, name='stall-watchdog', daemon=True)
+
+    def start(self):
+        self._last_beat = time.monotonic()
+        self.timer.start(self.heartbeat_ms)
+        self._monitor.start()
+
+    def stop(self):
+        self.timer.stop()
+        self._stop_event.set()
+
+    def _beat(self):
+        now = time.monotonic()
+        with self._lock:
+            late = (now - self._last_beat) * 1000 - self.heartbeat_ms
+            self._last_beat = now
+            stall = self._current_stall
+            self._current_stall = None
+        self.lateness_ms.append(max(0.0, late))
+        if stall is not None:
+            handler, started = stall
+            duration_ms = (now - started) * 1000
+            self.stalls.append((handler, round(duration_ms)))
+            self._log(f"Event loop recovered after ~{duration_ms:.0f} ms (handler: {handler or 'unknown'}).")
+
+    def _monitor_loop(self):
+        poll_seconds = min(self.stall_seconds / 4, self.heartbeat_ms / 1000)
+        while not self._stop_event.wait(poll_seconds):
+            with self._lock:
+                blocked_for = time.monotonic() - self._last_beat - self.heartbeat_ms / 1000
+                if blocked_for < self.stall_seconds or self._current_stall is not None:
+                    continue
+                frame = sys._current_frames().get(self.gui_thread_id)
+                handler = find_handler(frame) if frame is not None else None
+                # The loop has been stuck since the beat that should have followed the last one
+                self._current_stall = (handler, self._last_beat + self.heartbeat_ms / 1000)
+            stack = ''.join(traceback.format_stack(frame)) if frame is not None else '  <no Python frame>\n'
+            self._log(f"Event loop stalled for {blocked_for * 1000:.0f} ms in handler "
+                      f"{handler or 'unknown'}. GUI thread stack:\n{stack}")
+            del frame
+
+    def _log(self, message):
+        stamp = datetime.datetime.now().isoformat(timespec='milliseconds')
+        print(f"WARNING: {message.splitlines()[0]}")
+        try:
+            with open(self.log_path, 'a') as f:
+                f.write(f"[{stamp}] {message}\n")
+        except OSError as e:
+            print(f"WARNING: Could not write to stall log '{self.log_path}': {e}")
+
+    def latency(self):
+        """Heartbeat lateness stats in ms: how long events waited beyond the heartbeat interval."""
+        ordered = sorted(self.lateness_ms)
+        if not ordered:
+            return {'samples': 0, 'p50_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0, 'stalls': len(self.stalls)}
+        return {
+            'samples': len(ordered),
+            'p50_ms': round(ordered[len(ordered) // 2], 1),
+            'p99_ms': round(ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))], 1),
+            'max_ms': round(ordered[-1], 1),
+            'stalls': len(self.stalls),
+        }
+
+
+def start(parent=None):
+    """Starts the watchdog on the calling (GUI) thread if it's enabled. Returns it or None."""
+    enabled = os.environ.get(ENV_VAR, '1' if WATCHDOG_ENABLED else '0') not in ('', '0')
+    if not enabled:
+        return None
+    watchdog = EventLoopWatchdog(parent)
+    watchdog.start()
+    return watchdog
@@ -0,0 +1,221 @@
+# startup_profiler.py
+"""
+Opt-in cold start profiler.
+
+Enable it with the RPG_STARTUP_PROFILE=1 environment variable or the
+--profile-startup command line flag. It records per-module import times and
+named startup phases (save load, daily reset, GUI construction per tab, ...) plus
+milestone marks (welcome first paint, game ready), and writes a JSON report next to
+the script or, for the frozen PyInstaller build, next to the executable. The report is
+final once the game screen is ready; the game's first paint after Continue is added
+to it later, measured from the click since it depends on when the player clicks. Point RPG_STARTUP_BUDGET at a JSON file
+of {"phase or mark name": max_ms} to have over-budget entries flagged in the report.
+
+This module only uses the standard library so it can be imported before Qt.
+"""
+import builtins
+import contextlib
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+
+ENV_VAR = 'RPG_STARTUP_PROFILE'
+BUDGET_ENV_VAR = 'RPG_STARTUP_BUDGET'
+FLAG = '--profile-startup'
+REPORT_FILE = 'startup_report.json'
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.phases = [] # dicts with name, start_ms, duration_ms, depth (and thread, off the main thread)
+        self.marks = {} # name -> ms since origin, or since the given start
+        self.imports = [] # dicts with module, start_ms, duration_ms, depth
+        self._local = threading.local() # Phase nesting depth per thread; the save loads on the game executor
+        self._import_depth = 0
+        self._original_import = None
+
+    def _ms(self, timestamp):
+        return round((timestamp - self.origin) * 1000, 3)
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop_import_tracking(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Only first imports of absolute modules are interesting; everything else is a dict lookup
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        entry = {'module': name, 'depth': self._import_depth}
+        self.imports.append(entry)
+        self._import_depth += 1
+        started = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            self._import_depth -= 1
+            entry['start_ms'] = self._ms(started)
+            entry['duration_ms'] = round((time.perf_counter() - started) * 1000, 3)
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        depth = getattr(self._local, 'depth', 0)
+        entry = {'name': name, 'depth': depth}
+        if threading.current_thread() is not threading.main_thread():
+            entry['thread'] = threading.current_thread().name
+        self.phases.append(entry)
+        self._local.depth = depth + 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            entry['start_ms'] = self._ms(started)
+            entry['duration_ms'] = round((time.perf_counter() - started) * 1000, 3)
+
+    def mark(self, name, since=None):
+        if self.enabled and name not in self.marks:
+            now = time.perf_counter()
+            self.marks[name] = self._ms(now) if since is None else round((now - since) * 1000, 3)
+
+    def _load_budget(self):
+        budget_path = os.environ.get(BUDGET_ENV_VAR)
+        if not budget_path:
+            return {}
+        try:
+            with open(budget_path, 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"WARNING: Could not read startup budget '{budget_path}': {e}")
+            return {}
+
+    def build_report(self):
+        budget = self._load_budget()
+        over_budget = []
+        for phase in self.phases:
+            limit = budget.get(phase['name'])
+            if limit is not None and phase.get('duration_ms', 0) > limit:
+                over_budget.append({'name': phase['name'], 'actual_ms': phase['duration_ms'], 'budget_ms': limit})
+        for name, at_ms in self.marks.items():
+            limit = budget.get(name)
+            if limit is not None and at_ms > limit:
+                over_budget.append({'name': name, 'actual_ms': at_ms, 'budget_ms': limit})
+
+        top_level_imports = [i for i in self.imports if i['depth'] == 0 and 'duration_ms' in i]
+        return {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'frozen': bool(getattr(sys, 'frozen', False)),
+            'python': sys.version.split()[0],
+            'marks_ms': self.marks,
+            'phases': [p for p in self.phases if 'duration_ms' in p],
+            'imports_total_ms': round(sum(i['duration_ms'] for i in top_level_imports), 3),
+            'slowest_imports': sorted((i for i in self.imports if 'duration_ms' in i),
+                                      key=lambda i: -i['duration_ms'])[:30],
+            'imports': self.imports,
+            'over_budget': over_budget,
+        }
+
+    def report_path(self):
+        if getattr(sys, 'frozen', False):
+            base_dir = os.path.dirname(sys.executable)
+        else:
+            base_dir = os.path.dirname(os.path.abspath(sys.argv[0] or __file__))
+        return os.path.join(base_dir, REPORT_FILE)
+
+    def write_report(self, path=None):
+        if not self.enabled:
+            return None
+        path = path or self.report_path()
+        report = self.build_report()
+        try:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=4)
+        except OSError as e:
+            print(f"WARNING: Could not write startup report to '{path}': {e}")
+            return None
+        print(f"Startup report written to '{path}'.")
+        for phase in report['phases']:
+            thread = f" [{phase['thread']}]" if 'thread' in phase else ""
+            print(f"  {'  ' * phase['depth']}{phase['name']}{thread}: {phase['duration_ms']:.1f} ms")
+        for name, at_ms in report['marks_ms'].items():
+            print(f"  [{name}] at {at_ms:.1f} ms")
+        for entry in report['over_budget']:
+            print(f"  OVER BUDGET: {entry['name']} {entry['actual_ms']:.1f} ms > {entry['budget_ms']} ms")
+        return path
+
+
+_profiler = StartupProfiler()
+
+
+def enable_from_environment(argv):
+    """Turns profiling on if requested by flag or environment variable. Strips the flag from argv."""
+    requested = os.environ.get(ENV_VAR, '') not in ('', '0')
+    if FLAG in argv:
+        argv.remove(FLAG)
+        requested = True
+    if requested:
+        _profiler.enable()
+    return requested
+
+
+def is_enabled():
+    return _profiler.enabled
+
+
+def phase(name):
+    """Context manager that records a named startup phase. A no-op unless profiling is enabled."""
+    return _profiler.phase(name)
+
+
+def mark(name):
+    """Records the first time a named milestone (e.g. a first paint) is reached."""
+    _profiler.mark(name)
+
+
+def write_report(path=None):
+    return _profiler.write_report(path)
+
+
+def finish():
+    """Ends cold start profiling once the game is ready: stops timing imports and writes the report."""
+    if not _profiler.enabled:
+        return None
+    _profiler.stop_import_tracking()
+    return write_report()
+
+
+def watch_first_paint(widget, name, from_now=False):
+    """
+    Marks `name` when the widget first paints and rewrites the report. With from_now=True
+    the mark is measured from this call instead of from process start.
+    """
+    if not _profiler.enabled:
+        return
+    from PyQt5.QtCore import QObject, QEvent, QTimer
+    since = time.perf_counter() if from_now else None
+
+    class _FirstPaintFilter(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Paint:
+                watched.removeEventFilter(self)
+                _profiler.mark(name, since)
+                QTimer.singleShot(0, write_report) # Write once the paint has finished rather than from inside it
+            return False
+
+    paint_filter = _FirstPaintFilter(widget)
+    widget.installEventFilter(paint_filter)
@@ -0,0 +1,349 @@
+# sweep.py
+"""
+Parameter sweep runner for tuning the game's economy and progression.
+
+A sweep takes ranges over catalog parameters (shop costs, transcendence thresholds,
+punishment values, skill decay constants and the enchant cost), runs a seeded
+simulation of a player for every point of the resulting grid in parallel, and
+caches each point's results on disk. Cache keys are a hash of the point's
+parameters, the simulation settings and the game code, so re-running a sweep after
+changing one range only recomputes the points that are actually new.
+
+Usage:
+    python sweep.py sweep_spec.json --workers 4 --output sweep_results.json
+
+Example spec:
+    {
+        "simulation": {"days": 60, "seeds": [1, 2, 3]},
+        "parameters": {
+            "shop.Small XP Boost.cost": [20, 30, 40],
+            "transcend.0": {"start": 1000, "stop": 2000, "step": 250},
+            "punishment.Missed Workout.punishment": [3, 5],
+            "decay.growth": [1.25, 1.5],
+            "enchant.base_cost": [75, 100, 125]
+        }
+    }
+
+Parameter names:
+    shop.<item name>.<field>        -> GameManager.shop_items_data
+    transcend.<count>               -> GameManager.transcend_req_map
+    punishment.<name>.<field>       -> GameManager.punishments_data
+    decay.<grace_days|base|growth|max_growth_days> -> skill decay constants
+    enchant.base_cost               -> GameManager.enchant_base_cost
+"""
+import argparse
+import concurrent.futures
+import contextlib
+import datetime
+import hashlib
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from game_manager import GameManager
+
+DEFAULT_CACHE_DIR = 'sweep_cache'
+DEFAULT_DAYS = 30
+DEFAULT_SEEDS = [1, 2, 3]
+
+# Source files whose contents decide the simulation outcome. Any edit to them
+# invalidates the whole cache.
+CODE_FILES = ['game_manager.py', 'player.py', 'config.py', 'sweep.py']
+
+DECAY_ATTRIBUTES = {
+    'grace_days': 'skill_decay_grace_days',
+    'base': 'skill_decay_base',
+    'growth': 'skill_decay_growth',
+    'max_growth_days': 'skill_decay_max_growth_days',
+}
+
+
+def get_code_version():
+    """Returns a short hash of the game code that the simulation depends on."""
+    digest = hashlib.sha256()
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    for file_name in CODE_FILES:
+        with open(os.path.join(base_dir, file_name), 'rb') as f:
+            digest.update(file_name.encode('utf-8'))
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def expand_values(spec):
+    """Turns a parameter range spec (list, scalar or start/stop/step dict) into a list of values."""
+    if isinstance(spec, list):
+        return spec
+    if isinstance(spec, dict):
+        start, stop, step = spec['start'], spec['stop'], spec.get('step', 1)
+        if step <= 0:
+            raise ValueError(f"Range step must be positive, got {step}.")
+        values = []
+        count = 0
+        value = start
+        while value <= stop + 1e-9:
+            values.append(value)
+            count += 1
+            value = start + count * step
+        if all(isinstance(v, int) for v in (start, stop, step)):
+            values = [int(v) for v in values]
+        return values
+    return [spec]
+
+
+def build_grid(parameters):
+    """Returns every combination of the given parameter ranges as a list of dicts."""
+    names = sorted(parameters)
+    value_lists = [expand_values(parameters[name]) for name in names]
+    return [dict(zip(names, combo)) for combo in itertools.product(*value_lists)]
+
+
+def apply_parameters(game_manager, params):
+    """Overrides catalog and tuning values on a GameManager instance."""
+    for name, value in params.items():
+        section, _, rest = name.partition('.')
+        if section == 'shop':
+            item_name, _, field = rest.rpartition('.')
+            item = next((i for i in game_manager.shop_items_data if i['name'] == item_name), None)
+            if item is None:
+                raise KeyError(f"Unknown shop item '{item_name}' in parameter '{name}'.")
+            item[field] = value
+        elif section == 'transcend':
+            game_manager.transcend_req_map[int(rest)] = value
+        elif section == 'punishment':
+            punishment_name, _, field = rest.rpartition('.')
+            punishment = next((p for p in game_manager.punishments_data if p['name'] == punishment_name), None)
+            if punishment is None:
+                raise KeyError(f"Unknown punishment '{punishment_name}' in parameter '{name}'.")
+            punishment[field] = value
+        elif section == 'decay':
+            if rest not in DECAY_ATTRIBUTES:
+                raise KeyError(f"Unknown decay constant '{rest}' in parameter '{name}'.")
+            setattr(game_manager, DECAY_ATTRIBUTES[rest], value)
+        elif section == 'enchant' and rest == 'base_cost':
+            game_manager.enchant_base_cost = value
+        else:
+            raise KeyError(f"Unknown sweep parameter '{name}'.")
+
+
+def _advance_day(game_manager):
+    """Moves the simulated calendar forward by one day and runs the daily reset."""
+    player = game_manager.player
+    yesterday = datetime.date.today() - datetime.timedelta(days=1)
+    player.last_daily_reset_date = yesterday.isoformat()
+    # Age every skill by a day instead of waiting for the real clock
+    for skill_data in player.skills.values():
+        last_updated = datetime.date.fromisoformat(skill_data['last_updated'])
+        skill_data['last_updated'] = (last_updated - datetime.timedelta(days=1)).isoformat()
+    # Timed buffs are measured in real minutes, so they expire at the end of a simulated day
+    player.transcendence_buff_end_time = None
+    game_manager._check_and_reset_daily_tasks()
+
+
+def _simulate_day(game_manager, stats):
+    """Plays one day with a simple, seeded player policy."""
+    player = game_manager.player
+    end_of_day = datetime.datetime.now().replace(hour=23, minute=59, second=59).isoformat()
+
+    # Quests: one main quest and a couple of side quests, all completed the same day
+    category = random.choice(["Faith Goal", "Intellect Conditioning"])
+    details = {'due_date': end_of_day, 'steps': ''}
+    if category == "Intellect Conditioning":
+        sub_category = random.choice(list(game_manager.intellect_conditioning_activities))
+        details['activity'] = random.choice(game_manager.intellect_conditioning_activities[sub_category])
+    game_manager.generate_quest(category, details=details)
+    for _ in range(2):
+        game_manager.generate_side_quest()
+    for quest in list(player.quests):
+        game_manager.complete_quest(quest['name'])
+        stats['quests_completed'] += 1
+
+    # Daily tasks: a random share of the checklist
+    tasks_done = random.randint(3, len(game_manager.daily_task_templates))
+    for task_name in random.sample(game_manager.daily_task_templates, tasks_done):
+        game_manager.complete_daily_task(task_name, True)
+
+    # Bad habits
+    if random.random() < 0.2:
+        punishment = random.choice(game_manager.punishments_data)
+        game_manager.apply_punishment(punishment['name'])
+        stats['punishments_applied'] += 1
+        if game_manager.player is not player:
+            stats['resets'] += 1
+            player = game_manager.player
+
+    # Shopping: buy one affordable item, keeping a small reserve
+    affordable = [item for item in game_manager.shop_items_data if item['cost'] <= player.coins - 10]
+    if affordable and random.random() < 0.5:
+        item = random.choice(affordable)
+        success, _ = game_manager.purchase_cart({item['name']: 1})
+        if success:
+            stats['items_bought'] += 1
+            stats['coins_spent'] += item['cost']
+
+    # Forge: enchant the first piece of gear when it's comfortably affordable
+    gear_items = player.inventory + [item for item in player.gear.values() if item]
+    if gear_items:
+        item = gear_items[0]
+        cost = game_manager.get_enchant_cost(item.get('enchant_level', 0))
+        if player.coins >= cost * 2:
+            game_manager.enchant_gear(item['name'])
+            stats['enchants'] += 1
+            stats['coins_spent'] += cost
+
+    if player.xp >= game_manager.get_transcend_requirement():
+        game_manager.transcend()
+        stats['transcendences'] += 1
+        if stats['first_transcend_day'] is None:
+            stats['first_transcend_day'] = stats['day']
+
+
+def simulate(params, days=DEFAULT_DAYS, seed=0):
+    """Runs one seeded simulation with the given parameters and returns its metrics."""
+    random.seed(seed)
+    with tempfile.TemporaryDirectory() as temp_dir, open(os.devnull, 'w') as devnull, \
+            contextlib.redirect_stdout(devnull):
+        game_manager = GameManager(force_new_game=True, save_file=os.path.join(temp_dir, 'save_game.json'))
+        apply_parameters(game_manager, params)
+        stats = {'day': 0, 'quests_completed': 0, 'punishments_applied': 0, 'resets': 0,
+                 'items_bought': 0, 'coins_spent': 0, 'enchants': 0, 'transcendences': 0,
+                 'first_transcend_day': None}
+        for day in range(days):
+            stats['day'] = day + 1
+            _simulate_day(game_manager, stats)
+            _advance_day(game_manager)
+
+        player = game_manager.player
+        max_enchant = max([item.get('enchant_level', 0) for item in player.inventory + list(player.gear.values()) if item] or [0])
+        stats.update({
+            'final_xp': player.xp,
+            'final_coins': player.coins,
+            'transcendence_count': player.transcendence_count,
+            'total_skill_xp': sum(data['xp'] for data in player.skills.values()),
+            'achievements': len(player.achievements),
+            'max_enchant_level': max_enchant,
+            'corruption': player.corruption,
+        })
+        del stats['day']
+        return stats
+
+
+def _average_runs(runs):
+    """Averages numeric metrics over seeds. Metrics that are None in some runs average the rest."""
+    averaged = {}
+    for key in runs[0]:
+        values = [run[key] for run in runs if run[key] is not None]
+        averaged[key] = round(sum(values) / len(values), 3) if values else None
+    return averaged
+
+
+def run_point(params, days, seeds):
+    """Simulates one grid point for every seed. Runs inside a worker process."""
+    started = time.perf_counter()
+    runs = [simulate(params, days=days, seed=seed) for seed in seeds]
+    return {
+        'params': params,
+        'metrics': _average_runs(runs),
+        'runs': runs,
+        'elapsed_seconds': round(time.perf_counter() - started, 3),
+    }
+
+
+class SweepCache:
+    """On-disk cache of grid point results keyed by parameters, settings and code version."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, code_version=None):
+        self.cache_dir = cache_dir
+        self.code_version = code_version or get_code_version()
+
+    def key(self, params, days, seeds):
+        payload = json.dumps({'params': params, 'days': days, 'seeds': list(seeds),
+                              'code_version': self.code_version}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return None # A corrupt entry is simply recomputed
+
+    def put(self, key, result):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(result, f, indent=4)
+        os.replace(temp_path, path) # Atomic, so an interrupted sweep never leaves half a file
+
+
+def run_sweep(parameters, days=DEFAULT_DAYS, seeds=None, workers=None, cache_dir=DEFAULT_CACHE_DIR, use_cache=True):
+    """Runs the sweep and returns (results, number of points computed, number served from cache)."""
+    seeds = list(seeds if seeds is not None else DEFAULT_SEEDS)
+    cache = SweepCache(cache_dir)
+    grid = build_grid(parameters)
+
+    results = [None] * len(grid)
+    pending = {}
+    for index, params in enumerate(grid):
+        key = cache.key(params, days, seeds)
+        cached = cache.get(key) if use_cache else None
+        if cached is not None:
+            results[index] = cached
+        else:
+            pending[index] = key
+
+    if pending:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run_point, grid[index], days, seeds): index for index in pending}
+            for done_count, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                index = futures[future]
+                result = future.result()
+                cache.put(pending[index], result)
+                results[index] = result
+                print(f"[{done_count}/{len(pending)}] {grid[index]} ({result['elapsed_seconds']}s)")
+
+    return results, len(pending), len(grid) - len(pending)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a cached parameter sweep over the game's tuning values.")
+    parser.add_argument('spec', help="JSON file describing the parameter ranges and simulation settings.")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument('--days', type=int, default=None, help="Simulated days per run (overrides the spec).")
+    parser.add_argument('--seeds', type=int, nargs='+', default=None, help="Random seeds (overrides the spec).")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Directory for cached point results.")
+    parser.add_argument('--no-cache', action='store_true', help="Recompute every point.")
+    parser.add_argument('--output', default='sweep_results.json', help="Where to write the combined results.")
+    args = parser.parse_args(argv)
+
+    with open(args.spec, 'r') as f:
+        spec = json.load(f)
+    simulation = spec.get('simulation', {})
+    days = args.days if args.days is not None else simulation.get('days', DEFAULT_DAYS)
+    seeds = args.seeds if args.seeds is not None else simulation.get('seeds', DEFAULT_SEEDS)
+
+    started = time.perf_counter()
+    results, computed, cached = run_sweep(spec.get('parameters', {}), days=days, seeds=seeds,
+                                          workers=args.workers, cache_dir=args.cache_dir,
+                                          use_cache=not args.no_cache)
+
+    with open(args.output, 'w') as f:
+        json.dump({'code_version': get_code_version(), 'days': days, 'seeds': seeds, 'results': results}, f, indent=4)
+
+    print(f"Sweep finished in {time.perf_counter() - started:.1f}s: {len(results)} points "
+          f"({computed} computed, {cached} from cache). Results written to '{args.output}'.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,165 @@
+# tracing.py
+"""
+Span tracing for GameGUI handlers and GameManager calls.
+
+Once installed, every GameGUI and GameManager method call becomes a span with a
+start timestamp, duration and thread id, so a slow click shows up as a nested
+chain like complete_quest -> add_xp -> save_game on the game executor's thread,
+next to the _complete_selected_quest span on the GUI thread that queued it.
+Finished spans go into a fixed-size ring buffer, which keeps the cost low enough
+to leave tracing on all session. When a user reports lag, press Ctrl+Shift+T (or
+call dump()) to write the buffer as Chrome trace-event JSON, which can be opened
+in chrome://tracing or https://ui.perfetto.dev.
+
+Method spans keep a reference to the call's arguments and only format them (short
+reprs) when the buffer is exported, so recording a call costs no string work.
+Mutable arguments show their state at export time.
+
+Enable it with RPG_TRACE=1.
+"""
+import collections
+import datetime
+import functools
+import inspect
+import json
+import os
+import reprlib
+import threading
+import time
+
+from config import TRACE_BUFFER_SIZE, TRACE_DIR
+
+ENV_VAR = 'RPG_TRACE'
+
+_arg_repr = reprlib.Repr()
+_arg_repr.maxstring = 80
+_arg_repr.maxother = 80
+
+
+def _format_args(args, kwargs):
+    formatted = {f"arg{i}": _arg_repr.repr(value) for i, value in enumerate(args[1:], 1)} # args[0] is self
+    formatted.update((key, _arg_repr.repr(value)) for key, value in kwargs.items())
+    return formatted
+
+
+class Tracer:
+    def __init__(self, capacity=TRACE_BUFFER_SIZE):
+        self.enabled = False
+        # (name, category, start_ns, duration_ns, thread id, (args, kwargs) of a method call or None)
+        self.spans = collections.deque(maxlen=capacity)
+        self.thread_names = {}
+        self._originals = {}
+
+    def record(self, name, category, start_ns, duration_ns, call_args=None):
+        tid = threading.get_ident()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+        self.spans.append((name, category, start_ns, duration_ns, tid, call_args))
+
+    def span(self, name, category='app'):
+        """Context manager recording a span around a block."""
+        return _Span(self, name, category)
+
+    def _wrap(self, func, name, category):
+        tracer = self
+        code = func.__code__
+        # Qt passes extra signal arguments (e.g. clicked's `checked`) that the slot may not accept
+        max_args = None if code.co_flags & inspect.CO_VARARGS else code.co_argcount
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if max_args is not None and len(args) > max_args:
+                args = args[:max_args]
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                # The arguments are formatted at export, not here
+                tracer.record(name, category, started, time.perf_counter_ns() - started, (args, kwargs))
+        return wrapper
+
+    def install(self, cls, category):
+        """Wraps every non-dunder method defined on cls."""
+        for name, func in list(vars(cls).items()):
+            if not inspect.isfunction(func) or name.startswith('__') or (cls, name) in self._originals:
+                continue
+            self._originals[(cls, name)] = func
+            setattr(cls, name, self._wrap(func, f"{cls.__name__}.{name}", category))
+
+    def uninstall(self):
+        for (cls, name), func in self._originals.items():
+            setattr(cls, name, func)
+        self._originals.clear()
+
+    def to_chrome_trace(self):
+        pid = os.getpid()
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                  for tid, name in self.thread_names.items()]
+        for name, category, start_ns, duration_ns, tid, call_args in list(self.spans):
+            event = {'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': tid,
+                     'ts': start_ns / 1000, 'dur': duration_ns / 1000}
+            if call_args and (len(call_args[0]) > 1 or call_args[1]):
+                event['args'] = _format_args(*call_args)
+            events.append(event)
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def dump(self, path=None):
+        """Writes the buffered spans as Chrome trace JSON and returns the file path."""
+        if path is None:
+            os.makedirs(TRACE_DIR, exist_ok=True)
+            stamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+            path = os.path.join(TRACE_DIR, f"trace_{stamp}.json")
+        with open(path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f)
+        print(f"INFO: Wrote {len(self.spans)} spans to '{path}'.")
+        return path
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'category', 'started')
+
+    def __init__(self, tracer, name, category):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.record(self.name, self.category, self.started, time.perf_counter_ns() - self.started)
+        return False
+
+
+tracer = Tracer()
+
+
+def enable():
+    """Instruments GameManager and GameGUI. Must run before GameGUI connects its slots."""
+    from game_manager import GameManager
+    from gui import GameGUI
+    tracer.install(GameManager, 'game_manager')
+    tracer.install(GameGUI, 'gui')
+    tracer.enabled = True
+
+
+def enable_from_environment():
+    if os.environ.get(ENV_VAR, '') in ('', '0'):
+        return False
+    enable()
+    return True
+
+
+def is_enabled():
+    return tracer.enabled
+
+
+def span(name, category='app'):
+    return tracer.span(name, category)
+
+
+def dump(path=None):
+    return tracer.dump(path)